@@ -0,0 +1,46 @@
+import random
+import time
+
+from ssadagu_search import LXML_AVAILABLE, parse_product_list
+
+# ajax.infinity_shop_list.php 응답의 data 배열과 같은 형태의 HTML 조각
+FRAGMENT_TEMPLATE = (
+    '<li class="product_item" data-gs-id="{gs_id}" data-title="{title}" data-img-url="//cbu01.alicdn.com/img/{gs_id}.jpg">'
+    '<div class="product_image"><a href="/shop/view.php?platform=1688&amp;num_iid={gs_id}&amp;ss_tx=%EB%AC%BC%ED%8B%B0%EC%8A%88">'
+    '<img src="//cbu01.alicdn.com/img/{gs_id}.jpg" alt=""></a></div>'
+    '<div class="product_info"><p class="product_title"><a href="/shop/view.php?num_iid={gs_id}">{title}</a></p>'
+    '<p class="product_price">{price:,}원</p>'
+    '<ul class="product_badge"><li>무료배송</li><li>평점 {rating}</li></ul></div></li>'
+)
+
+
+def make_fragments(count):
+    fragments = []
+    for i in range(count):
+        fragments.append(FRAGMENT_TEMPLATE.format(
+            gs_id=800000000000 + i,
+            title=f"물티슈 대용량 {i}팩 &amp; 캡형",
+            price=random.randint(1000, 99999),
+            rating=random.randint(1, 5),
+        ))
+    return fragments
+
+
+def bench(func, fragments, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func(fragments)
+    return (time.perf_counter() - start) / repeat, result
+
+
+if __name__ == "__main__":
+    if not LXML_AVAILABLE:
+        print("lxml이 설치되어 있지 않아 빠른 경로를 측정할 수 없습니다. pip install lxml")
+    else:
+        for count in (50, 200, 1000):
+            fragments = make_fragments(count)
+            slow_time, slow_result = bench(lambda f: parse_product_list(f, fast=False), fragments, 3)
+            fast_time, fast_result = bench(parse_product_list, fragments, 3)
+            assert fast_result == slow_result, "빠른 경로와 BeautifulSoup 결과가 다릅니다."
+            print(f"조각 {count:5d}개 | BeautifulSoup {slow_time * 1000:8.1f}ms | "
+                  f"lxml 일괄 {fast_time * 1000:7.1f}ms | {slow_time / fast_time:5.1f}배")
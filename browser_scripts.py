@@ -0,0 +1,181 @@
+from product_extractor import PRICE_SELECTORS, TITLE_SELECTORS, assemble_product_fields
+
+# 페이지 안에서 실행해 WebDriver 왕복 한 번으로 결과를 받아오는 스크립트들
+
+# arguments: [CSS 셀렉터, 상품 링크만 남길지 여부]
+# 셀렉터와 맞는 요소가 없으면 null, 있으면 view.php 링크를 문서 순서대로 중복 없이 반환
+HARVEST_LINKS_SCRIPT = """
+var elements = document.querySelectorAll(arguments[0]);
+if (!elements.length) return null;
+var productOnly = arguments[1], seen = {}, links = [];
+for (var i = 0; i < elements.length; i++) {
+    var href = elements[i].href || elements[i].getAttribute('href');
+    if (!href || href.indexOf('view.php') === -1 || seen[href]) continue;
+    if (productOnly && href.indexOf('platform=1688') === -1 && href.indexOf('num_iid') === -1) continue;
+    seen[href] = true;
+    links.push(href);
+}
+return links;
+"""
+
+
+def harvest_links(driver, selector="a[href*='view.php']", product_only=True):
+    """
+    selector 요소들의 view.php 링크(절대 URL)를 한 번의 execute_script 로 수집
+
+    Args:
+        driver (WebDriver): 검색 페이지를 연 드라이버.
+        selector (str, optional): 링크를 찾을 CSS 셀렉터. Defaults to "a[href*='view.php']".
+        product_only (bool, optional): platform=1688 또는 num_iid 가 있는 링크만 남길지 여부.
+
+    Returns:
+        list: 중복을 제거한 링크 (문서 순서) 또는 selector 와 맞는 요소가 없으면 None.
+    """
+    return driver.execute_script(HARVEST_LINKS_SCRIPT, selector, product_only)
+
+
+# arguments: [제목 후보 셀렉터 목록, 가격 후보 셀렉터 목록]
+# BeautifulSoup 추출 함수와 같은 규칙으로 살아 있는 DOM 에서 원재료를 모아 반환
+# (get_text 처럼 script/style/template 안의 텍스트는 빼고, strip 이면 조각마다 공백 제거 후 이어붙임)
+PRODUCT_FIELDS_SCRIPT = """
+var titleSelectors = arguments[0], priceSelectors = arguments[1];
+var HIDDEN = {SCRIPT: 1, STYLE: 1, TEMPLATE: 1};
+
+function textOf(element, strip) {
+    var parts = [];
+    function walk(node) {
+        for (var child = node.firstChild; child; child = child.nextSibling) {
+            if (child.nodeType === 3 || child.nodeType === 4) {
+                var text = strip ? child.nodeValue.trim() : child.nodeValue;
+                if (text) parts.push(text);
+            } else if (child.nodeType === 1 && !HIDDEN[child.tagName]) {
+                walk(child);
+            }
+        }
+    }
+    if (HIDDEN[element.tagName]) {
+        return strip ? element.textContent.trim() : element.textContent;
+    }
+    walk(element);
+    return parts.join('');
+}
+
+function classMatches(element, test) {
+    var value = element.getAttribute('class');
+    if (value === null) return false;
+    var tokens = value.split(/\\s+/).filter(function (t) { return t; });
+    tokens.push(value);
+    for (var i = 0; i < tokens.length; i++) {
+        if (test(tokens[i])) return true;
+    }
+    return false;
+}
+
+function first(tag, test) {
+    var elements = document.getElementsByTagName(tag);
+    for (var i = 0; i < elements.length; i++) {
+        if (test(elements[i])) return elements[i];
+    }
+    return null;
+}
+
+var texts = {};
+for (var i = 0; i < titleSelectors.length; i++) {
+    var selector = titleSelectors[i], element;
+    if (i === titleSelectors.length - 1) {
+        element = first('div', function (e) { return classMatches(e, function (c) { return /title|name/.test(c); }); });
+    } else {
+        element = document.querySelector(selector);
+    }
+    texts[selector] = element ? textOf(element, true) : null;
+}
+for (var j = 0; j < priceSelectors.length; j++) {
+    var priceElement = document.querySelector(priceSelectors[j]);
+    texts[priceSelectors[j]] = priceElement ? textOf(priceElement, true) : null;
+}
+
+var rating = 0;
+var container = first('a', function (e) { return classMatches(e, function (c) { return c === 'start'; }); })
+    || first('div', function (e) { return classMatches(e, function (c) { return /star|rating/.test(c); }); })
+    || first('a', function (e) { return e.getAttribute('href') === '#reviews_wrap'; });
+if (container) {
+    var stars = container.getElementsByTagName('img');
+    for (var k = 0; k < stars.length; k++) {
+        var src = stars[k].getAttribute('src') || '';
+        if (src.indexOf('icon_star.svg') !== -1) rating += 1;
+        else if (src.indexOf('icon_star_half.svg') !== -1) rating += 0.5;
+    }
+}
+
+var options = [];
+var skubox = first('ul', function (e) { return e.getAttribute('id') === 'skubox'; });
+if (skubox) {
+    var items = skubox.getElementsByTagName('li');
+    for (var m = 0; m < items.length; m++) {
+        var item = items[m];
+        if (!classMatches(item, function (c) { return /imgWrapper/.test(c); })) continue;
+        var titled = item.querySelector('a[title]');
+        var image = null;
+        var imgs = item.getElementsByTagName('img');
+        for (var n = 0; n < imgs.length; n++) {
+            if (classMatches(imgs[n], function (c) { return c === 'colorSpec_hashPic'; })) { image = imgs[n]; break; }
+        }
+        options.push([
+            titled ? titled.getAttribute('title') : null,
+            textOf(item, false),
+            image ? image.getAttribute('src') : null
+        ]);
+    }
+}
+
+var info = [];
+var infoItems = document.getElementsByTagName('div');
+for (var p = 0; p < infoItems.length; p++) {
+    var infoItem = infoItems[p];
+    if (!classMatches(infoItem, function (c) { return c === 'pro-info-item'; })) continue;
+    var infoTitle = null, infoValue = null;
+    var inner = infoItem.getElementsByTagName('div');
+    for (var q = 0; q < inner.length; q++) {
+        if (!infoTitle && classMatches(inner[q], function (c) { return c === 'pro-info-title'; })) infoTitle = inner[q];
+        if (!infoValue && classMatches(inner[q], function (c) { return c === 'pro-info-info'; })) infoValue = inner[q];
+    }
+    if (infoTitle && infoValue) info.push([textOf(infoTitle, true), textOf(infoValue, true)]);
+}
+
+var images = [];
+var imageElements = document.getElementsByTagName('img');
+for (var r = 0; r < imageElements.length; r++) {
+    var id = imageElements[r].getAttribute('id');
+    if (id !== null && /img_translate_\\d+/.test(id)) images.push(imageElements[r].getAttribute('src') || '');
+}
+
+return {texts: texts, rating: rating, options: options, info: info, images: images};
+"""
+
+
+def extract_fields_in_browser(driver, base_url="https://ssadagu.kr", selectors=None, kakaotitle_only=False):
+    """
+    driver 가 연 상품 페이지에서 스크립트 한 번으로 extract_product_fields 와 같은 필드를 추출
+
+    page_source 직렬화와 Python 쪽 재파싱 없이, 브라우저가 이미 만든 DOM 을 그대로 읽습니다.
+
+    Args:
+        driver (WebDriver): 상품 페이지를 연 드라이버.
+        base_url (str, optional): '/'로 시작하는 이미지 주소에 붙일 사이트 주소.
+        selectors (SelectorRegistry, optional): 제목/가격 셀렉터 적중 통계를 기록할 레지스트리.
+        kakaotitle_only (bool, optional): True면 제목은 h1#kakaotitle 만 봄 (assemble_product_fields 참고).
+
+    Returns:
+        dict: {'kakaotitle', 'title', 'price', 'rating', 'options', 'material_info', 'product_images'}
+    """
+    raw = driver.execute_script(PRODUCT_FIELDS_SCRIPT, list(TITLE_SELECTORS), list(PRICE_SELECTORS))
+    return assemble_product_fields(
+        raw['texts'],
+        float(raw['rating']),
+        [tuple(option) for option in raw['options']],
+        [tuple(pair) for pair in raw['info']],
+        raw['images'],
+        base_url,
+        selectors,
+        kakaotitle_only,
+    )
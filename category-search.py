@@ -1,14 +1,10 @@
-import requests
+import argparse
 import json
+import os
 import time
 
-# 요청 URL 및 Headers
-url = "https://datalab.naver.com/shoppingInsight/getCategory.naver"
-headers = {
-    "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
-    "Referer": "https://datalab.naver.com/shoppingInsight/sCategory.naver",
-    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36"
-}
+from category_index import CategoryIndex
+from category_tree import CategoryTreeCrawler
 
 # 최상위(1depth) 카테고리 목록
 top_level_categories = {
@@ -26,68 +22,67 @@ top_level_categories = {
     "도서": "50005542"
 }
 
-# 모든 카테고리를 저장할 리스트
-all_categories = []
-
-
-def get_subcategories(parent_cid, parent_name, depth):
-    """
-    특정 카테고리 ID를 받아 하위 카테고리를 재귀적으로 탐색하는 함수
-    :param parent_cid: 부모 카테고리 ID
-    :param parent_name: 부모 카테고리 이름
-    :param depth: 현재 카테고리의 깊이 (출력 시 들여쓰기용)
-    """
-    # 서버에 부담을 주지 않기 위해 잠시 대기
-    time.sleep(0.3)
-
-    # Payload 설정
-    payload = {"cid": parent_cid}
-
-    # POST 요청
-    response = requests.post(url, headers=headers, data=payload)
-
-    if response.status_code != 200:
-        print(f"Error: {response.status_code} - {parent_name}({parent_cid})")
-        return
-
-    try:
-        subcategories = response.json()
+# 동시에 요청할 최대 스레드 수 (실제 동시 요청 수는 응답 상태/지연에 맞춰 자동 조절)
+MAX_WORKERS = 8
 
-        # 하위 카테고리가 없으면 함수 종료
-        if not subcategories:
-            return
+SNAPSHOT_FILE = 'naver_shopping_categories.json'
+DELTA_FILE = 'naver_shopping_categories_delta.json'
+INDEX_FILE = 'naver_shopping_categories.idx'
 
-        for sub_cat in subcategories:
-            cat_name = sub_cat['name']
-            cat_id = sub_cat['cid']
-
-            # 카테고리 정보 저장 및 출력
-            indent = "  " * depth
-            print(f"{indent}- {cat_name} ({cat_id})")
-            all_categories.append({'name': cat_name, 'cid': cat_id, 'depth': depth + 1})
-
-            # 하위 카테고리가 더 있다면 재귀 호출
-            if sub_cat['hasChild']:
-                get_subcategories(cat_id, cat_name, depth + 1)
-
-    except json.JSONDecodeError:
-        print(f"JSON Decode Error for {parent_name}({parent_cid})")
+parser = argparse.ArgumentParser(description="네이버 쇼핑 카테고리 트리 크롤러")
+parser.add_argument('--sync', action='store_true',
+                    help=f"{SNAPSHOT_FILE}과 비교해 바뀐 하위 트리만 다시 탐색")
+parser.add_argument('--check-depth', type=int, default=2,
+                    help="--sync 시 항상 하위 목록을 확인할 최대 깊이 (기본값: 2)")
+parser.add_argument('--workers', type=int, default=MAX_WORKERS)
+parser.add_argument('--rate', type=float, default=None,
+                    help="초당 최대 요청 수 상한 (기본값: 없음, 동시 요청 수만 자동 조절)")
+args = parser.parse_args()
 
 
 # --- 실행 부분 ---
-print("네이버 쇼핑 전체 카테고리 목록 크롤링 시작")
-
-# 최상위 카테고리부터 탐색 시작
-for name, cid in top_level_categories.items():
-    print(f"\n[{name}] ({cid})")
-    all_categories.append({'name': name, 'cid': cid, 'depth': 1})
-    get_subcategories(cid, name, depth=1)
-
-print("\n\n--- 크롤링 완료 ---")
-print(f"총 {len(all_categories)}개의 카테고리를 찾았습니다.")
-
-# 찾은 카테고리 목록을 JSON 파일로 저장 (선택 사항)
-with open('naver_shopping_categories.json', 'w', encoding='utf-8') as f:
+crawler = CategoryTreeCrawler(max_workers=args.workers, rate=args.rate)
+
+if args.sync and os.path.exists(SNAPSHOT_FILE):
+    print("네이버 쇼핑 카테고리 증분 동기화 시작")
+    with open(SNAPSHOT_FILE, 'r', encoding='utf-8') as f:
+        previous_categories = json.load(f)
+
+    all_categories, delta = crawler.sync(previous_categories, top_level_categories,
+                                         check_depth=args.check_depth)
+
+    print("\n\n--- 동기화 완료 ---")
+    print(f"추가 {len(delta['added'])}개, 삭제 {len(delta['removed'])}개, 변경 {len(delta['changed'])}개 "
+          f"(요청 {crawler.request_count}회)")
+
+    with open(DELTA_FILE, 'w', encoding='utf-8') as f:
+        json.dump(dict(delta, synced_at=time.strftime('%Y-%m-%d %H:%M:%S')), f, ensure_ascii=False, indent=2)
+    print(f"{DELTA_FILE} 파일로 변경 내역이 저장되었습니다.")
+else:
+    if args.sync:
+        print(f"{SNAPSHOT_FILE} 파일이 없어 전체 크롤링을 진행합니다.")
+    print("네이버 쇼핑 전체 카테고리 목록 크롤링 시작")
+
+    # 최상위 카테고리부터 너비 우선으로 병렬 탐색
+    all_categories, _ = crawler.crawl(top_level_categories)
+
+    for category in all_categories:
+        if category['depth'] == 1:
+            print(f"\n[{category['name']}] ({category['cid']})")
+        else:
+            indent = "  " * (category['depth'] - 1)
+            print(f"{indent}- {category['name']} ({category['cid']})")
+
+    print("\n\n--- 크롤링 완료 ---")
+    print(f"총 {len(all_categories)}개의 카테고리를 찾았습니다. (요청 {crawler.request_count}회)")
+
+# 찾은 카테고리 목록을 JSON 파일로 저장 (다음 --sync 의 스냅샷으로 사용)
+with open(SNAPSHOT_FILE, 'w', encoding='utf-8') as f:
     json.dump(all_categories, f, ensure_ascii=False, indent=2)
 
-print("naver_shopping_categories.json 파일로 저장되었습니다.")
\ No newline at end of file
+print(f"{SNAPSHOT_FILE} 파일로 저장되었습니다.")
+crawler.limiters.report()
+
+# cid 조회/경로/리프 질의용 바이너리 인덱스 (CategoryIndex.load 로 바로 사용)
+CategoryIndex.from_categories(all_categories).save(INDEX_FILE)
+print(f"{INDEX_FILE} 인덱스 파일로 저장되었습니다.")
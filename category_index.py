@@ -0,0 +1,214 @@
+import json
+import struct
+from array import array
+
+# 바이너리 인덱스 파일 헤더: 매직, 버전, 노드 수
+MAGIC = b'NCIX'
+VERSION = 1
+_HEADER = struct.Struct('<4sII')
+_BLOB_LEN = struct.Struct('<I')
+
+
+class CategoryIndex:
+    """
+    category-search.py 출력(깊이 우선 순서의 평평한 카테고리 리스트)에 대한 조회용 인덱스
+
+    노드는 리스트 순서대로 0..n-1 번호를 가지며, 부모 번호/깊이/하위 트리 끝 번호를
+    array 에 연속으로 저장합니다. 깊이 우선 순서이므로 노드 i의 하위 트리는
+    [i, subtree_end[i]) 구간이고, 리프 목록도 같은 방식으로 구간 조회합니다.
+    """
+
+    def __init__(self, cids, names, parents, depths, subtree_end, leaf_positions, leaves_before):
+        self.cids = cids
+        self.names = names
+        self.parents = parents
+        self.depths = depths
+        self.subtree_end = subtree_end
+        self.leaf_positions = leaf_positions
+        self.leaves_before = leaves_before
+        self.position = {cid: i for i, cid in enumerate(cids)}
+        self.name_to_cids = {}
+        for cid, name in zip(cids, names):
+            self.name_to_cids.setdefault(name, []).append(cid)
+        self._trie = None
+
+    @classmethod
+    def from_categories(cls, categories):
+        """평평한 카테고리 리스트(parent_cid 유무 무관)로 인덱스 생성"""
+        n = len(categories)
+        cids = [str(category['cid']) for category in categories]
+        names = [category['name'] for category in categories]
+        parents = array('i', [-1] * n)
+        depths = array('B', [0] * n)
+        subtree_end = array('i', range(1, n + 1))
+
+        path = []
+        for i, category in enumerate(categories):
+            depth = category['depth']
+            # 스택에서 빠지는 노드는 하위 트리가 i 직전에서 끝남
+            while len(path) >= depth:
+                subtree_end[path.pop()] = i
+            parents[i] = path[-1] if path else -1
+            depths[i] = depth
+            path.append(i)
+        while path:
+            subtree_end[path.pop()] = n
+
+        leaf_positions = array('i')
+        leaves_before = array('i', [0] * (n + 1))
+        for i in range(n):
+            leaves_before[i] = len(leaf_positions)
+            if subtree_end[i] == i + 1:
+                leaf_positions.append(i)
+        leaves_before[n] = len(leaf_positions)
+
+        return cls(cids, names, parents, depths, subtree_end, leaf_positions, leaves_before)
+
+    @classmethod
+    def from_json(cls, path):
+        """naver_shopping_categories.json 으로 인덱스 생성"""
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls.from_categories(json.load(f))
+
+    def save(self, path):
+        """바이너리 파일로 저장"""
+        with open(path, 'wb') as f:
+            f.write(_HEADER.pack(MAGIC, VERSION, len(self.cids)))
+            for values in (self.parents, self.depths, self.subtree_end, self.leaves_before):
+                values.tofile(f)
+            f.write(_BLOB_LEN.pack(len(self.leaf_positions)))
+            self.leaf_positions.tofile(f)
+            for strings in (self.cids, self.names):
+                blob = '\0'.join(strings).encode('utf-8')
+                f.write(_BLOB_LEN.pack(len(blob)))
+                f.write(blob)
+
+    @classmethod
+    def load(cls, path):
+        """save()로 저장한 바이너리 파일에서 인덱스 로드"""
+        with open(path, 'rb') as f:
+            magic, version, n = _HEADER.unpack(f.read(_HEADER.size))
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"카테고리 인덱스 파일 형식이 아닙니다: {path}")
+
+            parents = array('i')
+            parents.fromfile(f, n)
+            depths = array('B')
+            depths.fromfile(f, n)
+            subtree_end = array('i')
+            subtree_end.fromfile(f, n)
+            leaves_before = array('i')
+            leaves_before.fromfile(f, n + 1)
+            (leaf_count,) = _BLOB_LEN.unpack(f.read(_BLOB_LEN.size))
+            leaf_positions = array('i')
+            leaf_positions.fromfile(f, leaf_count)
+
+            strings = []
+            for _ in range(2):
+                (length,) = _BLOB_LEN.unpack(f.read(_BLOB_LEN.size))
+                blob = f.read(length).decode('utf-8')
+                strings.append(blob.split('\0') if n else [])
+
+        return cls(strings[0], strings[1], parents, depths, subtree_end, leaf_positions, leaves_before)
+
+    def __len__(self):
+        return len(self.cids)
+
+    def __contains__(self, cid):
+        return str(cid) in self.position
+
+    def _node(self, i):
+        parent = self.parents[i]
+        return {
+            'name': self.names[i],
+            'cid': self.cids[i],
+            'depth': self.depths[i],
+            'parent_cid': self.cids[parent] if parent >= 0 else None,
+        }
+
+    def get(self, cid):
+        """cid에 해당하는 카테고리 정보 (없으면 None)"""
+        i = self.position.get(str(cid))
+        return self._node(i) if i is not None else None
+
+    def path(self, cid):
+        """최상위부터 cid까지의 카테고리 리스트"""
+        i = self.position.get(str(cid))
+        nodes = []
+        while i is not None and i >= 0:
+            nodes.append(self._node(i))
+            i = self.parents[i]
+        nodes.reverse()
+        return nodes
+
+    def path_names(self, cid, sep=' > '):
+        """'패션의류 > 여성의류 > 원피스' 형태의 경로 문자열"""
+        return sep.join(node['name'] for node in self.path(cid))
+
+    def subtree(self, cid):
+        """cid와 그 하위 카테고리 전체의 cid 리스트 (깊이 우선 순서)"""
+        i = self.position.get(str(cid))
+        if i is None:
+            return []
+        return self.cids[i:self.subtree_end[i]]
+
+    def children(self, cid):
+        """cid의 바로 아래 하위 카테고리 cid 리스트"""
+        i = self.position.get(str(cid))
+        if i is None:
+            return []
+        result = []
+        j = i + 1
+        while j < self.subtree_end[i]:
+            result.append(self.cids[j])
+            j = self.subtree_end[j]
+        return result
+
+    def leaves(self, cid=None):
+        """cid 하위의 리프 카테고리 cid 리스트 (cid가 없으면 전체 리프)"""
+        if cid is None:
+            start, end = 0, len(self.leaf_positions)
+        else:
+            i = self.position.get(str(cid))
+            if i is None:
+                return []
+            start, end = self.leaves_before[i], self.leaves_before[self.subtree_end[i]]
+        return [self.cids[j] for j in self.leaf_positions[start:end]]
+
+    def find_by_name(self, name):
+        """이름이 정확히 일치하는 카테고리 cid 리스트"""
+        return list(self.name_to_cids.get(name, []))
+
+    def _build_trie(self):
+        trie = {}
+        for i, name in enumerate(self.names):
+            node = trie
+            for ch in name:
+                node = node.setdefault(ch, {})
+            node.setdefault(None, []).append(i)
+        return trie
+
+    def search_prefix(self, prefix, limit=None):
+        """이름이 prefix로 시작하는 카테고리 cid 리스트"""
+        if self._trie is None:
+            self._trie = self._build_trie()
+
+        node = self._trie
+        for ch in prefix:
+            node = node.get(ch)
+            if node is None:
+                return []
+
+        positions = []
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            for key, value in current.items():
+                if key is None:
+                    positions.extend(value)
+                else:
+                    stack.append(value)
+        positions.sort()
+        if limit is not None:
+            positions = positions[:limit]
+        return [self.cids[i] for i in positions]
@@ -0,0 +1,237 @@
+import hashlib
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+import requests
+
+from naver_datalab import TOP_LEVEL_CATEGORIES
+from rate_limit import TokenBucket, get_host_limiters
+
+# 네이버 데이터랩 쇼핑인사이트 - 하위 카테고리 조회 API
+CATEGORY_URL = "https://datalab.naver.com/shoppingInsight/getCategory.naver"
+HEADERS = {
+    "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
+    "Referer": "https://datalab.naver.com/shoppingInsight/sCategory.naver",
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36"
+}
+
+
+class CategoryTreeCrawler:
+    """
+    네이버 쇼핑 카테고리 트리를 너비 우선(BFS)으로 병렬 탐색하는 크롤러
+
+    최대 max_workers 개의 스레드가 하위 카테고리를 요청하고, 실제 동시 요청 수는
+    호스트 제어기(AdaptiveLimiter)가 응답 상태와 지연을 보고 늘리거나 줄입니다.
+    rate 를 주면 모든 스레드가 하나의 TokenBucket을 공유해 초당 요청 수를 rate 이하로도 묶습니다.
+    """
+
+    def __init__(self, max_workers=8, rate=None, burst=None, limiters=None):
+        self.max_workers = max_workers
+        self.bucket = TokenBucket(rate, burst) if rate else None
+        self.limiters = limiters or get_host_limiters()
+        self.request_count = 0
+        self._count_lock = threading.Lock()
+        self._thread_local = threading.local()
+
+    def _get_session(self):
+        session = getattr(self._thread_local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(HEADERS)
+            self._thread_local.session = session
+        return session
+
+    def fetch_children(self, cid):
+        """
+        카테고리 하나의 하위 카테고리 목록을 가져오는 함수
+
+        Returns:
+            list: [{'name', 'cid', 'hasChild'}, ...] 또는 에러 발생 시 None.
+        """
+        if self.bucket is not None:
+            self.bucket.acquire()
+        with self._count_lock:
+            self.request_count += 1
+        try:
+            with self.limiters.slot(CATEGORY_URL) as slot:
+                response = slot.response = self._get_session().post(CATEGORY_URL, data={"cid": cid}, timeout=10)
+        except requests.exceptions.RequestException as e:
+            print(f"Error: {e} - ({cid})")
+            return None
+
+        if response.status_code != 200:
+            print(f"Error: {response.status_code} - ({cid})")
+            return None
+
+        try:
+            subcategories = response.json() or []
+        except json.JSONDecodeError:
+            print(f"JSON Decode Error for ({cid})")
+            return None
+
+        return [
+            {'name': sub_cat['name'], 'cid': sub_cat['cid'], 'hasChild': bool(sub_cat.get('hasChild'))}
+            for sub_cat in subcategories
+        ]
+
+    def crawl_subtrees(self, start_cids, should_descend=None):
+        """
+        start_cids 부터 BFS로 하위 트리를 탐색하는 함수
+
+        Args:
+            start_cids (iterable): 탐색을 시작할 카테고리 ID들.
+            should_descend (callable, optional): should_descend(cid, children)가 False를 반환하면
+                                                 해당 노드의 하위는 더 내려가지 않습니다.
+
+        Returns:
+            dict: {cid: [{'name', 'cid', 'hasChild'}, ...]} - 요청한 노드별 하위 카테고리 목록.
+                  요청에 실패한 노드는 포함되지 않습니다.
+        """
+        children = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending = {executor.submit(self.fetch_children, cid): cid for cid in start_cids}
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    cid = pending.pop(future)
+                    subcategories = future.result()
+                    if subcategories is None:
+                        continue
+                    children[cid] = subcategories
+                    if should_descend is not None and not should_descend(cid, subcategories):
+                        continue
+                    for sub_cat in subcategories:
+                        if sub_cat['hasChild'] and sub_cat['cid'] not in children:
+                            pending[executor.submit(self.fetch_children, sub_cat['cid'])] = sub_cat['cid']
+        return children
+
+    def crawl(self, roots=None):
+        """
+        최상위 카테고리부터 전체 트리를 탐색
+
+        Args:
+            roots (dict, optional): {이름: cid}. Defaults to TOP_LEVEL_CATEGORIES.
+
+        Returns:
+            tuple: (categories, children)
+                   categories - [{'name', 'cid', 'depth', 'parent_cid'}, ...] (기존 DFS 출력과 같은 순서)
+                   children - crawl_subtrees 의 반환값
+        """
+        if roots is None:
+            roots = TOP_LEVEL_CATEGORIES
+        children = self.crawl_subtrees(roots.values())
+        return flatten_tree(roots, children), children
+
+    def sync(self, previous_categories, roots=None, check_depth=2):
+        """
+        이전 스냅샷과 비교해 바뀐 하위 트리만 다시 탐색하는 증분 동기화
+
+        check_depth 이하의 노드는 항상 하위 목록을 확인하고, 그보다 깊은 노드는
+        하위 목록 해시가 이전 스냅샷과 다를 때만 더 내려갑니다.
+        내려가지 않은 하위 트리는 이전 스냅샷의 내용을 그대로 사용합니다.
+
+        Args:
+            previous_categories (list): 이전 crawl/sync 결과 (평평한 카테고리 리스트).
+            roots (dict, optional): {이름: cid}. Defaults to TOP_LEVEL_CATEGORIES.
+            check_depth (int, optional): 항상 확인할 최대 깊이. Defaults to 2.
+
+        Returns:
+            tuple: (categories, delta) - 갱신된 카테고리 리스트와 diff_categories 결과.
+        """
+        if roots is None:
+            roots = TOP_LEVEL_CATEGORIES
+        old_children = children_from_categories(previous_categories)
+        old_hashes = {cid: child_list_hash(subs) for cid, subs in old_children.items()}
+
+        depths = {cid: 1 for cid in roots.values()}
+
+        def should_descend(cid, subcategories):
+            depth = depths.get(cid, 1)
+            for sub_cat in subcategories:
+                depths[sub_cat['cid']] = depth + 1
+            if depth < check_depth:
+                return True
+            return child_list_hash(subcategories) != old_hashes.get(cid)
+
+        fetched = self.crawl_subtrees(roots.values(), should_descend=should_descend)
+
+        # 새로 가져온 목록으로 덮어쓰고, 더 이상 하위가 없는 노드의 옛 목록은 제거
+        children = dict(old_children)
+        children.update(fetched)
+        for subcategories in fetched.values():
+            for sub_cat in subcategories:
+                if not sub_cat['hasChild']:
+                    children.pop(sub_cat['cid'], None)
+
+        categories = flatten_tree(roots, children)
+        return categories, diff_categories(previous_categories, categories)
+
+
+def flatten_tree(roots, children):
+    """{cid: 하위 목록} 구조를 깊이 우선 순서의 평평한 리스트로 변환"""
+    categories = []
+    stack = [(name, cid, 1, None) for name, cid in reversed(list(roots.items()))]
+    while stack:
+        name, cid, depth, parent_cid = stack.pop()
+        categories.append({'name': name, 'cid': cid, 'depth': depth, 'parent_cid': parent_cid})
+        for sub_cat in reversed(children.get(cid, [])):
+            stack.append((sub_cat['name'], sub_cat['cid'], depth + 1, cid))
+    return categories
+
+
+def child_list_hash(subcategories):
+    """하위 카테고리 목록(cid, 이름, 하위 존재 여부)의 해시"""
+    key = json.dumps(
+        [[sub_cat['cid'], sub_cat['name'], bool(sub_cat['hasChild'])] for sub_cat in subcategories],
+        ensure_ascii=False
+    )
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+
+def children_from_categories(categories):
+    """
+    평평한 카테고리 리스트에서 {cid: 하위 목록} 구조를 복원
+
+    parent_cid가 없는 예전 출력 파일도 깊이 우선 순서와 depth로 부모를 찾아 복원합니다.
+    """
+    children = {}
+    path = []
+    for category in categories:
+        depth = category['depth']
+        del path[depth - 1:]
+        parent_cid = category.get('parent_cid', path[-1] if path else None)
+        path.append(category['cid'])
+        if parent_cid is not None:
+            children.setdefault(parent_cid, []).append(
+                {'name': category['name'], 'cid': category['cid'], 'hasChild': False}
+            )
+
+    for subcategories in children.values():
+        for sub_cat in subcategories:
+            sub_cat['hasChild'] = sub_cat['cid'] in children
+    return children
+
+
+def diff_categories(old_categories, new_categories):
+    """
+    두 카테고리 리스트의 차이
+
+    Returns:
+        dict: {'added': [...], 'removed': [...], 'changed': [{'cid', 'before', 'after'}, ...]}
+    """
+    old_by_cid = {category['cid']: category for category in old_categories}
+    new_by_cid = {category['cid']: category for category in new_categories}
+
+    added = [category for cid, category in new_by_cid.items() if cid not in old_by_cid]
+    removed = [category for cid, category in old_by_cid.items() if cid not in new_by_cid]
+    changed = []
+    for cid, category in new_by_cid.items():
+        before = old_by_cid.get(cid)
+        if before is None:
+            continue
+        if (before['name'], before['depth'], before.get('parent_cid', category['parent_cid'])) != \
+                (category['name'], category['depth'], category['parent_cid']):
+            changed.append({'cid': cid, 'before': before, 'after': category})
+
+    return {'added': added, 'removed': removed, 'changed': changed}
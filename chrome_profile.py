@@ -0,0 +1,214 @@
+import json
+import os
+import shutil
+import subprocess
+import time
+import urllib.request
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+
+# lite 모드에서 막을 요청 (DevTools Network.setBlockedURLs 패턴, * 는 와일드카드)
+# 이미지 src 속성은 HTML에 그대로 남으므로 extract_product_images 결과는 같습니다.
+BLOCKED_URL_PATTERNS = [
+    # 이미지 / 미디어
+    '*.jpg*', '*.jpeg*', '*.png*', '*.gif*', '*.webp*', '*.bmp*', '*.ico*',
+    '*.mp4*', '*.webm*', '*.m3u8*', '*.mp3*',
+    # 웹 폰트
+    '*.woff*', '*.ttf*', '*.otf*', '*.eot*',
+    # 분석/광고 스크립트
+    '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*', '*googlesyndication.com*',
+    '*facebook.net*', '*facebook.com/tr*', '*wcs.naver.net*', '*analytics.kakao.com*',
+    '*criteo.com*', '*criteo.net*', '*hotjar.com*', '*clarity.ms*',
+]
+
+# lite 모드 Chrome 설정 (2 = 차단)
+LITE_PREFS = {
+    'profile.managed_default_content_settings.images': 2,
+    'profile.managed_default_content_settings.media_stream': 2,
+    'profile.default_content_setting_values.notifications': 2,
+    'profile.default_content_setting_values.geolocation': 2,
+}
+
+# 설정하면 실행할 때마다 Chrome 을 새로 띄우지 않고 오래 떠 있는 Chrome 에 붙음
+#   SSADAGU_CHROME_DEBUGGER: 붙을 원격 디버깅 주소 (예: 127.0.0.1:9222)
+#   SSADAGU_CHROME_PROFILE: 유지할 user-data-dir (떠 있는 Chrome 이 없으면 이 프로필로 띄움)
+DEBUGGER_ADDRESS_ENV = 'SSADAGU_CHROME_DEBUGGER'
+PROFILE_DIR_ENV = 'SSADAGU_CHROME_PROFILE'
+DEFAULT_DEBUGGER_ADDRESS = '127.0.0.1:9222'
+
+CHROME_BINARIES = ('google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser', 'chrome')
+
+LITE_ARGUMENTS = [
+    '--blink-settings=imagesEnabled=false',
+    '--disable-remote-fonts',
+    '--autoplay-policy=user-gesture-required',
+    '--disable-background-networking',
+    '--disable-extensions',
+]
+
+
+def apply_lite_options(chrome_options):
+    """chrome_options 에 이미지/미디어/폰트를 받지 않는 lite 설정 추가"""
+    for argument in LITE_ARGUMENTS:
+        chrome_options.add_argument(argument)
+    chrome_options.add_experimental_option('prefs', dict(LITE_PREFS))
+    return chrome_options
+
+
+def block_requests(driver, patterns=None):
+    """
+    DevTools 로 driver 의 요청 중 patterns 와 맞는 것을 차단
+
+    Returns:
+        bool: 차단 규칙 적용 여부 (CDP 를 지원하지 않는 드라이버면 False).
+    """
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': list(patterns or BLOCKED_URL_PATTERNS)})
+        return True
+    except Exception as e:
+        print(f"요청 차단 규칙을 적용하지 못했습니다: {e}")
+        return False
+
+
+def create_chrome_driver(chrome_options, lite=True):
+    """
+    Chrome WebDriver 생성 (lite 면 차단 규칙까지 적용)
+
+    chrome_options 에 apply_lite_options 를 먼저 적용해 두어야 lite 설정이 모두 반영됩니다.
+    """
+    driver = webdriver.Chrome(options=chrome_options)
+    if lite:
+        block_requests(driver)
+    return driver
+
+
+def attach_options(debugger_address):
+    """이미 떠 있는 Chrome (debugger_address) 에 붙는 옵션"""
+    chrome_options = Options()
+    chrome_options.add_experimental_option('debuggerAddress', debugger_address)
+    return chrome_options
+
+
+def debugger_alive(debugger_address, timeout=1):
+    """debugger_address 에서 Chrome 원격 디버깅이 응답하는지 여부"""
+    try:
+        with urllib.request.urlopen(f"http://{debugger_address}/json/version", timeout=timeout) as response:
+            return response.status == 200
+    except (OSError, ValueError):
+        return False
+
+
+def find_chrome_binary():
+    """PATH 에서 Chrome/Chromium 실행 파일 경로 (없으면 None)"""
+    for name in CHROME_BINARIES:
+        path = shutil.which(name)
+        if path:
+            return path
+    return None
+
+
+def write_profile_prefs(user_data_dir, prefs, profile='Default'):
+    """
+    user_data_dir 프로필의 Preferences 파일에 prefs 를 합쳐 씀
+
+    chromedriver 가 'prefs' 옵션을 적용하는 방식과 같이, 점으로 구분한 키
+    ('profile.managed_default_content_settings.images')를 중첩 dict 로 풀어 넣습니다.
+    Chrome 이 그 프로필로 떠 있지 않을 때 호출해야 반영됩니다.
+    """
+    directory = os.path.join(os.path.abspath(os.path.expanduser(user_data_dir)), profile)
+    path = os.path.join(directory, 'Preferences')
+    try:
+        with open(path, encoding='utf-8') as f:
+            preferences = json.load(f)
+        if not isinstance(preferences, dict):
+            preferences = {}
+    except (OSError, ValueError):
+        preferences = {}
+
+    for dotted_key, value in prefs.items():
+        node = preferences
+        *parents, leaf = dotted_key.split('.')
+        for key in parents:
+            if not isinstance(node.get(key), dict):
+                node[key] = {}
+            node = node[key]
+        node[leaf] = value
+
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(preferences, f)
+    os.replace(tmp_path, path)
+
+
+def launch_warm_chrome(user_data_dir, debugger_address=DEFAULT_DEBUGGER_ADDRESS, arguments=(), prefs=None,
+                       binary=None, timeout=15):
+    """
+    user_data_dir 프로필로 원격 디버깅 Chrome 을 스크립트와 분리된 프로세스로 띄움
+
+    이미 debugger_address 에서 응답하는 Chrome 이 있으면 그대로 둡니다. 띄운 Chrome 은
+    스크립트가 끝나도 살아 있어 다음 실행이 캐시/쿠키가 남은 브라우저에 바로 붙을 수 있습니다.
+
+    Args:
+        user_data_dir (str): 유지할 Chrome 프로필 디렉터리.
+        debugger_address (str, optional): 'host:port'. Defaults to DEFAULT_DEBUGGER_ADDRESS.
+        arguments (iterable, optional): 함께 넘길 Chrome 인자 (ChromeOptions.arguments 등).
+        prefs (dict, optional): 띄우기 전에 프로필에 써 둘 Chrome 설정 (LITE_PREFS 등).
+        binary (str, optional): Chrome 실행 파일 (None이면 PATH 에서 찾음).
+        timeout (float, optional): 디버깅 포트가 열릴 때까지 기다릴 최대 시간(초). Defaults to 15.
+
+    Returns:
+        str: 붙을 수 있는 debugger_address.
+    """
+    if debugger_alive(debugger_address):
+        return debugger_address
+
+    binary = binary or find_chrome_binary()
+    if binary is None:
+        raise FileNotFoundError("Chrome 실행 파일을 찾을 수 없습니다.")
+    if prefs:
+        # 명령행으로는 prefs 를 넘길 수 없으므로 프로필 파일에 미리 기록
+        write_profile_prefs(user_data_dir, prefs)
+
+    port = debugger_address.rsplit(':', 1)[-1]
+    command = [
+        binary,
+        f'--remote-debugging-port={port}',
+        f'--user-data-dir={os.path.abspath(os.path.expanduser(user_data_dir))}',
+        '--no-first-run',
+        '--no-default-browser-check',
+    ]
+    # 포트/프로필은 위에서 정하므로 같은 인자가 또 있으면 뺌
+    command += [
+        argument for argument in arguments
+        if not argument.startswith(('--remote-debugging-port', '--user-data-dir'))
+    ]
+    subprocess.Popen(
+        command, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        start_new_session=True
+    )
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if debugger_alive(debugger_address):
+            print(f"Chrome 을 원격 디버깅 모드로 띄웠습니다: {debugger_address} ({user_data_dir})")
+            return debugger_address
+        time.sleep(0.2)
+    raise TimeoutError(f"{timeout}초 안에 Chrome 원격 디버깅 포트가 열리지 않았습니다: {debugger_address}")
+
+
+def warm_chrome_address(debugger_address=None, user_data_dir=None, arguments=(), prefs=None):
+    """
+    붙을 오래 떠 있는 Chrome 의 주소 (설정이 없으면 None)
+
+    인자가 없으면 SSADAGU_CHROME_DEBUGGER / SSADAGU_CHROME_PROFILE 환경 변수를 씁니다.
+    프로필 디렉터리가 있으면 그 주소에 Chrome 이 없을 때 arguments/prefs 를 적용해
+    launch_warm_chrome 으로 띄웁니다.
+    """
+    debugger_address = debugger_address or os.environ.get(DEBUGGER_ADDRESS_ENV)
+    user_data_dir = user_data_dir or os.environ.get(PROFILE_DIR_ENV)
+    if user_data_dir:
+        return launch_warm_chrome(user_data_dir, debugger_address or DEFAULT_DEBUGGER_ADDRESS, arguments, prefs)
+    return debugger_address or None
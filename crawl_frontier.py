@@ -0,0 +1,253 @@
+import json
+import sqlite3
+import threading
+import time
+
+from page_cache import canonical_url
+
+# 상태: queued(대기) → in_flight(크롤링 중) → done(완료, 결과 저장) / failed(재시도 횟수 초과)
+QUEUED = 'queued'
+IN_FLIGHT = 'in_flight'
+DONE = 'done'
+FAILED = 'failed'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS frontier (
+    url TEXT NOT NULL,
+    stage TEXT NOT NULL,
+    keyword TEXT,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    result TEXT,
+    error TEXT,
+    queued_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (url, stage)
+);
+CREATE INDEX IF NOT EXISTS frontier_status ON frontier (stage, status, keyword);
+
+CREATE TABLE IF NOT EXISTS frontier_keywords (
+    url TEXT NOT NULL,
+    stage TEXT NOT NULL,
+    keyword TEXT NOT NULL,
+    queued_at REAL NOT NULL,
+    PRIMARY KEY (url, stage, keyword)
+);
+CREATE INDEX IF NOT EXISTS frontier_keywords_keyword ON frontier_keywords (keyword, stage, queued_at);
+"""
+
+
+def json_default(obj):
+    # numpy 숫자/배열 등 json 이 모르는 값
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    if hasattr(obj, 'item'):
+        return obj.item()
+    return str(obj)
+
+
+class CrawlFrontier:
+    """
+    크롤링할 URL 의 상태를 SQLite 에 기록하는 재시작 가능한 작업 목록
+
+    URL 은 canonical_url 로 정규화해 (url, stage) 마다 한 줄로 관리하고, 같은 URL 을 넣은
+    검색어는 (url, stage, keyword) 마다 따로 기록합니다. 상품 하나가
+    끝날 때마다 결과를 바로 커밋하므로, 실행이 중간에 죽어도 다시 실행하면 끝난 URL 은
+    저장된 결과를 쓰고 남은 URL 만 크롤링합니다. 한 DB 파일은 한 프로세스가 쓴다고 가정해
+    열 때 in_flight 로 남은 URL 을 다시 대기 상태로 돌립니다.
+    """
+
+    def __init__(self, path='crawl_frontier.db', max_attempts=3, max_age=24 * 3600):
+        """
+        Args:
+            path (str, optional): SQLite 파일 경로. Defaults to 'crawl_frontier.db'.
+            max_attempts (int, optional): 실패한 URL 을 다시 시도할 최대 횟수. Defaults to 3.
+            max_age (float, optional): 끝난 URL 을 다시 넣으면 새로 크롤링할 때까지의 시간(초)
+                                       (None이면 다시 크롤링하지 않음). Defaults to 하루.
+        """
+        self.path = path
+        self.max_attempts = max_attempts
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        # 검색어별 기록이 없던 예전 DB 는 처음 넣을 때의 keyword 를 옮겨 둠
+        self._conn.execute(
+            "INSERT OR IGNORE INTO frontier_keywords (url, stage, keyword, queued_at) "
+            "SELECT url, stage, keyword, queued_at FROM frontier WHERE keyword IS NOT NULL"
+        )
+        recovered = self._conn.execute(
+            "UPDATE frontier SET status = ?, updated_at = ? WHERE status = ?",
+            (QUEUED, time.time(), IN_FLIGHT)
+        ).rowcount
+        if recovered:
+            print(f"이전 실행에서 끝나지 않은 URL {recovered}개를 다시 대기열에 넣었습니다.")
+
+    def enqueue(self, urls, keyword=None, stage='detail'):
+        """
+        urls 를 대기열에 추가
+
+        이미 있는 URL 은 그대로 두되, 끝난 지 max_age 가 지난 URL 은 다시 대기 상태로 돌립니다.
+
+        Returns:
+            int: 새로 추가되거나 다시 대기 상태가 된 URL 수.
+        """
+        now = time.time()
+        keys = [canonical_url(url) for url in urls]
+        with self._lock:
+            before = self._conn.total_changes
+            self._conn.execute("BEGIN")
+            if self.max_age is not None:
+                self._conn.executemany(
+                    "UPDATE frontier SET status = ?, attempts = 0, updated_at = ? "
+                    "WHERE url = ? AND stage = ? AND status IN (?, ?) AND updated_at < ?",
+                    [(QUEUED, now, key, stage, DONE, FAILED, now - self.max_age) for key in keys]
+                )
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO frontier (url, stage, keyword, status, queued_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [(key, stage, keyword, QUEUED, now, now) for key in keys]
+            )
+            changed = self._conn.total_changes - before
+            if keyword is not None:
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO frontier_keywords (url, stage, keyword, queued_at) VALUES (?, ?, ?, ?)",
+                    [(key, stage, keyword, now) for key in keys]
+                )
+            self._conn.execute("COMMIT")
+            return changed
+
+    def with_unfinished(self, urls, keyword=None, stage='detail', limit=None):
+        """
+        이전 실행에서 keyword 로 넣고 끝내지 못한 URL 을 앞에 붙인 정규화 URL 목록 (중복 제거)
+
+        limit 을 주면 합친 뒤 앞에서부터 limit 개만 남깁니다 (남은 URL 을 먼저 끝냄).
+        """
+        keys = self.unfinished(keyword, stage) + [canonical_url(url) for url in urls]
+        keys = list(dict.fromkeys(keys))
+        return keys if limit is None else keys[:limit]
+
+    def _select(self, column, status, keyword, stage):
+        # keyword 를 주면 그 검색어로 넣은 URL 만 (검색어로 넣은 순서), 아니면 처음 넣은 순서
+        if keyword is None:
+            query = f"SELECT f.{column} FROM frontier f WHERE f.stage = ? AND f.status = ? ORDER BY f.queued_at, f.rowid"
+            params = (stage, status)
+        else:
+            query = (
+                f"SELECT f.{column} FROM frontier_keywords k "
+                "JOIN frontier f ON f.url = k.url AND f.stage = k.stage "
+                "WHERE k.keyword = ? AND k.stage = ? AND f.status = ? ORDER BY k.queued_at, f.rowid"
+            )
+            params = (keyword, stage, status)
+        with self._lock:
+            return [row[0] for row in self._conn.execute(query, params).fetchall()]
+
+    def unfinished(self, keyword=None, stage='detail'):
+        """대기 중인 URL (keyword 를 주면 그 키워드로 넣은 것만, 넣은 순서)"""
+        return self._select('url', QUEUED, keyword, stage)
+
+    def claim(self, url, stage='detail'):
+        """
+        url 을 in_flight 로 바꿈
+
+        Returns:
+            bool: 크롤링해야 하면 True, 이미 끝났거나 실패로 확정됐거나 다른 작업이 잡고 있으면 False.
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE frontier SET status = ?, attempts = attempts + 1, updated_at = ? "
+                "WHERE url = ? AND stage = ? AND status = ?",
+                (IN_FLIGHT, time.time(), canonical_url(url), stage, QUEUED)
+            )
+            return cursor.rowcount == 1
+
+    def mark_done(self, url, result=None, stage='detail'):
+        """url 을 완료로 바꾸고 결과를 바로 커밋 (result 가 None이면 상태만 기록)"""
+        payload = json.dumps(result, ensure_ascii=False, default=json_default) if result is not None else None
+        with self._lock:
+            self._conn.execute(
+                "UPDATE frontier SET status = ?, result = ?, error = NULL, updated_at = ? WHERE url = ? AND stage = ?",
+                (DONE, payload, time.time(), canonical_url(url), stage)
+            )
+
+    def mark_failed(self, url, error=None, stage='detail'):
+        """url 실패 기록 (max_attempts 전이면 다시 대기, 넘으면 failed)"""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE frontier SET status = CASE WHEN attempts >= ? THEN ? ELSE ? END, error = ?, updated_at = ? "
+                "WHERE url = ? AND stage = ?",
+                (self.max_attempts, FAILED, QUEUED, error, time.time(), canonical_url(url), stage)
+            )
+
+    def result(self, url, stage='detail'):
+        """완료된 url 의 저장된 결과 (없거나 상태만 기록했으면 None)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT result FROM frontier WHERE url = ? AND stage = ? AND status = ?",
+                (canonical_url(url), stage, DONE)
+            ).fetchone()
+        return json.loads(row[0]) if row and row[0] is not None else None
+
+    def results(self, keyword=None, stage='detail'):
+        """완료된 결과들 (keyword 를 주면 그 키워드로 넣은 것만, 넣은 순서, 상태만 기록한 URL 은 제외)"""
+        return [json.loads(result) for result in self._select('result', DONE, keyword, stage) if result is not None]
+
+    def crawl(self, urls, func, keyword=None, stage='detail', runner=None, load=None):
+        """
+        urls 중 끝나지 않은 것만 func(url, driver) 로 크롤링하고 입력 순서대로 결과 반환
+
+        이미 끝난 URL 은 저장된 결과를 돌려주고, 새 결과는 나오는 대로 커밋합니다.
+        func 가 None 을 반환하거나 예외를 던지면 실패로 기록합니다. load 를 주면 결과는
+        그쪽(상품 저장소 등)에만 두고 여기에는 상태만 기록해 두 사본이 어긋나지 않게 합니다.
+
+        Args:
+            urls (list): 크롤링할 URL.
+            func (callable): (url, driver) 를 받아 결과 dict 를 반환하는 함수.
+            keyword (str, optional): 대기열에 함께 기록할 검색어.
+            stage (str, optional): 같은 URL 을 단계별로 따로 관리할 이름. Defaults to 'detail'.
+            runner (callable, optional): runner(func, urls) 로 실행 (crawler.crawl_in_parallel 등).
+                                         None이면 순서대로 func(url, None).
+            load (callable, optional): load(url) 로 끝난 URL 의 결과를 가져올 함수 (None이면 여기 저장한 결과).
+
+        Returns:
+            list: URL 별 결과 (실패하거나 다른 작업이 잡고 있는 URL 은 None).
+        """
+        urls = list(urls)
+        self.enqueue(urls, keyword, stage)
+
+        def run(url, driver):
+            if not self.claim(url, stage):
+                return load(url) if load is not None else self.result(url, stage)
+            try:
+                result = func(url, driver)
+            except Exception as e:
+                self.mark_failed(url, str(e), stage)
+                raise
+            if result is None:
+                self.mark_failed(url, None, stage)
+            else:
+                self.mark_done(url, None if load is not None else result, stage)
+            return result
+
+        if runner is None:
+            return [run(url, None) for url in urls]
+        return runner(run, urls)
+
+    def stats(self, stage=None):
+        """상태별 URL 수"""
+        query = "SELECT status, COUNT(*) FROM frontier"
+        params = []
+        if stage is not None:
+            query += " WHERE stage = ?"
+            params.append(stage)
+        with self._lock:
+            rows = self._conn.execute(query + " GROUP BY status", params).fetchall()
+        return dict(rows)
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
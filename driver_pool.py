@@ -0,0 +1,162 @@
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+
+class WebDriverPool:
+    """
+    여러 스레드가 나눠 쓰는 WebDriver 풀
+
+    드라이버는 필요할 때 size 개까지만 만들고, checkout 할 때마다 살아 있는지 확인해
+    죽은 드라이버는 버리고 새로 만듭니다. with pool.driver() as driver: 형태로 쓰면
+    예외가 난 드라이버는 자동으로 폐기됩니다.
+    """
+
+    def __init__(self, factory, size=4, max_uses=None, drivers=()):
+        """
+        Args:
+            factory (callable): 새 WebDriver 를 만드는 함수.
+            size (int, optional): 최대 드라이버 수. Defaults to 4.
+            max_uses (int, optional): 드라이버 하나를 재사용할 최대 횟수 (넘으면 새로 만듦, None이면 무제한).
+            drivers (iterable, optional): 이미 만든 드라이버 (풀의 size 개 안에 포함, 크롤러의 메인 드라이버 등).
+        """
+        drivers = list(drivers)
+        if size < 1:
+            raise ValueError("size는 1 이상이어야 합니다.")
+        if len(drivers) > size:
+            raise ValueError("drivers 는 size 개를 넘을 수 없습니다.")
+        self.factory = factory
+        self.size = size
+        self.max_uses = max_uses
+        self._idle = queue.LifoQueue()
+        self._uses = {id(driver): 0 for driver in drivers}
+        self._created = len(drivers)
+        self._closed = False
+        self._lock = threading.Lock()
+        for driver in drivers:
+            self._idle.put(driver)
+
+    def _is_alive(self, driver):
+        try:
+            driver.execute_script("return 1")
+            return True
+        except Exception:
+            return False
+
+    def _discard(self, driver):
+        with self._lock:
+            self._uses.pop(id(driver), None)
+            self._created -= 1
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def _create(self):
+        try:
+            driver = self.factory()
+        except Exception:
+            with self._lock:
+                self._created -= 1
+            raise
+        with self._lock:
+            self._uses[id(driver)] = 0
+        return driver
+
+    def checkout(self, timeout=None):
+        """
+        쉬고 있는 드라이버를 꺼내거나 (자리가 남으면) 새로 만들어 반환
+
+        Args:
+            timeout (float, optional): 모든 드라이버가 사용 중일 때 기다릴 최대 시간 (None이면 무한).
+
+        Returns:
+            WebDriver: 살아 있는 드라이버.
+        """
+        while True:
+            if self._closed:
+                raise RuntimeError("이미 닫힌 WebDriverPool 입니다.")
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                with self._lock:
+                    can_create = self._created < self.size
+                    if can_create:
+                        self._created += 1
+                if can_create:
+                    return self._create()
+                try:
+                    driver = self._idle.get(timeout=timeout)
+                except queue.Empty:
+                    raise TimeoutError(f"{timeout}초 안에 사용할 수 있는 WebDriver가 없습니다.")
+
+            if self._is_alive(driver):
+                return driver
+            print("응답 없는 WebDriver를 새로 만듭니다.")
+            self._discard(driver)
+
+    def checkin(self, driver, broken=False):
+        """
+        드라이버를 풀에 반납 (broken 이거나 max_uses 를 넘으면 종료하고 자리를 비움)
+        """
+        with self._lock:
+            uses = self._uses.get(id(driver), 0) + 1
+            self._uses[id(driver)] = uses
+        if broken or self._closed or (self.max_uses is not None and uses >= self.max_uses):
+            self._discard(driver)
+            return
+        self._idle.put(driver)
+
+    @contextmanager
+    def driver(self, timeout=None):
+        """checkout/checkin 을 묶은 컨텍스트 매니저"""
+        driver = self.checkout(timeout)
+        try:
+            yield driver
+        except Exception:
+            self.checkin(driver, broken=not self._is_alive(driver))
+            raise
+        else:
+            self.checkin(driver)
+
+    def close(self):
+        """쉬고 있는 드라이버를 모두 종료 (사용 중인 드라이버는 반납될 때 종료)"""
+        self._closed = True
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(driver)
+
+
+def map_with_drivers(func, items, pool=None, max_workers=None):
+    """
+    items 를 여러 스레드에 나눠 func(item, driver) 를 실행하고 입력 순서대로 결과를 반환
+
+    pool 이 있으면 작업마다 드라이버를 빌려 쓰고, 없으면 driver=None 으로 호출합니다.
+
+    Args:
+        func (callable): (item, driver) 를 받는 함수.
+        items (iterable): 처리할 항목들.
+        pool (WebDriverPool, optional): 드라이버를 빌려올 풀.
+        max_workers (int, optional): 스레드 수. Defaults to pool.size (풀이 없으면 4).
+
+    Returns:
+        list: 항목별 func 결과.
+    """
+    items = list(items)
+    if not items:
+        return []
+    if max_workers is None:
+        max_workers = pool.size if pool is not None else 4
+
+    def run(item):
+        if pool is None:
+            return func(item, None)
+        with pool.driver() as driver:
+            return func(item, driver)
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(run, items))
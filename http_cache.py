@@ -0,0 +1,138 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+
+import requests
+
+from page_cache import canonical_url
+
+
+class HttpCache:
+    """
+    ETag / Last-Modified 를 이용하는 디스크 HTTP 캐시
+
+    응답 본문을 검증 헤더와 함께 저장해 두었다가, 다시 요청할 때 If-None-Match /
+    If-Modified-Since 를 붙여 조건부 요청을 보냅니다. 304 면 저장한 본문을 그대로 돌려주므로
+    바뀌지 않은 페이지는 헤더만 주고받습니다. 검증 헤더가 없는 응답은 저장하지 않습니다.
+    """
+
+    def __init__(self, directory='.http_cache', max_age=0):
+        """
+        Args:
+            directory (str, optional): 캐시 디렉터리. Defaults to '.http_cache'.
+            max_age (float, optional): 저장 후 이 시간(초) 안이면 서버에 묻지 않고 바로 사용. Defaults to 0 (항상 확인).
+        """
+        self.directory = directory
+        self.max_age = max_age
+        self.fresh_hits = 0
+        self.revalidated = 0
+        self.downloads = 0
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def _paths(self, url):
+        key = hashlib.sha1(canonical_url(url).encode('utf-8')).hexdigest()
+        base = os.path.join(self.directory, key[:2], key)
+        return base + '.json', base + '.body'
+
+    def _load(self, url):
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path, encoding='utf-8') as f:
+                meta = json.load(f)
+            with open(body_path, 'rb') as f:
+                body = f.read()
+        except (OSError, ValueError):
+            return None, None
+        return meta, body
+
+    def _write(self, path, data):
+        # 다른 스레드/프로세스가 반쯤 쓴 파일을 읽지 않도록 임시 파일에 쓰고 교체
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def _store(self, url, meta, body=None):
+        meta_path, body_path = self._paths(url)
+        try:
+            if body is not None:
+                self._write(body_path, body)
+            self._write(meta_path, json.dumps(meta, ensure_ascii=False).encode('utf-8'))
+        except OSError as e:
+            print(f"HTTP 캐시 저장 실패 ({url}): {e}")
+
+    def fetch(self, url, session=None, timeout=15, **kwargs):
+        """
+        url 본문 (캐시가 있으면 조건부 요청, 304 면 캐시 본문)
+
+        Args:
+            url (str): 요청할 URL.
+            session (requests.Session, optional): 사용할 세션 (None이면 requests 모듈).
+            timeout (float, optional): 요청 타임아웃(초). Defaults to 15.
+            **kwargs: session.get 에 넘길 추가 인자.
+
+        Returns:
+            bytes: 응답 본문.
+
+        Raises:
+            requests.exceptions.HTTPError: 4xx/5xx 응답.
+        """
+        meta, body = self._load(url)
+        if meta is not None and self.max_age and time.time() - meta.get('checked_at', 0) < self.max_age:
+            with self._lock:
+                self.fresh_hits += 1
+            return body
+
+        headers = dict(kwargs.pop('headers', None) or {})
+        if meta is not None:
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+
+        response = (session or requests).get(url, headers=headers, timeout=timeout, **kwargs)
+        if response.status_code == 304 and meta is not None:
+            with self._lock:
+                self.revalidated += 1
+            meta['checked_at'] = time.time()
+            self._store(url, meta)
+            return body
+
+        response.raise_for_status()
+        with self._lock:
+            self.downloads += 1
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if etag or last_modified:
+            self._store(url, {
+                'url': url,
+                'etag': etag,
+                'last_modified': last_modified,
+                'checked_at': time.time(),
+            }, response.content)
+        return response.content
+
+    def invalidate(self, url):
+        """url 의 캐시 항목 삭제"""
+        for path in self._paths(url):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def report(self):
+        """캐시 사용 현황 출력"""
+        print(f"HTTP 캐시: 다운로드 {self.downloads}건, 304 재사용 {self.revalidated}건, 확인 생략 {self.fresh_hits}건")
@@ -0,0 +1,256 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import requests
+
+from rate_limit import get_host_limiters
+
+# 네이버 데이터랩 쇼핑인사이트 - 카테고리별 인기 검색어 순위 API
+RANK_URL = "https://datalab.naver.com/shoppingInsight/getCategoryKeywordRank.naver"
+HEADERS = {
+    "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
+    "Referer": "https://datalab.naver.com/shoppingInsight/sCategory.naver",
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36"
+}
+
+TOP_LEVEL_CATEGORIES = {
+    "패션의류": "50000000", "패션잡화": "50000001", "화장품/미용": "50000002",
+    "디지털/가전": "50000003", "가구/인테리어": "50000004", "출산/육아": "50000005",
+    "식품": "50000006", "스포츠/레저": "50000007", "생활/건강": "50000008",
+    "여가/생활편의": "50000009", "면세점": "50000010", "도서": "50005542"
+}
+
+# 순위 응답 디스크 캐시 기본 설정 (데이터랩 순위는 하루 단위로만 바뀜)
+CACHE_DIR = os.path.join('.cache', 'datalab_rank')
+CACHE_TTL = 24 * 60 * 60
+CACHE_MAX_ENTRIES = 1000
+
+
+class RankCache:
+    """
+    데이터랩 순위 응답을 디스크에 저장하는 TTL 캐시
+
+    키 하나당 JSON 파일 하나로 저장하며, 파일 수가 max_entries 를 넘으면
+    가장 오래 사용되지 않은 파일부터 삭제합니다.
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR, ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._count = None
+        os.makedirs(cache_dir, exist_ok=True)
+
+    @staticmethod
+    def make_key(payload):
+        """(cid, timeUnit, 기간, age, gender, device, page) 조합으로 캐시 키 생성"""
+        fields = ("cid", "timeUnit", "startDate", "endDate", "age", "gender", "device", "page")
+        return "|".join(str(payload.get(field, "")) for field in fields)
+
+    def _path(self, key):
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.json")
+
+    def get(self, key):
+        """캐시된 순위 반환 (없거나 만료되면 None)"""
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+        # 다른 형식으로 깨진 파일은 없는 것으로 처리
+        if not isinstance(entry, dict) or not isinstance(entry.get('ranks'), list):
+            return None
+        if entry.get('key') != key or time.time() - entry.get('saved_at', 0) > self.ttl:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+
+        # LRU 판단용으로 접근 시각 갱신
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return [tuple(item) for item in entry['ranks']]
+
+    def set(self, key, ranks):
+        """순위를 캐시에 저장하고 용량 초과 시 오래된 항목 제거"""
+        path = self._path(key)
+        is_new = not os.path.exists(path)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'key': key, 'saved_at': time.time(), 'ranks': ranks}, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+        # 파일 수는 처음 한 번만 세고 이후로는 새 항목만 더해, 한도를 넘을 때만 디렉터리를 훑음
+        with self._lock:
+            if self._count is None:
+                self._count = len(self._entries())
+            elif is_new:
+                self._count += 1
+            if self._count > self.max_entries:
+                self._evict()
+
+    def _entries(self):
+        try:
+            return [
+                os.path.join(self.cache_dir, name)
+                for name in os.listdir(self.cache_dir) if name.endswith('.json')
+            ]
+        except OSError:
+            return []
+
+    def _evict(self):
+        # self._lock 을 잡은 상태에서 호출
+        entries = self._entries()
+        self._count = len(entries)
+        overflow = len(entries) - self.max_entries
+        if overflow > 0:
+            entries.sort(key=lambda p: os.path.getmtime(p) if os.path.exists(p) else 0)
+            for path in entries[:overflow]:
+                try:
+                    os.remove(path)
+                    self._count -= 1
+                except OSError:
+                    pass
+
+    def clear(self):
+        """캐시 전체 삭제"""
+        with self._lock:
+            for name in os.listdir(self.cache_dir):
+                try:
+                    os.remove(os.path.join(self.cache_dir, name))
+                except OSError:
+                    pass
+            self._count = None
+
+
+_default_cache = None
+
+
+def get_rank_cache():
+    """모듈 기본 RankCache 반환 (처음 사용할 때 생성)"""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = RankCache()
+    return _default_cache
+
+
+# 스레드마다 별도의 Session을 사용 (커넥션 재사용 + 스레드 안전)
+_thread_local = threading.local()
+
+
+def _get_session():
+    session = getattr(_thread_local, 'session', None)
+    if session is None:
+        session = requests.Session()
+        session.headers.update(HEADERS)
+        _thread_local.session = session
+    return session
+
+
+def build_rank_payload(cid, page=1, time_unit="date", start_date="2025-08-28", end_date="2025-08-29",
+                       age="", gender="", device=""):
+    """getCategoryKeywordRank.naver 요청 payload 생성"""
+    return {
+        "cid": cid,
+        "timeUnit": time_unit,
+        "startDate": start_date,
+        "endDate": end_date,
+        "age": age,
+        "gender": gender,
+        "device": device,
+        "page": page,
+    }
+
+
+def fetch_rank_page(cid, page=1, use_cache=True, **params):
+    """
+    한 카테고리의 한 페이지 인기 검색어 순위를 가져오는 함수
+
+    Args:
+        cid (str): 카테고리 ID.
+        page (int, optional): 조회할 페이지 번호. Defaults to 1.
+        use_cache (bool, optional): 디스크 캐시 사용 여부. Defaults to True.
+        **params: build_rank_payload 에 전달할 조회 조건 (time_unit, start_date 등).
+
+    Returns:
+        list: [(rank, keyword), ...] 또는 에러 발생 시 None.
+    """
+    payload = build_rank_payload(cid, page=page, **params)
+    cache = get_rank_cache() if use_cache else None
+    cache_key = RankCache.make_key(payload)
+    if cache is not None:
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    try:
+        with get_host_limiters().slot(RANK_URL) as slot:
+            response = slot.response = _get_session().post(RANK_URL, data=payload, timeout=10)
+            response.raise_for_status()
+        data = response.json()
+    except (requests.exceptions.RequestException, json.JSONDecodeError) as e:
+        print(f"네이버 데이터랩에서 데이터를 가져오는 데 실패했습니다 ({cid}, page={page}): {e}")
+        return None
+
+    ranks = [(item.get('rank'), item.get('keyword')) for item in data.get('ranks', [])]
+    if cache is not None and ranks:
+        try:
+            cache.set(cache_key, ranks)
+        except OSError as e:
+            print(f"데이터랩 순위 캐시 저장 실패: {e}")
+    return ranks
+
+
+def harvest_keyword_ranks(categories=None, pages=(1, 2), max_workers=8, **params):
+    """
+    여러 카테고리 × 페이지의 인기 검색어 순위를 병렬로 수집하는 함수
+
+    Args:
+        categories (dict or list, optional): {이름: cid} 또는 cid 리스트.
+                                             Defaults to TOP_LEVEL_CATEGORIES.
+        pages (iterable, optional): 조회할 페이지 번호들. Defaults to (1, 2).
+        max_workers (int, optional): 동시에 요청할 최대 스레드 수. Defaults to 8.
+        **params: fetch_rank_page 에 전달할 조회 조건.
+
+    Returns:
+        dict: {cid: [(rank, keyword), ...]} - 순위순 정렬, 키워드 중복 제거.
+    """
+    if categories is None:
+        categories = TOP_LEVEL_CATEGORIES
+    cids = list(categories.values()) if isinstance(categories, dict) else list(categories)
+
+    merged = {cid: {} for cid in cids}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(fetch_rank_page, cid, page, **params): cid
+            for cid in cids for page in pages
+        }
+        for future in as_completed(futures):
+            cid = futures[future]
+            ranks = future.result()
+            if not ranks:
+                continue
+            best = merged[cid]
+            for rank, keyword in ranks:
+                if not keyword:
+                    continue
+                # 같은 키워드가 여러 페이지에 걸쳐 나오면 가장 높은 순위만 유지
+                if keyword not in best or (rank is not None and (best[keyword] is None or rank < best[keyword])):
+                    best[keyword] = rank
+
+    result = {}
+    for cid, best in merged.items():
+        result[cid] = sorted(((rank, keyword) for keyword, rank in best.items()),
+                             key=lambda item: (item[0] is None, item[0] or 0))
+    return result
@@ -0,0 +1,153 @@
+import json
+import time
+import urllib.parse
+
+from page_ready import wait_until_ready
+from ssadagu_search import parse_product_list
+
+# 검색 페이지가 결과를 받아오는 무한 스크롤 AJAX API (URL 일부)
+SEARCH_API_FRAGMENT = 'ajax.infinity_shop_list.php'
+
+# 다음 페이지 요청을 일으키는 스크롤
+_SCROLL_SCRIPT = "window.scrollTo(0, document.body.scrollHeight);"
+
+
+def enable_performance_logging(chrome_options):
+    """chrome_options 에 DevTools 네트워크 이벤트를 받는 performance 로그 설정 추가"""
+    chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+    return chrome_options
+
+
+class NetworkCapture:
+    """
+    performance 로그에서 url_fragment 와 맞는 요청의 응답 본문을 꺼내는 도우미
+
+    로그는 읽을 때마다 비워지므로 한 드라이버에 하나만 만들어 계속 poll() 합니다.
+    """
+
+    def __init__(self, driver, url_fragment=SEARCH_API_FRAGMENT):
+        """
+        Args:
+            driver (WebDriver): enable_performance_logging 을 적용해 만든 Chrome 드라이버.
+            url_fragment (str, optional): 잡을 요청 URL 일부. Defaults to SEARCH_API_FRAGMENT.
+        """
+        self.driver = driver
+        self.url_fragment = url_fragment
+        self._requests = {}  # requestId -> 요청 본문 (POST 데이터)
+        self._responded = set()
+
+    def reset(self):
+        """지금까지 쌓인 로그를 버림 (새 페이지를 열기 전에 호출)"""
+        self.driver.get_log('performance')
+        self._requests.clear()
+        self._responded.clear()
+
+    def poll(self):
+        """
+        새로 끝난 요청들의 (요청 POST 데이터, 응답 JSON) 리스트 (요청 순서)
+
+        본문을 JSON 으로 읽지 못한 응답은 건너뜁니다.
+        """
+        finished = []
+        for entry in self.driver.get_log('performance'):
+            try:
+                message = json.loads(entry['message'])['message']
+            except (KeyError, TypeError, ValueError):
+                continue
+            method = message.get('method')
+            params = message.get('params', {})
+            request_id = params.get('requestId')
+            if method == 'Network.requestWillBeSent':
+                request = params.get('request', {})
+                if self.url_fragment in request.get('url', ''):
+                    self._requests[request_id] = request.get('postData', '')
+            elif method == 'Network.responseReceived':
+                if request_id in self._requests:
+                    self._responded.add(request_id)
+            elif method == 'Network.loadingFinished':
+                if request_id in self._responded:
+                    finished.append(request_id)
+
+        results = []
+        for request_id in finished:
+            post_data = self._requests.pop(request_id)
+            self._responded.discard(request_id)
+            payload = self._response_json(request_id)
+            if payload is not None:
+                results.append((post_data, payload))
+        return results
+
+    def _response_json(self, request_id):
+        try:
+            response = self.driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': request_id})
+            return json.loads(response.get('body', ''))
+        except ValueError:
+            print(f"검색 API 응답을 JSON 으로 읽지 못했습니다 (requestId={request_id}).")
+        except Exception as e:
+            print(f"검색 API 응답 본문을 가져오지 못했습니다 (requestId={request_id}): {e}")
+        return None
+
+    def wait(self, timeout=5, poll_frequency=0.2):
+        """새 응답이 들어올 때까지 최대 timeout 초 기다림 (없으면 빈 리스트)"""
+        deadline = time.monotonic() + timeout
+        while True:
+            results = self.poll()
+            if results or time.monotonic() >= deadline:
+                return results
+            time.sleep(poll_frequency)
+
+
+def _request_page(post_data, default):
+    values = urllib.parse.parse_qs(post_data or '').get('page')
+    try:
+        return int(values[0]) if values else default
+    except ValueError:
+        return default
+
+
+def capture_search_products(driver, search_url, max_pages=5, timeout=10, scroll_timeout=5):
+    """
+    검색 페이지를 열고 페이지 스스로 요청한 AJAX 응답에서 상품 정보를 수집
+
+    첫 페이지 응답을 받은 뒤 스크롤로 다음 페이지 요청을 일으키고, max_pages 에 닿거나
+    빈 페이지/실패 응답이 오거나 scroll_timeout 안에 새 응답이 없으면 멈춥니다.
+
+    Args:
+        driver (WebDriver): enable_performance_logging 을 적용해 만든 Chrome 드라이버.
+        search_url (str): 검색 페이지 URL (search.php?ss_tx=...).
+        max_pages (int, optional): 최대 페이지 수. Defaults to 5.
+        timeout (float, optional): 첫 응답을 기다릴 최대 시간(초). Defaults to 10.
+        scroll_timeout (float, optional): 스크롤 후 다음 응답을 기다릴 최대 시간(초). Defaults to 5.
+
+    Returns:
+        list: parse_product_html 결과에 'page' 키를 더한 상품 정보 (페이지 순서).
+    """
+    capture = NetworkCapture(driver)
+    capture.reset()
+    driver.get(search_url)
+    wait_until_ready(driver, 'search', timeout=timeout)
+
+    pages = {}
+    wait_timeout = timeout
+    while len(pages) < max_pages:
+        responses = capture.wait(wait_timeout)
+        if not responses:
+            break
+        finished = False
+        for post_data, payload in responses:
+            if not isinstance(payload, dict) or not payload.get('success') or not payload.get('data'):
+                finished = True
+                continue
+            page = _request_page(post_data, len(pages) + 1)
+            pages.setdefault(page, payload['data'])
+        if finished:
+            break
+        driver.execute_script(_SCROLL_SCRIPT)
+        wait_timeout = scroll_timeout
+
+    products = []
+    for page in sorted(pages)[:max_pages]:
+        for product in parse_product_list(pages[page]):
+            product['page'] = page
+            products.append(product)
+    return products
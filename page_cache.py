@@ -0,0 +1,171 @@
+import copy
+import threading
+import time
+import urllib.parse
+from collections import OrderedDict
+
+from product_identity import product_key
+
+
+def canonical_url(url):
+    """
+    같은 페이지를 가리키는 URL을 하나의 캐시 키로 정규화
+
+    상품 페이지(num_iid 가 있는 URL)는 product_key 의 (platform, num_iid) 만 남기고
+    (platform 이 없으면 기본 플랫폼), 그 외 URL은 쿼리 파라미터를 정렬합니다.
+    스킴/호스트는 소문자로, fragment 는 제거합니다.
+    """
+    parts = urllib.parse.urlsplit(url.strip())
+    key = product_key(url)
+    if key is not None:
+        params = [('platform', key[0]), ('num_iid', key[1])]
+    else:
+        params = sorted(urllib.parse.parse_qsl(parts.query, keep_blank_values=True))
+    return urllib.parse.urlunsplit((
+        (parts.scheme or 'https').lower(),
+        parts.netloc.lower(),
+        parts.path or '/',
+        urllib.parse.urlencode(params),
+        ''
+    ))
+
+
+def _detached(value):
+    # dict/list 파싱 결과는 호출한 쪽이 고쳐도 캐시(와 다른 호출자)에 영향이 없도록 깊은 복사
+    # (soup 같은 파싱 트리는 읽기 전용으로만 쓰므로 그대로 공유)
+    return copy.deepcopy(value) if isinstance(value, (dict, list)) else value
+
+
+def _markup_size(markup):
+    """HTML 의 바이트 크기 (str 은 UTF-8 로 인코딩한 길이)"""
+    return len(markup.encode('utf-8')) if isinstance(markup, str) else len(markup)
+
+
+class PageCache:
+    """
+    정규화한 URL을 키로 원본 HTML(과 선택적으로 파싱 결과)을 보관하는 LRU 캐시
+
+    항목 수와 전체 HTML 크기, TTL 로 제한합니다. 파싱 결과는 같은 항목에 종류별로
+    붙어 있다가 HTML 이 밀려나거나 만료될 때 같이 사라집니다. 스레드 안전합니다.
+    """
+
+    def __init__(self, max_entries=64, max_bytes=64 * 1024 * 1024, ttl=600, cache_parsed=True):
+        """
+        Args:
+            max_entries (int, optional): 최대 페이지 수. Defaults to 64.
+            max_bytes (int, optional): 보관할 HTML 전체 최대 크기 (UTF-8 바이트). Defaults to 64MB.
+            ttl (float, optional): 페이지 유효 시간(초). Defaults to 600.
+            cache_parsed (bool, optional): 파싱 결과도 보관할지 여부. Defaults to True.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.cache_parsed = cache_parsed
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # key -> [markup, size, expires_at, {종류: 파싱 결과}]
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def _live_entry(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[2] <= time.monotonic():
+            self._drop(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _drop(self, key):
+        entry = self._entries.pop(key)
+        self._bytes -= entry[1]
+
+    def get(self, url):
+        """캐시된 HTML 또는 None"""
+        with self._lock:
+            entry = self._live_entry(canonical_url(url))
+            if entry is None or entry[0] is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return entry[0]
+
+    def get_parsed(self, url, kind):
+        """url 페이지에 붙여 둔 kind 파싱 결과 또는 None"""
+        with self._lock:
+            entry = self._live_entry(canonical_url(url))
+            if entry is None or kind not in entry[3]:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return _detached(entry[3][kind])
+
+    def remember(self, url, kind, value):
+        """
+        HTML 없이 파싱 결과만 저장 (브라우저 안에서 바로 추출한 결과 등)
+
+        이미 HTML 항목이 있으면 거기에 붙이고, 없으면 HTML 없는 항목을 새로 만듭니다.
+        """
+        if not self.cache_parsed:
+            return
+        key = canonical_url(url)
+        with self._lock:
+            entry = self._live_entry(key)
+            if entry is None:
+                entry = [None, 0, time.monotonic() + self.ttl, {}]
+                self._entries[key] = entry
+                while len(self._entries) > self.max_entries:
+                    self._drop(next(iter(self._entries)))
+            entry[3][kind] = _detached(value)
+
+    def put(self, url, markup):
+        """HTML 저장 (너무 크면 저장하지 않음)"""
+        size = _markup_size(markup)
+        if size > self.max_bytes:
+            return
+        key = canonical_url(url)
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = [markup, size, time.monotonic() + self.ttl, {}]
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+
+    def parsed(self, url, kind, build):
+        """
+        url 페이지의 kind 파싱 결과 (없으면 build() 로 만들어 HTML 항목에 붙여둠)
+
+        HTML 이 캐시에 없거나 cache_parsed 가 꺼져 있으면 저장하지 않고 build() 결과만 반환합니다.
+        """
+        if not self.cache_parsed:
+            return build()
+        key = canonical_url(url)
+        with self._lock:
+            entry = self._live_entry(key)
+            if entry is not None and kind in entry[3]:
+                return _detached(entry[3][kind])
+
+        value = build()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry[3][kind] = _detached(value)
+        return value
+
+    def invalidate(self, url):
+        """url 페이지를 캐시에서 제거"""
+        with self._lock:
+            key = canonical_url(url)
+            if key in self._entries:
+                self._drop(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
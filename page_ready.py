@@ -0,0 +1,155 @@
+import time
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.support.ui import WebDriverWait
+
+from product_extractor import PRICE_SELECTORS
+
+# 페이지 종류별 준비 조건 (CSS 셀렉터)
+#   all: 모두 있어야 함 / any: 하나 이상 있어야 함
+#   late: 늦게 그려지는 요소 - 나타날 때까지 late_timeout 초까지 따로 기다림
+#         (옵션 목록은 제목/가격보다 늦게 그려져 optional 의 짧은 settle 로는 놓칠 수 있음,
+#          끝내 안 나타나면 옵션 없는 상품으로 보고 optional 도 기다리지 않음)
+#   optional: 하나라도 나타나면 바로, 아니면 settle 초까지만 기다림 (없는 상품도 있는 요소)
+READY_CONDITIONS = {
+    'product': {
+        'all': ('h1#kakaotitle',),
+        'any': PRICE_SELECTORS,
+        'late': ('ul#skubox li',),
+        'optional': ('.pro-info-item', "img[id^='img_translate_']"),
+    },
+    'search': {
+        'all': (),
+        'any': ("a[href*='view.php']",),
+        'late': (),
+        'optional': (),
+    },
+}
+
+# 셀렉터 목록을 한 번의 execute_script 로 확인
+_READY_SCRIPT = """
+var all = arguments[0], any = arguments[1];
+if (document.readyState === 'loading') return false;
+for (var i = 0; i < all.length; i++) {
+    if (!document.querySelector(all[i])) return false;
+}
+if (!any.length) return true;
+for (var j = 0; j < any.length; j++) {
+    if (document.querySelector(any[j])) return true;
+}
+return false;
+"""
+
+
+# 현재 문서를 받을 때의 HTTP 상태 코드 (Navigation Timing responseStatus, Chrome 109+ / 모르면 null)
+_STATUS_SCRIPT = """
+var entries = performance.getEntriesByType('navigation');
+if (!entries.length || !entries[0].responseStatus) return null;
+return entries[0].responseStatus;
+"""
+
+
+class PageStatusError(Exception):
+    """브라우저로 연 페이지가 오류 상태 코드(4xx/5xx)로 응답함"""
+
+    def __init__(self, url, status):
+        super().__init__(f"페이지 응답 상태 {status}: {url}")
+        self.url = url
+        self.status = status
+
+
+def navigation_status(driver):
+    """driver 가 연 페이지의 HTTP 상태 코드 (브라우저가 알려주지 않으면 None)"""
+    try:
+        return driver.execute_script(_STATUS_SCRIPT)
+    except WebDriverException:
+        return None
+
+
+def _script_condition(all_selectors, any_selectors):
+    def condition(driver):
+        try:
+            return driver.execute_script(_READY_SCRIPT, list(all_selectors), list(any_selectors))
+        except WebDriverException:
+            return False
+    return condition
+
+
+def wait_until_ready(driver, page_type, timeout=10, late_timeout=1, settle=0.5, poll_frequency=0.1):
+    """
+    page_type 페이지에서 추출할 요소가 나타날 때까지 기다림
+
+    필수 요소가 timeout 안에 나타나지 않으면 경고만 출력하고 False 를 반환합니다
+    (호출한 쪽은 그때의 page_source 로 계속 진행).
+
+    Args:
+        driver (WebDriver): 페이지를 연 드라이버.
+        page_type (str): READY_CONDITIONS 의 키 ('product', 'search').
+        timeout (float, optional): 필수 요소를 기다릴 최대 시간(초). Defaults to 10.
+        late_timeout (float, optional): 필수 요소 뒤에 늦게 그려지는 요소(상품 옵션)를 기다릴 최대 시간(초).
+                                        옵션이 없는 상품은 이만큼만 더 기다리고 settle 은 건너뜁니다. Defaults to 1.
+        settle (float, optional): 선택 요소를 추가로 기다릴 최대 시간(초). Defaults to 0.5.
+        poll_frequency (float, optional): 확인 간격(초). Defaults to 0.1.
+
+    Returns:
+        bool: 필수 요소가 모두 나타났으면 True, 시간 초과면 False.
+    """
+    conditions = READY_CONDITIONS[page_type]
+    started = time.monotonic()
+    try:
+        WebDriverWait(driver, timeout, poll_frequency).until(
+            _script_condition(conditions['all'], conditions['any'])
+        )
+    except TimeoutException:
+        print(f"'{page_type}' 페이지 준비 대기 시간 초과 ({timeout}초) → 현재 페이지로 진행합니다.")
+        return False
+
+    remaining = min(late_timeout, timeout - (time.monotonic() - started))
+    if conditions['late'] and remaining > 0:
+        try:
+            WebDriverWait(driver, remaining, poll_frequency).until(
+                _script_condition((), conditions['late'])
+            )
+        except TimeoutException:
+            # 옵션이 없는 상품 - 이미 late_timeout 만큼 기다렸으므로 선택 요소는 더 기다리지 않음
+            return True
+
+    remaining = min(settle, timeout - (time.monotonic() - started))
+    if conditions['optional'] and remaining > 0:
+        try:
+            WebDriverWait(driver, remaining, poll_frequency).until(
+                _script_condition((), conditions['optional'])
+            )
+        except TimeoutException:
+            pass
+    return True
+
+
+def open_page(driver, url, page_type, slot=None, **wait_options):
+    """
+    driver 로 url 을 열고 page_type 준비 조건까지 기다림
+
+    slot (AdaptiveLimiter.slot() 의 기록 객체) 을 주면 페이지의 HTTP 상태 코드를 적어
+    429/5xx 가 동시 요청 수 조절에 반영되게 합니다. 오류 상태 페이지는 기다리거나
+    추출하지 않고 PageStatusError 를 던집니다.
+
+    Args:
+        driver (WebDriver): 페이지를 열 드라이버.
+        url (str): 열 URL.
+        page_type (str): READY_CONDITIONS 의 키 ('product', 'search').
+        slot (optional): 상태 코드를 적을 slot.
+        **wait_options: wait_until_ready 에 넘길 인자 (timeout 등).
+
+    Returns:
+        bool: 필수 요소가 모두 나타났으면 True.
+
+    Raises:
+        PageStatusError: 페이지가 4xx/5xx 로 응답한 경우.
+    """
+    driver.get(url)
+    status = navigation_status(driver)
+    if slot is not None:
+        slot.status = status
+    if status is not None and status >= 400:
+        raise PageStatusError(url, status)
+    return wait_until_ready(driver, page_type, **wait_options)
@@ -0,0 +1,454 @@
+import re
+from html.parser import HTMLParser
+
+from bs4.dammit import UnicodeDammit
+
+from selector_planner import first_hit
+
+# BeautifulSoup(html.parser)과 같은 규칙: 닫는 태그가 없는 요소, get_text()에서 빠지는 요소
+VOID_ELEMENTS = {
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'keygen', 'link', 'menuitem',
+    'meta', 'param', 'source', 'track', 'wbr', 'basefont', 'bgsound', 'command', 'frame',
+    'image', 'isindex', 'nextid', 'spacer'
+}
+HIDDEN_TEXT_ELEMENTS = {'script', 'style', 'template'}
+
+TITLE_CLASS_RE = re.compile(r'title|name')
+STAR_CLASS_RE = re.compile(r'star|rating')
+OPTION_CLASS_RE = re.compile(r'imgWrapper')
+IMAGE_ID_RE = re.compile(r'img_translate_\d+')
+STOCK_RE = re.compile(r'재고\s*:\s*(\d+)')
+PRICE_RE = re.compile(r'(\d+)')
+
+# 가격 후보 셀렉터 (기본 우선순위 순서)
+PRICE_SELECTORS = (
+    'span.price.gsItemPriceKWR',
+    '.pdt_price span.price',
+    'span.price',
+    '.price',
+)
+
+# 제목 후보 셀렉터 (기본 우선순위 순서, 마지막은 class에 title|name 이 들어간 div)
+TITLE_SELECTORS = (
+    'h1#kakaotitle',
+    'h1',
+    'title',
+    'div.title|name',
+)
+NO_TITLE = "제목 없음"
+
+
+def find_title_element(soup, selector):
+    """TITLE_SELECTORS 의 셀렉터로 soup 에서 제목 후보 요소 찾기"""
+    if selector == TITLE_SELECTORS[3]:
+        return soup.find('div', class_=TITLE_CLASS_RE)
+    return soup.select_one(selector)
+
+
+def title_from_text(text):
+    """제목 후보 텍스트 (비었거나 '제목 없음'이면 None)"""
+    return text if text and text != NO_TITLE else None
+
+
+def price_from_text(text):
+    """가격 후보 텍스트에서 숫자 가격 (텍스트나 숫자가 없으면 None)"""
+    if text is None:
+        return None
+    price_match = PRICE_RE.search(text.replace(',', '').replace('원', ''))
+    return int(price_match.group(1)) if price_match else None
+
+
+def element_title(element):
+    """제목 후보 요소의 텍스트 (요소가 없거나 비었으면 None)"""
+    return title_from_text(element.get_text(strip=True)) if element else None
+
+
+def element_price(element):
+    """가격 후보 요소의 숫자 가격 (요소가 없거나 숫자가 없으면 None)"""
+    return price_from_text(element.get_text(strip=True)) if element else None
+
+
+def _class_matches(class_value, expected):
+    """BeautifulSoup class_ 조건 비교 (개별 class 또는 전체 문자열)"""
+    if class_value is None:
+        return False
+    candidates = class_value.split() + [class_value]
+    if isinstance(expected, re.Pattern):
+        return any(expected.search(candidate) for candidate in candidates)
+    return expected in candidates
+
+
+class _Capture:
+    """열려 있는 동안 안쪽 텍스트를 모으는 요소"""
+
+    __slots__ = ('parts', 'stars', 'option_title', 'option_image', 'info_title', 'info_value')
+
+    def __init__(self):
+        self.parts = []
+        self.stars = 0.0
+        self.option_title = None
+        self.option_image = None
+        self.info_title = None
+        self.info_value = None
+
+    def text(self, strip=False):
+        if strip:
+            return ''.join(part.strip() for part in self.parts if part.strip())
+        return ''.join(self.parts)
+
+
+class _Element:
+    __slots__ = ('tag', 'captures', 'flags')
+
+    def __init__(self, tag):
+        self.tag = tag
+        self.captures = []
+        self.flags = 0
+
+
+# _Element.flags 비트
+_IN_PDT_PRICE = 1
+_IN_SKUBOX = 2
+_HIDDEN = 4
+
+
+class ProductPageVisitor(HTMLParser):
+    """
+    상품 상세 페이지를 한 번만 훑으면서 extract_product_data 에 필요한 모든 필드를 모으는 파서
+
+    트리를 만들지 않고 시작/끝 태그 이벤트에서 바로 제목 후보, 가격 셀렉터별 첫 요소,
+    별점 컨테이너, skubox 옵션, pro-info-item, img_translate_* 를 수집합니다.
+    닫는 태그 처리와 get_text() 규칙은 BeautifulSoup(html.parser)과 같게 맞췄습니다.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.stack = []
+        self.captures = []
+        self.pending_text = []
+        self.pdt_price_depth = 0
+        self.hidden_depth = 0
+        self.skubox_open = False
+        self.skubox_seen = False
+        # 이미 닫힌 것으로 처리한 빈 요소 (뒤따르는 </img> 등은 텍스트를 나누지 않고 무시)
+        self.already_closed = []
+
+        # 첫 번째로 일치한 요소만 사용하는 항목들
+        self.firsts = {}
+        self.option_captures = []
+        self.info_captures = []
+        self.open_info_captures = []
+        self.open_option_captures = []
+        self.open_star_captures = []
+        self.images = []
+
+    # --- 텍스트 처리 ---
+    def _flush_text(self):
+        if not self.pending_text:
+            return
+        text = ''.join(self.pending_text)
+        self.pending_text = []
+        if self.hidden_depth:
+            # script/style 안의 텍스트는 그 요소 자신의 get_text()에만 포함됨
+            if self.stack and self.stack[-1].flags & _HIDDEN:
+                for capture in self.stack[-1].captures:
+                    capture.parts.append(text)
+            return
+        for capture in self.captures:
+            capture.parts.append(text)
+
+    def handle_data(self, data):
+        self.pending_text.append(data)
+
+    def handle_comment(self, data):
+        self._flush_text()
+
+    def handle_decl(self, decl):
+        self._flush_text()
+
+    def handle_pi(self, data):
+        self._flush_text()
+
+    # --- 요소 처리 ---
+    def _first(self, key, element):
+        """key에 해당하는 첫 번째 요소면 캡처를 열어 반환"""
+        if key in self.firsts:
+            return None
+        capture = _Capture()
+        self.firsts[key] = capture
+        element.captures.append(capture)
+        return capture
+
+    def handle_starttag(self, tag, attrs, self_closing=False):
+        self._flush_text()
+        attrs = {name: ('' if value is None else value) for name, value in attrs}
+        class_value = attrs.get('class')
+        classes = class_value.split() if class_value else ()
+
+        if tag in VOID_ELEMENTS:
+            self._handle_void(tag, attrs, class_value)
+            if not self_closing:
+                self.already_closed.append(tag)
+            return
+
+        element = _Element(tag)
+
+        # 1. 제목 후보
+        if tag == 'h1':
+            if attrs.get('id') == 'kakaotitle':
+                self._first(TITLE_SELECTORS[0], element)
+            self._first(TITLE_SELECTORS[1], element)
+        elif tag == 'title':
+            self._first(TITLE_SELECTORS[2], element)
+        elif tag == 'div' and _class_matches(class_value, TITLE_CLASS_RE):
+            self._first(TITLE_SELECTORS[3], element)
+
+        # 2. 가격 셀렉터
+        if 'price' in classes:
+            if tag == 'span':
+                if 'gsItemPriceKWR' in classes:
+                    self._first(PRICE_SELECTORS[0], element)
+                if self.pdt_price_depth:
+                    self._first(PRICE_SELECTORS[1], element)
+                self._first(PRICE_SELECTORS[2], element)
+            self._first(PRICE_SELECTORS[3], element)
+        if 'pdt_price' in classes:
+            element.flags |= _IN_PDT_PRICE
+            self.pdt_price_depth += 1
+
+        # 3. 별점 컨테이너
+        star_keys = []
+        if tag == 'a' and _class_matches(class_value, 'start'):
+            star_keys.append('star_a_start')
+        if tag == 'div' and _class_matches(class_value, STAR_CLASS_RE):
+            star_keys.append('star_div')
+        if tag == 'a' and attrs.get('href') == '#reviews_wrap':
+            star_keys.append('star_a_reviews')
+        for key in star_keys:
+            capture = self._first(key, element)
+            if capture is not None:
+                self.open_star_captures.append(capture)
+
+        # 4. 옵션 (첫 번째 ul#skubox 안의 li.imgWrapper*)
+        if tag == 'ul' and attrs.get('id') == 'skubox' and not self.skubox_seen:
+            self.skubox_seen = True
+            self.skubox_open = True
+            element.flags |= _IN_SKUBOX
+        elif self.skubox_open and tag == 'li' and _class_matches(class_value, OPTION_CLASS_RE):
+            capture = _Capture()
+            element.captures.append(capture)
+            self.option_captures.append(capture)
+            self.open_option_captures.append(capture)
+        if tag == 'a' and 'title' in attrs:
+            for capture in self.open_option_captures:
+                if capture.option_title is None:
+                    capture.option_title = attrs['title']
+
+        # 5. 재료 정보 (div.pro-info-item 안의 첫 title/info div)
+        if tag == 'div':
+            if _class_matches(class_value, 'pro-info-title'):
+                for capture in self.open_info_captures:
+                    if capture.info_title is None:
+                        capture.info_title = _Capture()
+                        element.captures.append(capture.info_title)
+            if _class_matches(class_value, 'pro-info-info'):
+                for capture in self.open_info_captures:
+                    if capture.info_value is None:
+                        capture.info_value = _Capture()
+                        element.captures.append(capture.info_value)
+            if _class_matches(class_value, 'pro-info-item'):
+                capture = _Capture()
+                self.info_captures.append(capture)
+                self.open_info_captures.append(capture)
+                element.captures.append(capture)
+
+        if tag in HIDDEN_TEXT_ELEMENTS:
+            element.flags |= _HIDDEN
+            self.hidden_depth += 1
+
+        self.stack.append(element)
+        self.captures.extend(element.captures)
+
+    def _handle_void(self, tag, attrs, class_value):
+        # 텍스트가 없는 요소도 '.price' 의 첫 번째 일치 요소가 될 수 있음
+        if class_value and 'price' in class_value.split() and PRICE_SELECTORS[3] not in self.firsts:
+            self.firsts[PRICE_SELECTORS[3]] = _Capture()
+        if tag != 'img':
+            return
+        src = attrs.get('src', '')
+
+        for capture in self.open_star_captures:
+            if 'icon_star.svg' in src:
+                capture.stars += 1
+            elif 'icon_star_half.svg' in src:
+                capture.stars += 0.5
+
+        if _class_matches(class_value, 'colorSpec_hashPic'):
+            for capture in self.open_option_captures:
+                if capture.option_image is None:
+                    capture.option_image = src
+
+        element_id = attrs.get('id')
+        if element_id is not None and IMAGE_ID_RE.search(element_id):
+            self.images.append(src)
+
+    def handle_startendtag(self, tag, attrs):
+        # <div/> 처럼 스스로 닫힌 태그는 열고 바로 닫음
+        self.handle_starttag(tag, attrs, self_closing=True)
+        if tag not in VOID_ELEMENTS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        if tag in self.already_closed:
+            self.already_closed.remove(tag)
+            return
+        self._flush_text()
+        if tag in VOID_ELEMENTS:
+            return
+        # BeautifulSoup 과 같이 가장 가까운 같은 이름의 요소까지 닫고, 없으면 무시
+        for i in range(len(self.stack) - 1, -1, -1):
+            if self.stack[i].tag == tag:
+                while len(self.stack) > i:
+                    self._pop()
+                return
+
+    def _pop(self):
+        element = self.stack.pop()
+        if element.captures:
+            closed = element.captures
+            self.captures = [capture for capture in self.captures if capture not in closed]
+            self.open_star_captures = [c for c in self.open_star_captures if c not in closed]
+            self.open_option_captures = [c for c in self.open_option_captures if c not in closed]
+            self.open_info_captures = [c for c in self.open_info_captures if c not in closed]
+        if element.flags & _IN_PDT_PRICE:
+            self.pdt_price_depth -= 1
+        if element.flags & _IN_SKUBOX:
+            self.skubox_open = False
+        if element.flags & _HIDDEN:
+            self.hidden_depth -= 1
+
+    def close(self):
+        super().close()
+        self._flush_text()
+        while self.stack:
+            self._pop()
+
+
+def extract_product_fields(markup, base_url="https://ssadagu.kr", selectors=None, kakaotitle_only=False):
+    """
+    상품 상세 페이지 HTML을 한 번 순회해 extract_product_data 와 같은 필드를 추출
+
+    Args:
+        markup (str or bytes): 상품 페이지 HTML.
+        base_url (str, optional): '/'로 시작하는 이미지 주소에 붙일 사이트 주소.
+        selectors (SelectorRegistry, optional): 제목/가격 셀렉터 적중 통계를 기록할 레지스트리.
+        kakaotitle_only (bool, optional): True면 제목은 h1#kakaotitle 만 보고 대체 셀렉터를 시도하지 않음.
+
+    Returns:
+        dict: {'kakaotitle', 'title', 'price', 'rating', 'options', 'material_info', 'product_images'}
+              kakaotitle 은 h1#kakaotitle 의 텍스트(없으면 None), title 은 대체 제목까지 적용한 값.
+    """
+    if isinstance(markup, bytes):
+        markup = UnicodeDammit(markup, is_html=True).unicode_markup
+
+    visitor = ProductPageVisitor()
+    visitor.feed(markup)
+    visitor.close()
+    firsts = visitor.firsts
+    rating = 0.0
+    for key in ('star_a_start', 'star_div', 'star_a_reviews'):
+        if key in firsts:
+            rating = firsts[key].stars
+            break
+
+    return assemble_product_fields(
+        {key: capture.text(strip=True) for key, capture in firsts.items()},
+        rating,
+        [(capture.option_title, capture.text(), capture.option_image) for capture in visitor.option_captures],
+        [
+            (capture.info_title.text(strip=True), capture.info_value.text(strip=True))
+            for capture in visitor.info_captures
+            if capture.info_title is not None and capture.info_value is not None
+        ],
+        visitor.images,
+        base_url,
+        selectors,
+        kakaotitle_only,
+    )
+
+
+def assemble_product_fields(texts, rating, raw_options, info_pairs, image_srcs,
+                            base_url="https://ssadagu.kr", selectors=None, kakaotitle_only=False):
+    """
+    페이지에서 모은 원재료로 extract_product_fields 결과 dict 구성
+
+    Args:
+        texts (dict): TITLE_SELECTORS / PRICE_SELECTORS 셀렉터별 첫 요소의 텍스트 (get_text(strip=True)).
+            요소가 없는 셀렉터는 키가 없거나 None.
+        rating (float): 별점.
+        raw_options (list): skubox 옵션 항목별 (a[title] 의 title 또는 None, 항목 전체 텍스트, 옵션 이미지 src 또는 None).
+        info_pairs (list): pro-info-item 별 (제목 텍스트, 내용 텍스트).
+        image_srcs (list): img_translate_* 이미지의 src 속성.
+        base_url (str, optional): '/'로 시작하는 이미지 주소에 붙일 사이트 주소.
+        selectors (SelectorRegistry, optional): 제목/가격 셀렉터 적중 통계를 기록할 레지스트리.
+        kakaotitle_only (bool, optional): True면 제목은 h1#kakaotitle 만 보고 (없으면 '제목 없음') 대체 셀렉터를 시도하지 않음.
+
+    Returns:
+        dict: extract_product_fields 와 같은 형태.
+    """
+    def resolve(name, candidates, probe):
+        if selectors is None:
+            return first_hit(candidates, probe)
+        return selectors.resolve(name, candidates, probe)
+
+    # 1. 상품명 (h1#kakaotitle → h1 → title → div.title|name)
+    kakaotitle = texts.get(TITLE_SELECTORS[0])
+    if kakaotitle_only:
+        title = kakaotitle if kakaotitle is not None else NO_TITLE
+    else:
+        title = resolve('title', TITLE_SELECTORS, lambda selector: title_from_text(texts.get(selector))) or NO_TITLE
+
+    # 2. 가격
+    price = resolve('price', PRICE_SELECTORS, lambda selector: price_from_text(texts.get(selector))) or 0
+
+    # 3. 옵션
+    options = []
+    for option_title, item_text, option_image in raw_options:
+        if option_title is None:
+            continue
+        option_name = option_title.strip()
+        stock_match = STOCK_RE.search(item_text)
+        if option_name:
+            options.append({
+                'name': option_name,
+                'stock': int(stock_match.group(1)) if stock_match else 0,
+                'image_url': option_image or ""
+            })
+
+    # 4. 재료 정보
+    material_info = {}
+    for info_title, info_value in info_pairs:
+        material_info[info_title] = info_value
+
+    # 5. 상품 이미지 (URL 정규화)
+    product_images = []
+    for src in image_srcs:
+        if not src:
+            continue
+        if src.startswith('//'):
+            src = 'https:' + src
+        elif src.startswith('/'):
+            src = base_url + src
+        elif not src.startswith('http'):
+            continue
+        product_images.append(src)
+
+    return {
+        'kakaotitle': kakaotitle,
+        'title': title,
+        'price': price,
+        'rating': rating,
+        'options': options,
+        'material_info': material_info,
+        'product_images': product_images,
+    }
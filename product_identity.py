@@ -0,0 +1,195 @@
+import hashlib
+import math
+import os
+import sqlite3
+import struct
+import threading
+import time
+import urllib.parse
+
+from ssadagu_search import BASE_URL, DEFAULT_PLATFORM
+
+
+def product_key(url):
+    """
+    상품 URL 의 (platform, num_iid)
+
+    ss_tx 같은 검색/추적 파라미터와 스킴/호스트 차이는 무시합니다.
+    platform 이 없으면 검색 기본 플랫폼으로 봅니다.
+
+    Returns:
+        tuple: (platform, num_iid) 또는 num_iid 가 없으면 None.
+    """
+    query = urllib.parse.parse_qs(urllib.parse.urlsplit(url.strip()).query)
+    num_iid = (query.get('num_iid') or [''])[0].strip()
+    if not num_iid:
+        return None
+    platform = (query.get('platform') or [''])[0].strip() or DEFAULT_PLATFORM
+    return platform, num_iid
+
+
+def product_url(key, base_url=BASE_URL):
+    """(platform, num_iid) 의 정규화한 상세 페이지 URL"""
+    platform, num_iid = key
+    return f"{base_url}/shop/view.php?" + urllib.parse.urlencode({'platform': platform, 'num_iid': num_iid})
+
+
+def dedupe_product_urls(urls):
+    """같은 상품 (platform, num_iid) 을 가리키는 URL 중 처음 것만 남김 (순서 유지, 상품 번호가 없는 URL 은 문자열로 비교)"""
+    seen = set()
+    unique = []
+    for url in urls:
+        key = product_key(url) or url
+        if key in seen:
+            continue
+        seen.add(key)
+        unique.append(url)
+    return unique
+
+
+class BloomFilter:
+    """
+    고정 크기 비트 배열 블룸 필터
+
+    없다고 하면 확실히 없고, 있다고 하면 error_rate 확률로 틀릴 수 있습니다.
+    """
+
+    def __init__(self, capacity=1_000_000, error_rate=0.001):
+        """
+        Args:
+            capacity (int, optional): 예상 항목 수. Defaults to 1,000,000.
+            error_rate (float, optional): capacity 개일 때 거짓 양성 비율. Defaults to 0.001.
+        """
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item):
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1, h2 = struct.unpack('<QQ', digest)
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, item):
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+    def save(self, path, tag=0):
+        """비트 배열을 파일로 저장 (tag 는 load 때 같은지 확인할 값)"""
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(struct.pack('<QdQQq', self.capacity, self.error_rate, self.num_hashes, self.count, tag))
+            f.write(self.bits)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path, tag=0):
+        """save 한 필터 (파일이 없거나 깨졌거나 tag 가 다르면 None)"""
+        header_size = struct.calcsize('<QdQQq')
+        try:
+            with open(path, 'rb') as f:
+                capacity, error_rate, num_hashes, count, saved_tag = struct.unpack('<QdQQq', f.read(header_size))
+                bits = f.read()
+        except (OSError, struct.error):
+            return None
+        bloom = cls(capacity, error_rate)
+        if saved_tag != tag or num_hashes != bloom.num_hashes or len(bits) != len(bloom.bits):
+            return None
+        bloom.bits = bytearray(bits)
+        bloom.count = count
+        return bloom
+
+
+def _item(key):
+    return f"{key[0]}:{key[1]}"
+
+
+class SeenProducts:
+    """
+    여러 실행에 걸쳐 이미 크롤링한 상품 (platform, num_iid) 집합
+
+    정확한 기록(마지막 크롤링 시각)은 SQLite 에 두고, 앞에 블룸 필터를 두어 처음 보는 상품은
+    DB 조회 없이 바로 걸러냅니다. 블룸 필터는 close() 때 '<path>.bloom' 으로 저장하고,
+    저장 뒤 DB 가 바뀌었으면 (중간에 죽은 경우 등) 다음에 열 때 DB 에서 다시 만듭니다.
+    """
+
+    def __init__(self, path='seen_products.db', max_age=24 * 3600, capacity=1_000_000):
+        """
+        Args:
+            path (str, optional): SQLite 파일 경로. Defaults to 'seen_products.db'.
+            max_age (float, optional): 이 시간(초) 안에 크롤링한 상품은 다시 크롤링하지 않음. Defaults to 하루.
+            capacity (int, optional): 블룸 필터 예상 상품 수. Defaults to 1,000,000.
+        """
+        self.path = path
+        self.bloom_path = path + '.bloom'
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS seen ("
+            "platform TEXT NOT NULL, num_iid TEXT NOT NULL, crawled_at REAL NOT NULL, "
+            "PRIMARY KEY (platform, num_iid))"
+        )
+        rows = self._row_count()
+        self.bloom = BloomFilter.load(self.bloom_path, tag=rows)
+        if self.bloom is None:
+            self.bloom = BloomFilter(max(capacity, rows * 2))
+            for platform, num_iid in self._conn.execute("SELECT platform, num_iid FROM seen"):
+                self.bloom.add(_item((platform, num_iid)))
+
+    def _row_count(self):
+        return self._conn.execute("SELECT COUNT(*) FROM seen").fetchone()[0]
+
+    def last_crawled(self, url):
+        """url 상품을 마지막으로 크롤링한 시각 (처음 보는 상품이면 None)"""
+        key = product_key(url)
+        if key is None:
+            return None
+        with self._lock:
+            if _item(key) not in self.bloom:
+                return None
+            row = self._conn.execute(
+                "SELECT crawled_at FROM seen WHERE platform = ? AND num_iid = ?", key
+            ).fetchone()
+        return row[0] if row else None
+
+    def is_fresh(self, url):
+        """max_age 안에 크롤링한 상품인지 여부"""
+        crawled_at = self.last_crawled(url)
+        return crawled_at is not None and (self.max_age is None or time.time() - crawled_at < self.max_age)
+
+    def unseen(self, urls):
+        """urls 에서 같은 상품 중복과 최근에 크롤링한 상품을 뺀 목록 (순서 유지)"""
+        return [url for url in dedupe_product_urls(urls) if not self.is_fresh(url)]
+
+    def mark(self, url, crawled_at=None):
+        """url 상품을 크롤링했다고 기록"""
+        key = product_key(url)
+        if key is None:
+            return
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO seen (platform, num_iid, crawled_at) VALUES (?, ?, ?) "
+                "ON CONFLICT (platform, num_iid) DO UPDATE SET crawled_at = excluded.crawled_at",
+                (key[0], key[1], crawled_at or time.time())
+            )
+            self.bloom.add(_item(key))
+
+    def close(self):
+        """블룸 필터를 저장하고 DB 를 닫음"""
+        with self._lock:
+            if self._conn is None:
+                return
+            try:
+                self.bloom.save(self.bloom_path, tag=self._row_count())
+            except OSError as e:
+                print(f"블룸 필터 저장 실패: {e}")
+            self._conn.close()
+            self._conn = None
@@ -0,0 +1,155 @@
+import re
+
+from bs4 import BeautifulSoup
+
+# 선택 가능한 파서 백엔드 (없는 라이브러리는 사용할 때 에러)
+try:
+    import lxml  # noqa: F401  BeautifulSoup의 'lxml' 트리 빌더가 사용
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    LexborHTMLParser = None
+    SELECTOLAX_AVAILABLE = False
+
+PARSER_BACKENDS = ('html.parser', 'lxml', 'selectolax')
+DEFAULT_BACKEND = 'html.parser'
+
+
+def available_backends():
+    """현재 환경에서 사용할 수 있는 백엔드 목록"""
+    backends = ['html.parser']
+    if LXML_AVAILABLE:
+        backends.append('lxml')
+    if SELECTOLAX_AVAILABLE:
+        backends.append('selectolax')
+    return backends
+
+
+def best_backend():
+    """사용 가능한 백엔드 중 가장 빠른 것"""
+    return available_backends()[-1]
+
+
+def make_soup(markup, backend=DEFAULT_BACKEND):
+    """
+    지정한 백엔드로 HTML을 파싱해 SSADAGUCrawler 추출 함수들이 쓰는 객체를 반환
+
+    'html.parser' / 'lxml' 은 BeautifulSoup 객체를, 'selectolax' 는 추출 함수가 사용하는
+    BeautifulSoup 메서드(find, find_all, select_one, get, get_text)만 제공하는
+    SelectolaxNode 를 반환합니다. 어느 백엔드든 추출 결과는 같습니다.
+    """
+    if backend == 'html.parser':
+        return BeautifulSoup(markup, 'html.parser')
+    if backend == 'lxml':
+        if not LXML_AVAILABLE:
+            raise ValueError("lxml 백엔드를 사용하려면 pip install lxml 을 실행해주세요.")
+        return BeautifulSoup(markup, 'lxml')
+    if backend == 'selectolax':
+        if not SELECTOLAX_AVAILABLE:
+            raise ValueError("selectolax 백엔드를 사용하려면 pip install selectolax 를 실행해주세요.")
+        if isinstance(markup, bytes):
+            markup = markup.decode('utf-8', errors='replace')
+        return SelectolaxNode(LexborHTMLParser(markup))
+    raise ValueError(f"지원하지 않는 파서 백엔드입니다: {backend} (가능: {', '.join(PARSER_BACKENDS)})")
+
+
+def _match_value(expected, value, is_class=False):
+    """BeautifulSoup 의 속성 조건 비교 규칙"""
+    if expected is True:
+        return value is not None
+    if expected is None:
+        return value is None
+    if value is None:
+        return False
+
+    candidates = [value]
+    if is_class:
+        # class 는 개별 값 하나 또는 전체 문자열 중 하나라도 맞으면 일치
+        candidates = value.split() + [value]
+
+    for candidate in candidates:
+        if isinstance(expected, re.Pattern):
+            if expected.search(candidate):
+                return True
+        elif candidate == expected:
+            return True
+    return False
+
+
+class SelectolaxNode:
+    """selectolax 노드를 BeautifulSoup 처럼 다루기 위한 최소 어댑터"""
+
+    def __init__(self, node):
+        self._node = node
+
+    def __bool__(self):
+        return True
+
+    def __str__(self):
+        return self._node.html or ''
+
+    def __getitem__(self, key):
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def has_attr(self, key):
+        return key in self.attrs
+
+    @property
+    def attrs(self):
+        return getattr(self._node, 'attributes', {}) or {}
+
+    @property
+    def name(self):
+        return getattr(self._node, 'tag', None)
+
+    def get(self, key, default=None):
+        value = self.attrs.get(key, default)
+        # 값 없는 속성은 BeautifulSoup 과 같이 빈 문자열로
+        return '' if value is None and key in self.attrs else value
+
+    def get_text(self, separator='', strip=False):
+        return self._node.text(deep=True, separator=separator, strip=strip)
+
+    @property
+    def text(self):
+        return self.get_text()
+
+    def select_one(self, selector):
+        node = self._node.css_first(selector)
+        return SelectolaxNode(node) if node is not None else None
+
+    def select(self, selector):
+        return [SelectolaxNode(node) for node in self._node.css(selector)]
+
+    def _iter_matches(self, name, attrs, class_, kwargs):
+        conditions = dict(attrs or {})
+        conditions.update(kwargs)
+        if class_ is not None:
+            conditions['class'] = class_
+
+        for node in self._node.css(name or '*'):
+            node_attrs = node.attributes
+            matched = True
+            for key, expected in conditions.items():
+                value = node_attrs.get(key)
+                if value is None and key in node_attrs:
+                    value = ''
+                if not _match_value(expected, value, is_class=(key == 'class')):
+                    matched = False
+                    break
+            if matched:
+                yield SelectolaxNode(node)
+
+    def find_all(self, name=None, attrs=None, class_=None, **kwargs):
+        return list(self._iter_matches(name, attrs, class_, kwargs))
+
+    def find(self, name=None, attrs=None, class_=None, **kwargs):
+        return next(self._iter_matches(name, attrs, class_, kwargs), None)
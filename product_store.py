@@ -0,0 +1,267 @@
+import json
+import sqlite3
+import threading
+import time
+
+from crawl_frontier import json_default
+from product_identity import product_key
+from ssadagu_search import DEFAULT_PLATFORM
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS products (
+    platform TEXT NOT NULL,
+    num_iid TEXT NOT NULL,
+    url TEXT NOT NULL,
+    title TEXT,
+    price INTEGER,
+    rating REAL,
+    crawled_at TEXT,
+    first_stored_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    extra TEXT,
+    PRIMARY KEY (platform, num_iid)
+);
+CREATE INDEX IF NOT EXISTS products_price ON products (price);
+CREATE INDEX IF NOT EXISTS products_crawled_at ON products (crawled_at);
+
+CREATE TABLE IF NOT EXISTS product_keywords (
+    platform TEXT NOT NULL,
+    num_iid TEXT NOT NULL,
+    keyword TEXT NOT NULL,
+    seen_at REAL NOT NULL,
+    PRIMARY KEY (platform, num_iid, keyword)
+);
+CREATE INDEX IF NOT EXISTS product_keywords_keyword ON product_keywords (keyword, seen_at);
+
+CREATE TABLE IF NOT EXISTS product_options (
+    platform TEXT NOT NULL,
+    num_iid TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    name TEXT,
+    stock INTEGER,
+    image_url TEXT,
+    PRIMARY KEY (platform, num_iid, position)
+);
+
+CREATE TABLE IF NOT EXISTS product_material_info (
+    platform TEXT NOT NULL,
+    num_iid TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    name TEXT,
+    value TEXT,
+    PRIMARY KEY (platform, num_iid, position)
+);
+
+CREATE TABLE IF NOT EXISTS product_images (
+    platform TEXT NOT NULL,
+    num_iid TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    url TEXT,
+    translated_text TEXT,
+    PRIMARY KEY (platform, num_iid, position)
+);
+"""
+
+# products 테이블 열로 저장하는 키 (나머지는 extra 에 JSON 으로)
+_COLUMNS = ('url', 'title', 'price', 'rating', 'crawled_at')
+_CHILDREN = ('options', 'material_info', 'product_images')
+
+
+class ProductStore:
+    """
+    크롤링한 상품을 (platform, num_iid) 기준으로 upsert 하는 SQLite 저장소
+
+    상품 한 줄과 옵션/재료 정보/이미지 하위 테이블로 나눠 저장하므로 상품 번호, 검색어,
+    가격 범위, 크롤링 시각으로 인덱스 조회를 할 수 있습니다. 같은 상품을 다시 저장하면
+    최신 값으로 덮어쓰고, 상품 dict 에 있는 하위 목록만 교체합니다.
+    """
+
+    def __init__(self, path='products.db'):
+        """
+        Args:
+            path (str, optional): SQLite 파일 경로. Defaults to 'products.db'.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def _upsert(self, key, product, keyword, now):
+        extra = {k: v for k, v in product.items() if k not in _COLUMNS and k not in _CHILDREN}
+        self._conn.execute(
+            "INSERT INTO products (platform, num_iid, url, title, price, rating, crawled_at, "
+            "first_stored_at, updated_at, extra) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (platform, num_iid) DO UPDATE SET url = excluded.url, title = excluded.title, "
+            "price = excluded.price, rating = excluded.rating, crawled_at = excluded.crawled_at, "
+            "updated_at = excluded.updated_at, extra = excluded.extra",
+            key + (product.get('url'), product.get('title'), product.get('price'), product.get('rating'),
+                   product.get('crawled_at'), now, now,
+                   json.dumps(extra, ensure_ascii=False, default=json_default) if extra else None)
+        )
+        if keyword:
+            self._conn.execute(
+                "INSERT INTO product_keywords (platform, num_iid, keyword, seen_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (platform, num_iid, keyword) DO UPDATE SET seen_at = excluded.seen_at",
+                key + (keyword, now)
+            )
+
+        if 'options' in product:
+            self._conn.execute("DELETE FROM product_options WHERE platform = ? AND num_iid = ?", key)
+            self._conn.executemany(
+                "INSERT INTO product_options (platform, num_iid, position, name, stock, image_url) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [key + (i, option.get('name'), option.get('stock'), option.get('image_url'))
+                 for i, option in enumerate(product['options'] or [])]
+            )
+        if 'material_info' in product:
+            self._conn.execute("DELETE FROM product_material_info WHERE platform = ? AND num_iid = ?", key)
+            self._conn.executemany(
+                "INSERT INTO product_material_info (platform, num_iid, position, name, value) VALUES (?, ?, ?, ?, ?)",
+                [key + (i, name, value) for i, (name, value) in enumerate((product['material_info'] or {}).items())]
+            )
+        if 'product_images' in product:
+            self._conn.execute("DELETE FROM product_images WHERE platform = ? AND num_iid = ?", key)
+            rows = []
+            for i, image in enumerate(product['product_images'] or []):
+                # 번역을 붙인 {'original_url', 'translated_text'} 와 URL 문자열 둘 다 저장
+                if isinstance(image, dict):
+                    rows.append(key + (i, image.get('original_url'), image.get('translated_text')))
+                else:
+                    rows.append(key + (i, image, None))
+            self._conn.executemany(
+                "INSERT INTO product_images (platform, num_iid, position, url, translated_text) VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+
+    def upsert(self, product, keyword=None):
+        """
+        상품 하나 저장 (같은 상품이 있으면 덮어씀)
+
+        Args:
+            product (dict): 크롤러가 만든 상품 dict ('url' 필수).
+            keyword (str, optional): 이 상품을 찾은 검색어.
+
+        Returns:
+            tuple: 저장한 (platform, num_iid) 또는 URL 에 상품 번호가 없어 저장하지 못했으면 None.
+        """
+        return self.upsert_many([product], keyword)[0]
+
+    def upsert_many(self, products, keyword=None):
+        """여러 상품을 한 트랜잭션으로 저장 (상품별 (platform, num_iid) 또는 None 리스트)"""
+        keys = []
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                for product in products:
+                    key = product_key(product.get('url') or '')
+                    if key is not None:
+                        self._upsert(key, product, keyword, now)
+                    keys.append(key)
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return keys
+
+    def add_keyword(self, key, keyword):
+        """이미 저장한 상품 key=(platform, num_iid) 를 keyword 로도 찾을 수 있게 기록 (상품 내용은 그대로)"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO product_keywords (platform, num_iid, keyword, seen_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (platform, num_iid, keyword) DO UPDATE SET seen_at = excluded.seen_at",
+                tuple(key) + (keyword, time.time())
+            )
+
+    def _load(self, row):
+        platform, num_iid, url, title, price, rating, crawled_at, extra = row
+        key = (platform, num_iid)
+        product = {
+            'url': url,
+            'title': title,
+            'price': price,
+            'rating': rating,
+            'options': [
+                {'name': name, 'stock': stock, 'image_url': image_url}
+                for name, stock, image_url in self._conn.execute(
+                    "SELECT name, stock, image_url FROM product_options "
+                    "WHERE platform = ? AND num_iid = ? ORDER BY position", key)
+            ],
+            'material_info': dict(self._conn.execute(
+                "SELECT name, value FROM product_material_info WHERE platform = ? AND num_iid = ? ORDER BY position",
+                key)),
+            'product_images': [
+                {'original_url': image_url, 'translated_text': translated_text}
+                if translated_text is not None else image_url
+                for image_url, translated_text in self._conn.execute(
+                    "SELECT url, translated_text FROM product_images "
+                    "WHERE platform = ? AND num_iid = ? ORDER BY position", key)
+            ],
+            'crawled_at': crawled_at,
+        }
+        if extra:
+            product.update(json.loads(extra))
+        return product
+
+    _SELECT = "SELECT p.platform, p.num_iid, p.url, p.title, p.price, p.rating, p.crawled_at, p.extra FROM products p"
+
+    def get(self, num_iid, platform=DEFAULT_PLATFORM):
+        """상품 번호로 상품 dict 조회 (없으면 None)"""
+        with self._lock:
+            row = self._conn.execute(
+                self._SELECT + " WHERE p.platform = ? AND p.num_iid = ?", (platform, str(num_iid))
+            ).fetchone()
+            return self._load(row) if row else None
+
+    def find(self, keyword=None, min_price=None, max_price=None, since=None, until=None, limit=None):
+        """
+        조건에 맞는 상품 dict 리스트 (최근 크롤링 순)
+
+        Args:
+            keyword (str, optional): 이 검색어로 찾은 상품만.
+            min_price (int, optional): 최소 가격.
+            max_price (int, optional): 최대 가격.
+            since (str, optional): 이 시각 이후 크롤링 ('%Y-%m-%d %H:%M:%S' 형식, 앞부분만 줘도 됨).
+            until (str, optional): 이 시각 이전 크롤링.
+            limit (int, optional): 최대 개수.
+        """
+        query = self._SELECT
+        conditions = []
+        params = []
+        if keyword is not None:
+            query += " JOIN product_keywords k ON k.platform = p.platform AND k.num_iid = p.num_iid"
+            conditions.append("k.keyword = ?")
+            params.append(keyword)
+        if min_price is not None:
+            conditions.append("p.price >= ?")
+            params.append(min_price)
+        if max_price is not None:
+            conditions.append("p.price <= ?")
+            params.append(max_price)
+        if since is not None:
+            conditions.append("p.crawled_at >= ?")
+            params.append(since)
+        if until is not None:
+            conditions.append("p.crawled_at < ?")
+            params.append(until)
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY p.crawled_at DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+            return [self._load(row) for row in rows]
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM products").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,280 @@
+import threading
+import time
+import urllib.parse
+from collections import deque
+from contextlib import contextmanager
+
+import requests
+
+
+class TokenBucket:
+    """
+    여러 스레드가 공유하는 토큰 버킷 속도 제한기
+
+    초당 rate 개의 토큰이 채워지고 최대 capacity 개까지 쌓입니다.
+    요청 전에 acquire()를 호출하면 토큰이 생길 때까지 대기합니다.
+    """
+
+    def __init__(self, rate, capacity=None):
+        if rate <= 0:
+            raise ValueError("rate는 0보다 커야 합니다.")
+        self.rate = float(rate)
+        self.capacity = float(capacity) if capacity else max(1.0, self.rate)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def try_acquire(self, tokens=1):
+        """토큰이 있으면 차감 후 True, 없으면 바로 False"""
+        with self._lock:
+            self._refill()
+            if self.tokens >= tokens:
+                self.tokens -= tokens
+                return True
+            return False
+
+    def acquire(self, tokens=1):
+        """토큰이 생길 때까지 대기한 뒤 차감"""
+        while True:
+            with self._lock:
+                self._refill()
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+                wait = (tokens - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class AdaptiveLimiter:
+    """
+    호스트 하나의 동시 요청 수를 AIMD 로 조절하는 제어기
+
+    응답이 정상이고 지연이 기준치 근처면 동시 요청 수를 조금씩(가산) 늘리고,
+    429/5xx/연결 오류가 나거나 지연이 기준의 latency_factor 배를 넘으면 절반으로(승산) 줄입니다.
+    최소 한도에서도 과부하/지연이 계속되면 두 배씩 늘어나는 시간 동안 쉽니다.
+    한 번 줄인 뒤에는 지연 한 번만큼 지나야 다시 줄여서 같은 혼잡으로 연달아 깎지 않습니다.
+    """
+
+    def __init__(self, name, initial=2, min_limit=1, max_limit=16, decrease=0.5, latency_factor=2.0,
+                 max_backoff=30.0):
+        """
+        Args:
+            name (str): 호스트 이름 (출력용).
+            initial (int, optional): 처음 동시 요청 수. Defaults to 2.
+            min_limit (int, optional): 최소 동시 요청 수. Defaults to 1.
+            max_limit (int, optional): 최대 동시 요청 수. Defaults to 16.
+            decrease (float, optional): 과부하 때 곱할 비율. Defaults to 0.5.
+            latency_factor (float, optional): 평균 지연이 기준 지연의 이 배수를 넘으면 과부하로 봄. Defaults to 2.0.
+            max_backoff (float, optional): 최소 동시 요청 수에서도 과부하/지연일 때 쉬는 최대 시간(초). Defaults to 30.
+        """
+        if not 1 <= min_limit <= max_limit:
+            raise ValueError("1 <= min_limit <= max_limit 이어야 합니다.")
+        self.name = name
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.decrease = decrease
+        self.latency_factor = latency_factor
+        self.max_backoff = max_backoff
+        self.limit = float(min(max(initial, min_limit), max_limit))
+        self.in_flight = 0
+        self.successes = 0
+        self.overloads = 0
+        self.latency = None       # 최근 지연 지수 이동 평균(초)
+        self.base_latency = None  # 한가할 때의 지연 (최소값에서 천천히 따라 올라감)
+        self._backoff = 0.0
+        self._paused_until = 0.0
+        self._last_decrease = 0.0
+        self._completed = deque()  # 최근 완료 시각 (rate 계산용)
+        self._cond = threading.Condition()
+
+    def acquire(self):
+        """동시 요청 수에 자리가 날 때까지 (쉬는 중이면 그 시간까지) 대기"""
+        with self._cond:
+            while True:
+                wait = self._paused_until - time.monotonic()
+                if wait <= 0 and self.in_flight < int(self.limit):
+                    self.in_flight += 1
+                    return
+                self._cond.wait(wait if wait > 0 else None)
+
+    def release(self, latency, status=None, error=False, retry_after=None):
+        """
+        요청 결과를 반영하고 자리를 반납
+
+        Args:
+            latency (float): 요청에 걸린 시간(초).
+            status (int, optional): HTTP 상태 코드 (모르면 None).
+            error (bool, optional): 연결 오류/타임아웃 등 응답을 못 받은 경우 True.
+            retry_after (float, optional): 서버가 알려준 Retry-After (초).
+        """
+        now = time.monotonic()
+        with self._cond:
+            # 한도를 다 쓰고 있을 때만 늘림 (일이 적어 한가한 동안 한도만 부풀지 않게)
+            saturated = self.in_flight >= int(self.limit)
+            self.in_flight -= 1
+            self._completed.append(now)
+            while self._completed and now - self._completed[0] > 10:
+                self._completed.popleft()
+
+            if not error:
+                self.latency = latency if self.latency is None else 0.7 * self.latency + 0.3 * latency
+                if self.base_latency is None or self.latency < self.base_latency:
+                    self.base_latency = self.latency
+                else:
+                    self.base_latency += (self.latency - self.base_latency) * 0.01
+
+            overloaded = error or status == 429 or (status is not None and status >= 500)
+            slow = (self.successes >= 5 and self.base_latency
+                    and self.latency > self.base_latency * self.latency_factor)
+            if overloaded or slow:
+                self._on_overload(now, overloaded, retry_after)
+            else:
+                self.successes += 1
+                self._backoff = 0.0
+                if saturated:
+                    # 지금 한도만큼 성공하면 1 증가 (대략 왕복 한 번에 +1)
+                    self.limit = min(self.max_limit, self.limit + 1.0 / self.limit)
+            self._cond.notify_all()
+
+    def _on_overload(self, now, overloaded, retry_after):
+        if overloaded:
+            self.overloads += 1
+        if now - self._last_decrease < (self.latency or 0.0):
+            return
+        self._last_decrease = now
+        if self.limit > self.min_limit:
+            self.limit = max(self.min_limit, self.limit * self.decrease)
+        else:
+            # 더 줄일 수 없으면 잠시 쉼 (쉴 때마다 두 배, max_backoff 까지) - 요청하는 쪽이 하나뿐이라
+            # 한도를 줄여도 효과가 없을 때(붙은 Chrome 하나로 크롤링 등)도 느려지면 여기서 속도를 늦춤
+            self._backoff = min(self.max_backoff, self._backoff * 2 or 1.0)
+            self._paused_until = now + self._backoff
+        if retry_after:
+            self._paused_until = max(self._paused_until, now + min(retry_after, self.max_backoff))
+
+    @contextmanager
+    def slot(self):
+        """
+        acquire/release 를 묶은 컨텍스트 매니저
+
+        with limiter.slot() as slot: 안에서 slot.status 에 상태 코드를 적거나
+        slot.response 에 응답을 넣어두면 반영합니다 (브라우저로 연 페이지는 page_ready.open_page 가
+        상태 코드를 적음). requests 예외는 응답이 있으면 그 상태 코드로, 없으면 연결 오류로 기록하고,
+        그 밖의 예외(Selenium 타임아웃 등)는 상태 코드가 적혀 있지 않으면 오류로 기록한 뒤 다시 던집니다.
+        """
+        slot = _Slot()
+        self.acquire()
+        started = time.monotonic()
+        try:
+            yield slot
+        except requests.exceptions.RequestException as e:
+            slot.response = e.response if e.response is not None else slot.response
+            slot.error = slot.response is None and slot.status is None
+            raise
+        except Exception:
+            # Selenium 타임아웃/WebDriverException 등 요청이 끝나지 못한 경우만 오류
+            # (page_ready.PageStatusError 처럼 상태 코드를 이미 적었으면 그 상태 코드로 판단)
+            slot.error = slot.status is None
+            raise
+        finally:
+            status, retry_after = slot.outcome()
+            self.release(time.monotonic() - started, status, slot.error, retry_after)
+
+    def rate(self):
+        """최근 10초 동안 초당 완료한 요청 수"""
+        with self._cond:
+            now = time.monotonic()
+            recent = [t for t in self._completed if now - t <= 10]
+            if len(recent) < 2:
+                return float(len(recent))
+            return len(recent) / max(now - recent[0], 1e-6)
+
+    def stats(self):
+        """현재 한도/진행 중 요청/지연/처리율"""
+        rate = self.rate()
+        with self._cond:
+            return {
+                'limit': int(self.limit),
+                'in_flight': self.in_flight,
+                'latency': self.latency,
+                'base_latency': self.base_latency,
+                'rate': rate,
+                'successes': self.successes,
+                'overloads': self.overloads,
+            }
+
+
+class _Slot:
+    """AdaptiveLimiter.slot() 이 넘겨주는 요청 결과 기록용 객체"""
+
+    def __init__(self):
+        self.status = None
+        self.response = None
+        self.error = False
+
+    def outcome(self):
+        status = self.status
+        retry_after = None
+        if self.response is not None:
+            status = status or self.response.status_code
+            try:
+                retry_after = float(self.response.headers.get('Retry-After', ''))
+            except ValueError:
+                retry_after = None
+        return status, retry_after
+
+
+class HostLimiters:
+    """호스트별 AdaptiveLimiter 모음 (처음 보는 호스트는 같은 설정으로 새로 만듦)"""
+
+    def __init__(self, **limiter_options):
+        """
+        Args:
+            **limiter_options: AdaptiveLimiter 에 넘길 설정 (initial, max_limit 등).
+        """
+        self.limiter_options = limiter_options
+        self._limiters = {}
+        self._lock = threading.Lock()
+
+    def limiter(self, url):
+        """url 호스트의 제어기"""
+        host = urllib.parse.urlsplit(url).netloc.lower() or url
+        with self._lock:
+            limiter = self._limiters.get(host)
+            if limiter is None:
+                limiter = self._limiters[host] = AdaptiveLimiter(host, **self.limiter_options)
+            return limiter
+
+    def slot(self, url):
+        """url 호스트 제어기의 slot()"""
+        return self.limiter(url).slot()
+
+    def stats(self):
+        with self._lock:
+            limiters = list(self._limiters.values())
+        return {limiter.name: limiter.stats() for limiter in limiters}
+
+    def report(self):
+        """호스트별 현재 동시 요청 한도와 처리율 출력"""
+        for host, stats in self.stats().items():
+            latency = f"{stats['latency']:.2f}초" if stats['latency'] is not None else "-"
+            print(f"[{host}] 동시 요청 {stats['limit']}개, {stats['rate']:.2f}건/초, 평균 지연 {latency} "
+                  f"(성공 {stats['successes']}, 과부하 {stats['overloads']})")
+
+
+_default_limiters = None
+_default_limiters_lock = threading.Lock()
+
+
+def get_host_limiters():
+    """프로세스 전체가 공유하는 HostLimiters"""
+    global _default_limiters
+    with _default_limiters_lock:
+        if _default_limiters is None:
+            _default_limiters = HostLimiters()
+        return _default_limiters
@@ -0,0 +1,163 @@
+import gzip
+import io
+import json
+import threading
+import time
+import zlib
+
+# zstandard 가 있으면 .zst 압축 지원
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None
+    ZSTD_AVAILABLE = False
+
+_GZIP_MAGIC = b'\x1f\x8b'
+_ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
+
+def _compression_for(path, compression):
+    if compression == 'auto':
+        if path.endswith('.gz'):
+            return 'gzip'
+        if path.endswith('.zst'):
+            return 'zstd'
+        return None
+    return compression
+
+
+class JsonlSink:
+    """
+    레코드를 한 줄에 하나씩 압축 JSON 으로 이어 쓰는 결과 기록기
+
+    write() 한 레코드는 batch_size 개가 모이거나 flush_interval 초가 지나면 파일에 씁니다.
+    파일은 첫 레코드를 쓸 때 이어쓰기(append)로 엽니다 (크롤러는 실행마다 새 경로를 줍니다). gzip/zstd 는 쓸 때마다 새 압축 블록을 닫아 두므로 중간에 죽어도
+    그때까지 쓴 줄은 read_jsonl 로 읽을 수 있습니다. 스레드 안전합니다.
+    """
+
+    def __init__(self, path, compression='auto', batch_size=50, flush_interval=5.0, cls=None):
+        """
+        Args:
+            path (str): 결과 파일 경로.
+            compression (str, optional): None, 'gzip', 'zstd' 또는 'auto' (확장자 .gz/.zst 로 판단). Defaults to 'auto'.
+            batch_size (int, optional): 이만큼 모이면 파일에 씀. Defaults to 50.
+            flush_interval (float, optional): 마지막으로 쓴 뒤 이 시간(초)이 지나면 다음 write 때 씀. Defaults to 5.
+            cls (json.JSONEncoder, optional): json.dumps 에 넘길 인코더 클래스.
+        """
+        self.path = path
+        self.compression = _compression_for(path, compression)
+        if self.compression not in (None, 'gzip', 'zstd'):
+            raise ValueError(f"지원하지 않는 압축 방식입니다: {compression}")
+        if self.compression == 'zstd' and not ZSTD_AVAILABLE:
+            raise ImportError("zstd 압축에는 zstandard 가 필요합니다. pip install zstandard 를 실행해주세요.")
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.cls = cls
+        self.written = 0
+        self._buffer = []
+        self._file = None
+        self._stream = None
+        self._flushed_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _open(self):
+        self._file = open(self.path, 'ab')
+        if self.compression == 'gzip':
+            self._stream = gzip.GzipFile(fileobj=self._file, mode='ab')
+        elif self.compression == 'zstd':
+            self._stream = zstandard.ZstdCompressor().stream_writer(self._file, closefd=False)
+        else:
+            self._stream = self._file
+
+    def _write_buffer(self):
+        if not self._buffer:
+            return
+        if self._file is None:
+            self._open()
+        self._stream.write(''.join(self._buffer).encode('utf-8'))
+        if self.compression == 'zstd':
+            self._stream.flush(zstandard.FLUSH_BLOCK)
+        elif self.compression == 'gzip':
+            self._stream.flush(zlib.Z_SYNC_FLUSH)
+        self._file.flush()
+        self.written += len(self._buffer)
+        self._buffer = []
+        self._flushed_at = time.monotonic()
+
+    def write(self, record):
+        """레코드 하나 추가 (batch_size / flush_interval 에 닿으면 파일에 씀)"""
+        line = json.dumps(record, ensure_ascii=False, separators=(',', ':'), cls=self.cls) + '\n'
+        with self._lock:
+            self._buffer.append(line)
+            if len(self._buffer) >= self.batch_size or time.monotonic() - self._flushed_at >= self.flush_interval:
+                self._write_buffer()
+
+    def flush(self):
+        """모아 둔 레코드를 바로 파일에 씀"""
+        with self._lock:
+            self._write_buffer()
+
+    def close(self):
+        """남은 레코드를 쓰고 파일을 닫음"""
+        with self._lock:
+            self._write_buffer()
+            if self._file is not None:
+                if self._stream is not self._file:
+                    self._stream.close()
+                self._file.close()
+                self._file = None
+                self._stream = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def _open_text(path):
+    raw = open(path, 'rb')
+    magic = raw.read(4)
+    raw.seek(0)
+    if magic.startswith(_GZIP_MAGIC):
+        return io.TextIOWrapper(gzip.GzipFile(fileobj=raw), encoding='utf-8')
+    if magic == _ZSTD_MAGIC:
+        if not ZSTD_AVAILABLE:
+            raw.close()
+            raise ImportError("zstd 파일을 읽으려면 zstandard 가 필요합니다. pip install zstandard 를 실행해주세요.")
+        reader = zstandard.ZstdDecompressor().stream_reader(raw, read_across_frames=True)
+        return io.TextIOWrapper(reader, encoding='utf-8')
+    return io.TextIOWrapper(raw, encoding='utf-8')
+
+
+def read_jsonl(path):
+    """
+    JsonlSink 가 쓴 파일의 레코드를 하나씩 흘려주는 제너레이터
+
+    압축 방식은 파일 앞부분으로 판단합니다. 쓰던 중 죽어 끝이 잘린 압축 스트림과
+    마지막 미완성 줄은 경고만 출력하고 거기서 멈춥니다.
+
+    Yields:
+        dict: 한 줄의 레코드.
+    """
+    errors = (EOFError, zlib.error, gzip.BadGzipFile)
+    if ZSTD_AVAILABLE:
+        errors += (zstandard.ZstdError,)
+    with _open_text(path) as f:
+        line_number = 0
+        while True:
+            try:
+                line = f.readline()
+            except errors as e:
+                print(f"{path}: 압축 스트림 끝이 잘려 {line_number}번째 줄까지만 읽었습니다 ({e}).")
+                return
+            if not line:
+                return
+            line_number += 1
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                print(f"{path}: {line_number}번째 줄을 JSON 으로 읽지 못해 건너뜁니다.")
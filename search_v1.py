@@ -1,12 +1,12 @@
 import subprocess
 import sys
-import requests
 import json
-import time
 import random
-import urllib
-from bs4 import BeautifulSoup
 import csv
+import itertools
+
+from naver_datalab import fetch_rank_page
+from ssadagu_search import iter_search_products
 
 
 def install_packages():
@@ -40,90 +40,20 @@ TOP_LEVEL_CATEGORIES = {
 def search_naver_rank(food_cid):
     print(f"식품 카테고리 ID: {food_cid}")
     # 출력: 식품 카테고리 ID: 50000006
-    # 1. 요청을 보낼 URL
-    url = "https://datalab.naver.com/shoppingInsight/getCategoryKeywordRank.naver"
-
-    # 2. Headers 정보 설정 (User-Agent는 본인 것으로 교체하는 것을 권장)
-    #    개발자 도구 -> Network -> getCategoryKeywordRank.naver -> Headers -> Request Headers 에서 복사
-    headers = {
-        "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
-        "Referer": "https://datalab.naver.com/shoppingInsight/sCategory.naver",
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36"
-    }
     dic1 = {}
 
-    # 3. Payload (Form Data) 정보 설정 - 원하는 조건으로 수정하여 사용
-    #    '패션의류(50000000)' 카테고리의 2024년 1월 한 달간 전체 인기 검색어 순위
+    # 페이지별 순위는 naver_datalab 의 디스크 캐시를 거쳐 가져옴 (TTL 안에는 네트워크 요청 없음)
     for a in range(1, 3):
-        payload = {
-            "cid": food_cid,
-            "timeUnit": "date",  # 월간 단위
-            "startDate": "2025-08-28",
-            "endDate": "2025-08-29",
-            "age": "",  # 전체 연령
-            "gender": "",  # 전체 성별
-            "device": "",  # 전체 기기
-            "page": a,
-        }
-
-        # 4. POST 요청 보내기
-        response = requests.post(url, headers=headers, data=payload)
-
-        # 5. 응답 확인 및 데이터 파싱
-        if response.status_code == 200:
-            try:
-                # 응답 받은 데이터를 JSON 형태로 파싱
-                data = response.json()
-
-                # 보기 좋게 출력 (indent=2)
-                print(json.dumps(data, indent=2, ensure_ascii=False))
-
-                # 순위와 키워드만 추출하여 출력
-                # print("\n--- 인기 검색어 순위 ---")
-                for item in data.get('ranks', []):
-                    dic1[item.get('rank')] = item.get('keyword')
-                    # print(f"{item['rank']}. {item['keyword']}")
-
-            except json.JSONDecodeError:
-                print("JSON 데이터를 파싱하는 데 실패했습니다.")
-                print("응답 내용:", response.text)
-        else:
-            print(f"데이터를 가져오는 데 실패했습니다. 상태 코드: {response.status_code}")
+        ranks = fetch_rank_page(food_cid, page=a)
+        if ranks is None:
+            continue
+        print(json.dumps(ranks, ensure_ascii=False))
+        for rank, keyword in ranks:
+            dic1[rank] = keyword
     return dic1
 
 
-# --- 2. '싸다구' 상품 검색 관련 함수 ---
-def search_products_ssadagu(search_term, page=1):
-    """싸다구 (ssadagu.kr) 사이트에서 상품을 검색하는 함수"""
-    search_url = "https://ssadagu.kr/shop/ajax.infinity_shop_list.php"
-    payload = {
-        'page_div_id': 'infinity_item_list', 'page_type': 'pc', 'ss_tx': search_term,
-        'search_option_array': ['activeType'], 'hi_platform': '1688', 'sort_item': 'default', 'page': page
-    }
-    encoded_q = urllib.parse.quote(search_term, safe="")
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-        'X-Requested-With': 'XMLHttpRequest',
-        'Referer': f'https://ssadagu.kr/shop/search.php?ss_tx={encoded_q}'
-    }
-    try:
-        response = requests.post(search_url, data=payload, headers=headers)
-        response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException as e:
-        print(f"HTTP 요청 중 에러가 발생했습니다: {e}")
-        return None
-    except json.JSONDecodeError:
-        print("JSON 데이터를 파싱하는 데 실패했습니다.");
-        print("응답 내용:", response.text)
-        return None
-
-
-
-
-
-
-# --- 3. 메인 실행 로직 ---
+# --- 2. 메인 실행 로직 ---
 if __name__ == "__main__":
     install_packages()
 
@@ -136,37 +66,27 @@ if __name__ == "__main__":
     dic = search_naver_rank(TOP_LEVEL_CATEGORIES[search_categories])
     search_keyword = random.choice(dic)
 
-    # '싸다구'에서 상품 검색 및 CSV 저장
-    result_data = search_products_ssadagu(search_keyword)
-
-    if result_data and result_data.get('success'):
-        product_html_list = result_data.get('data', [])
-        print(f"📄 총 {len(product_html_list)}개의 상품을 찾았습니다.\n")
-
-        if not product_html_list:
-            print(f"'{search_keyword}'에 대한 검색 결과가 없어 CSV 파일을 생성하지 않습니다.")
-        else:
-            safe_keyword = "".join(c for c in search_keyword if c.isalnum() or c in (' ', '_')).rstrip()
-            csv_filename = f'{safe_keyword}_ssadagu_products.csv'
-
-            with open(csv_filename, 'w', newline='', encoding='utf-8-sig') as csvfile:
-                csv_writer = csv.writer(csvfile)
-                header = ['상품ID', '상품명', '가격(원)', '링크', '이미지URL']
-                csv_writer.writerow(header)
-
-                for product_html in product_html_list:
-                    soup = BeautifulSoup(product_html, 'html.parser')
-                    li_tag = soup.find('li')
-                    if not li_tag: continue
-                    gs_id = li_tag.get('data-gs-id', 'N/A')
-                    title = li_tag.get('data-title', 'N/A')
-                    image_url = li_tag.get('data-img-url', 'N/A')
-                    price_tag = soup.select_one('.product_price')
-                    price_krw = price_tag.text.replace('원', '').strip() if price_tag else 'N/A'
-                    link_tag = soup.select_one('.product_image a')
-                    product_url = link_tag['href'] if link_tag and link_tag.has_attr('href') else 'N/A'
-                    csv_writer.writerow([gs_id, title, price_krw, product_url, image_url])
-
-            print(f"🎉 상품 정보가 '{csv_filename}' 파일로 성공적으로 저장되었습니다.")
+    # '싸다구'에서 상품 검색 및 CSV 저장 (여러 페이지를 받는 즉시 기록)
+    max_pages = 5
+    products = iter_search_products(search_keyword, max_pages=max_pages)
+    first_product = next(products, None)
+
+    if first_product is None:
+        print(f"'{search_keyword}'에 대한 검색 결과가 없어 CSV 파일을 생성하지 않습니다.")
     else:
-        print(f"❌ '{search_keyword}' 상품 조회에 실패했습니다.")
\ No newline at end of file
+        safe_keyword = "".join(c for c in search_keyword if c.isalnum() or c in (' ', '_')).rstrip()
+        csv_filename = f'{safe_keyword}_ssadagu_products.csv'
+        product_count = 0
+
+        with open(csv_filename, 'w', newline='', encoding='utf-8-sig') as csvfile:
+            csv_writer = csv.writer(csvfile)
+            header = ['상품ID', '상품명', '가격(원)', '링크', '이미지URL']
+            csv_writer.writerow(header)
+
+            for product in itertools.chain([first_product], products):
+                csv_writer.writerow([product['gs_id'], product['title'], product['price'],
+                                     product['url'], product['image_url']])
+                product_count += 1
+
+        print(f"📄 총 {product_count}개의 상품을 찾았습니다.\n")
+        print(f"🎉 상품 정보가 '{csv_filename}' 파일로 성공적으로 저장되었습니다.")
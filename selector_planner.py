@@ -0,0 +1,215 @@
+import threading
+from collections import deque
+
+
+def first_hit(candidates, probe):
+    """
+    후보 셀렉터를 주어진 순서대로 시도해 처음으로 찾은 결과를 반환
+
+    Args:
+        candidates (iterable): 셀렉터 후보들.
+        probe (callable): 셀렉터를 받아 결과를 반환하는 함수 (못 찾으면 None).
+
+    Returns:
+        처음으로 None이 아닌 probe 결과 또는 None.
+    """
+    for selector in candidates:
+        result = probe(selector)
+        if result is not None:
+            return result
+    return None
+
+
+class SelectorPlanner:
+    """
+    같은 값을 찾는 대체 셀렉터들을 우선순위 순서로 시도하고 적중 통계를 모으는 플래너
+
+    대체 셀렉터는 기본 셀렉터가 찾는 요소를 포함하는 넓은 셀렉터라 (span.price ⊇
+    span.price.gsItemPriceKWR, h1 ⊇ h1#kakaotitle) 순서를 바꾸면 결과가 달라지므로,
+    시도 순서는 항상 등록한 순서 그대로 두고 적중 점수(score = score * decay + hit)는
+    통계와 경고에만 씁니다. 첫 번째(기본) 셀렉터의 최근 적중률이 alert_threshold 아래로
+    떨어지면 경고합니다.
+    """
+
+    def __init__(self, name, candidates, decay=0.99, window=200, min_samples=50,
+                 alert_threshold=0.5, on_alert=None):
+        """
+        Args:
+            name (str): 플래너 이름 (통계/경고 출력용).
+            candidates (iterable): 우선순위 순서의 셀렉터 후보들.
+            decay (float, optional): 적중 점수 감쇠율. Defaults to 0.99.
+            window (int, optional): 첫 시도 적중률을 계산할 최근 해석 수. Defaults to 200.
+            min_samples (int, optional): 경고를 판단하기 위한 최소 해석 수. Defaults to 50.
+            alert_threshold (float, optional): 경고 기준 첫 시도 적중률. Defaults to 0.5.
+            on_alert (callable, optional): 경고 시 (name, message, stats) 로 호출할 함수. 없으면 print.
+        """
+        self.name = name
+        self.candidates = list(candidates)
+        self.decay = decay
+        self.min_samples = min_samples
+        self.alert_threshold = alert_threshold
+        self.on_alert = on_alert
+
+        self._priority = {selector: i for i, selector in enumerate(self.candidates)}
+        self._scores = {selector: 0.0 for selector in self.candidates}
+        self._attempts = {selector: 0 for selector in self.candidates}
+        self._hits = {selector: 0 for selector in self.candidates}
+        self._recent_first = deque(maxlen=window)
+        self._resolved = 0
+        self._missed = 0
+        self._probes = 0
+        self._alerting = False
+        self._lock = threading.Lock()
+
+    def order(self):
+        """시도 순서 (등록한 우선순위 순서)"""
+        return list(self.candidates)
+
+    def ranking(self):
+        """최근 적중 점수 순서 (통계용, 시도 순서에는 영향 없음)"""
+        with self._lock:
+            return self._ranking()
+
+    def _ranking(self):
+        return sorted(self.candidates, key=lambda s: (-self._scores[s], self._priority[s]))
+
+    def resolve(self, probe):
+        """
+        우선순위 순서대로 셀렉터를 시도하고 결과를 통계에 반영
+
+        Args:
+            probe (callable): 셀렉터를 받아 결과를 반환하는 함수 (못 찾으면 None).
+
+        Returns:
+            처음으로 None이 아닌 probe 결과 또는 None.
+        """
+        tried = []
+        result = None
+        hit = None
+        for selector in self.candidates:
+            tried.append(selector)
+            result = probe(selector)
+            if result is not None:
+                hit = selector
+                break
+
+        self._record(tried, hit)
+        return result
+
+    def _record(self, tried, hit):
+        alerts = []
+        with self._lock:
+            self._probes += len(tried)
+            for selector in tried:
+                self._attempts[selector] += 1
+            for selector in self._scores:
+                self._scores[selector] *= self.decay
+
+            if hit is None:
+                self._missed += 1
+            else:
+                self._resolved += 1
+                self._hits[hit] += 1
+                self._scores[hit] += 1.0
+
+            self._recent_first.append(hit == self.candidates[0])
+            rate = self._recent_first_rate()
+            if len(self._recent_first) >= self.min_samples and rate < self.alert_threshold:
+                if not self._alerting:
+                    self._alerting = True
+                    alerts.append(f"기본 셀렉터 '{self.candidates[0]}' 적중률이 {rate:.0%} 로 떨어졌습니다.")
+            elif self._alerting and rate >= self.alert_threshold:
+                self._alerting = False
+            stats = self._stats() if alerts else None
+
+        for message in alerts:
+            self._alert(message, stats)
+
+    def _alert(self, message, stats):
+        if self.on_alert is not None:
+            self.on_alert(self.name, message, stats)
+            return
+        print(f"[셀렉터 경고] '{self.name}': {message} 최근 적중 순서: {stats['ranking']}")
+
+    def _recent_first_rate(self):
+        if not self._recent_first:
+            return 1.0
+        return sum(self._recent_first) / len(self._recent_first)
+
+    def _stats(self):
+        total = self._resolved + self._missed
+        return {
+            'order': list(self.candidates),
+            'ranking': self._ranking(),
+            'resolved': self._resolved,
+            'missed': self._missed,
+            'first_probe_rate': self._recent_first_rate(),
+            'probes_per_lookup': self._probes / total if total else 0.0,
+            'alerting': self._alerting,
+            'selectors': {
+                selector: {
+                    'attempts': self._attempts[selector],
+                    'hits': self._hits[selector],
+                    'hit_rate': self._hits[selector] / self._attempts[selector] if self._attempts[selector] else 0.0,
+                    'score': round(self._scores[selector], 3),
+                }
+                for selector in self.candidates
+            },
+        }
+
+    def stats(self):
+        """
+        셀렉터별 시도/적중 횟수와 시도 순서 / 최근 적중 순서
+
+        Returns:
+            dict: {'order', 'ranking', 'resolved', 'missed', 'first_probe_rate', 'probes_per_lookup',
+                   'alerting', 'selectors': {셀렉터: {'attempts', 'hits', 'hit_rate', 'score'}}}
+        """
+        with self._lock:
+            return self._stats()
+
+
+class SelectorRegistry:
+    """이름별 SelectorPlanner 모음 (처음 사용할 때 후보 목록으로 등록)"""
+
+    def __init__(self, **planner_options):
+        """
+        Args:
+            **planner_options: 새 SelectorPlanner 에 전달할 옵션 (decay, window, alert_threshold 등).
+        """
+        self.planner_options = planner_options
+        self._planners = {}
+        self._lock = threading.Lock()
+
+    def planner(self, name, candidates):
+        """이름에 해당하는 플래너 (없으면 candidates 로 생성)"""
+        with self._lock:
+            planner = self._planners.get(name)
+            if planner is None:
+                planner = SelectorPlanner(name, candidates, **self.planner_options)
+                self._planners[name] = planner
+            return planner
+
+    def resolve(self, name, candidates, probe):
+        """name 플래너로 셀렉터를 시도 (SelectorPlanner.resolve 참고)"""
+        return self.planner(name, candidates).resolve(probe)
+
+    def stats(self):
+        """{이름: SelectorPlanner.stats()}"""
+        with self._lock:
+            planners = list(self._planners.values())
+        return {planner.name: planner.stats() for planner in planners}
+
+    def report(self):
+        """셀렉터 통계를 출력"""
+        for name, stats in self.stats().items():
+            total = stats['resolved'] + stats['missed']
+            if not total:
+                continue
+            print(f"\n=== 셀렉터 통계: {name} ===")
+            print(f"조회 {total}회 (실패 {stats['missed']}회) | 첫 시도 적중률 {stats['first_probe_rate']:.0%} | "
+                  f"조회당 시도 {stats['probes_per_lookup']:.2f}회")
+            for selector in stats['order']:
+                selector_stats = stats['selectors'][selector]
+                print(f"  {selector}: 적중 {selector_stats['hits']}/{selector_stats['attempts']} "
+                      f"({selector_stats['hit_rate']:.0%})")
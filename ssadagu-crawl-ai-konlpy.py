@@ -1,24 +1,38 @@
+import copy
 import requests
 import urllib.parse
-from bs4 import BeautifulSoup
 import re
 import json
 import time
 import random
-from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import subprocess
 import sys
-import csv
 
 from transformers import AutoTokenizer, AutoModel
 import torch
 from sklearn.metrics.pairwise import cosine_similarity
 import numpy as np
 
+from naver_datalab import fetch_rank_page, harvest_keyword_ranks
+from browser_scripts import extract_fields_in_browser, harvest_links
+from chrome_profile import apply_lite_options, attach_options, create_chrome_driver, warm_chrome_address
+from crawl_frontier import CrawlFrontier
+from driver_pool import WebDriverPool, map_with_drivers
+from http_cache import HttpCache
+from network_capture import capture_search_products, enable_performance_logging
+from page_cache import PageCache
+from page_ready import open_page, wait_until_ready
+from product_extractor import PRICE_SELECTORS, element_price, extract_product_fields
+from product_identity import SeenProducts, dedupe_product_urls, product_key
+from product_parser import best_backend, make_soup
+from product_store import ProductStore
+from rate_limit import get_host_limiters
+from result_sink import JsonlSink
+from selector_planner import SelectorRegistry
+from ssadagu_search import product_view_url, search_product_urls
+
 # JSON 직렬화를 위한 커스텀 인코더 클래스
 class NumpyEncoder(json.JSONEncoder):
     def default(self, obj):
@@ -32,9 +46,46 @@ class NumpyEncoder(json.JSONEncoder):
 
 # SSADAGUCrawler 클래스
 class SSADAGUCrawler:
-    def __init__(self, use_selenium=True):
+    def __init__(self, use_selenium=True, parser_backend=None, single_pass=None, search_mode='ajax', pool_size=4, lite=True, in_browser=True,
+                 debugger_address=None, user_data_dir=None, frontier_path='crawl_frontier.db',
+                 seen_path='seen_products.db', store_path='products.db'):
         self.base_url = "https://ssadagu.kr"
         self.use_selenium = use_selenium
+        # HTML 파서 백엔드 ('html.parser', 'lxml', 'selectolax') - 기본값은 설치된 것 중 가장 빠른 것
+        self.parser_backend = parser_backend or best_backend()
+        # True면 상품 페이지를 한 번만 순회하는 product_extractor 로 필드 추출 (html.parser 기반이라
+        # lxml/selectolax 보다 느림) - None이면 더 빠른 백엔드가 없을 때(html.parser)만 사용
+        self.single_pass = self.parser_backend == 'html.parser' if single_pass is None else single_pass
+        # 'ajax' 면 AJAX 검색 API로 검색 (WebDriver 불필요), 'browser' 면 검색 페이지를 직접 열어서 검색,
+        # 'network' 면 검색 페이지를 열고 페이지가 받아온 AJAX 응답을 네트워크 로그에서 읽어 검색
+        self.search_mode = search_mode
+        # 상품 페이지를 병렬로 크롤링할 때 쓸 WebDriver 수 (풀의 드라이버는 필요할 때 생성)
+        self.pool_size = pool_size
+        self.driver_pool = None
+        # True면 이미지/미디어/폰트/추적 스크립트를 받지 않는 가벼운 Chrome 으로 크롤링
+        self.lite = lite
+        # True면 Selenium 으로 연 상품 페이지에서 스크립트로 필드를 바로 추출 (page_source 직렬화/재파싱 생략)
+        self.in_browser = in_browser
+        # 설정하면 (또는 SSADAGU_CHROME_DEBUGGER / SSADAGU_CHROME_PROFILE 환경 변수) 매번 Chrome 을 새로 띄우지 않고
+        # 캐시/쿠키가 유지되는 오래 떠 있는 Chrome 에 원격 디버깅 주소로 붙음
+        self.debugger_address = debugger_address
+        self.user_data_dir = user_data_dir
+        # 제목/가격/검색 링크 대체 셀렉터 적중 통계 (시도 순서는 고정, 기본 셀렉터가 자주 빠지면 경고 - stats/report 로 확인)
+        self.selectors = SelectorRegistry()
+        # 기본/상세 크롤링이 같이 쓰는 상품 페이지 캐시 (정규화한 URL 기준 LRU + TTL)
+        self.page_cache = PageCache()
+        # requests 로 받는 상품 페이지의 디스크 캐시 (ETag/Last-Modified 조건부 요청, 304 면 저장본 사용)
+        self.http_cache = HttpCache()
+        # 호스트별 동시 요청 수를 응답 상태/지연에 맞춰 조절 (고정 대기 대신)
+        self.limiters = get_host_limiters()
+        # 상품마다 결과를 바로 커밋하는 SQLite 작업 목록 (중간에 죽어도 다시 실행하면 남은 URL 만 크롤링, None이면 사용 안 함)
+        self.frontier = CrawlFrontier(frontier_path) if frontier_path else None
+        # 여러 실행/키워드에 걸쳐 최근에 크롤링한 상품 (platform, num_iid) 기록 (None이면 사용 안 함)
+        self.seen = SeenProducts(seen_path) if seen_path else None
+        # 크롤링한 상품을 상품 번호 기준으로 upsert 하는 SQLite 상품 저장소 (None이면 사용 안 함)
+        self.product_store = ProductStore(store_path) if store_path else None
+        # 설정하면 save_product 한 상품을 JSONL 로 한 줄씩 바로 기록 (JsonlSink)
+        self.result_sink = None
         self.konlpy_available = False
         
         # KoNLPy 사용 가능 여부 확인
@@ -56,6 +107,10 @@ class SSADAGUCrawler:
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
             })
             
+    def make_soup(self, markup):
+        """설정된 파서 백엔드로 HTML 파싱"""
+        return make_soup(markup, self.parser_backend)
+
     def setup_selenium(self):
         chrome_options = Options()
         chrome_options.add_argument('--headless')
@@ -64,9 +119,24 @@ class SSADAGUCrawler:
         chrome_options.add_argument('--disable-gpu')
         chrome_options.add_argument('--window-size=1920,1080')
         chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+        if self.lite:
+            apply_lite_options(chrome_options)
         try:
-            self.driver = webdriver.Chrome(options=chrome_options)
+            debugger_address = warm_chrome_address(self.debugger_address, self.user_data_dir, chrome_options.arguments,
+                                                   chrome_options.experimental_options.get('prefs'))
+            main_options = attach_options(debugger_address) if debugger_address else chrome_options
+            if self.search_mode == 'network':
+                # 검색용 메인 드라이버만 네트워크 로그 사용 (새로 만드는 풀 드라이버에는 로그가 쌓이지 않게)
+                main_options = enable_performance_logging(copy.deepcopy(main_options))
+            self.driver = create_chrome_driver(main_options, self.lite)
             self.wait = WebDriverWait(self.driver, 10)
+            if debugger_address:
+                # 한 브라우저를 여러 세션이 나눠 쓰지 않도록 상품 페이지도 메인 드라이버로 순서대로 크롤링
+                print(f"실행 중인 Chrome 에 연결했습니다: {debugger_address}")
+            else:
+                # 메인 드라이버도 풀의 한 자리로 써서 Chrome 은 최대 pool_size 개만 뜸
+                self.driver_pool = WebDriverPool(lambda: create_chrome_driver(chrome_options, self.lite),
+                                                 size=self.pool_size, drivers=[self.driver])
             print("Selenium WebDriver 초기화 완료")
         except Exception as e:
             print(f"Selenium 초기화 실패: {e}")
@@ -80,14 +150,9 @@ class SSADAGUCrawler:
         search_url = f"{self.base_url}/shop/search.php?ss_tx={encoded_keyword}"
         try:
             self.driver.get(search_url)
-            time.sleep(5)
-            product_links = []
-            link_elements = self.driver.find_elements(By.TAG_NAME, "a")
-            for element in link_elements:
-                href = element.get_attribute('href')
-                if href and 'view.php' in href and ('platform=1688' in href or 'num_iid' in href):
-                    product_links.append(href)
-            product_links = list(set(product_links))
+            wait_until_ready(self.driver, 'search')
+            # 상품 링크를 페이지 안에서 걸러 한 번의 왕복으로 수집
+            product_links = harvest_links(self.driver) or []
             print(f"Selenium으로 발견한 상품 링크: {len(product_links)}개")
             return product_links
         except Exception as e:
@@ -101,7 +166,7 @@ class SSADAGUCrawler:
         try:
             response = self.session.get(search_url)
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = self.make_soup(response.content)
             product_links = []
             all_links = soup.find_all('a', href=True)
             for link in all_links:
@@ -115,98 +180,39 @@ class SSADAGUCrawler:
             print(f"requests 검색 오류: {e}")
             return []
 
-    def crawl_product_basic(self, product_url):
-        """기본 상품 정보만 크롤링"""
+    def crawl_product_basic(self, product_url, driver=None):
+        """기본 상품 정보만 크롤링 (driver 를 주면 그 WebDriver 로 페이지를 엶)"""
         try:
-            if self.use_selenium:
-                self.driver.get(product_url)
-                self.wait.until(lambda driver: driver.execute_script("return document.readyState") == "complete")
-                soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-            else:
-                response = requests.get(product_url)
-                response.raise_for_status()
-                soup = BeautifulSoup(response.content, 'html.parser')
-            
-            title_element = soup.find('h1', {'id': 'kakaotitle'})
-            title = title_element.get_text(strip=True) if title_element else "제목 없음"
-            
-            price = 0
-            price_selectors = [
-                'span.price.gsItemPriceKWR',
-                '.pdt_price span.price',
-                'span.price',
-                '.price'
-            ]
-            for selector in price_selectors:
-                price_element = soup.select_one(selector)
-                if price_element:
-                    price_text = price_element.get_text(strip=True).replace(',', '').replace('원', '')
-                    price_match = re.search(r'(\d+)', price_text)
-                    if price_match:
-                        price = int(price_match.group(1))
-                        break
-
-            rating = self.calculate_rating(soup)
+            fields = self.load_product_fields(product_url, driver=driver)
             
             return {
                 'url': product_url,
-                'title': title,
-                'price': price,
-                'rating': rating
+                'title': fields['title'],
+                'price': fields['price'],
+                'rating': fields['rating']
             }
         except Exception as e:
             print(f"기본 상품 크롤링 오류 ({product_url}): {e}")
             return None
 
-    def crawl_product_detail(self, product_url, include_images=False):
+    def crawl_product_detail(self, product_url, driver=None, include_images=False):
         """상세 상품 정보 크롤링"""
         try:
-            if self.use_selenium:
-                self.driver.get(product_url)
-                self.wait.until(lambda driver: driver.execute_script("return document.readyState") == "complete")
-                soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-            else:
-                response = requests.get(product_url)
-                response.raise_for_status()
-                soup = BeautifulSoup(response.content, 'html.parser')
-            
-            title_element = soup.find('h1', {'id': 'kakaotitle'})
-            title = title_element.get_text(strip=True) if title_element else "제목 없음"
-            
-            price = 0
-            price_selectors = [
-                'span.price.gsItemPriceKWR',
-                '.pdt_price span.price',
-                'span.price',
-                '.price'
-            ]
-            for selector in price_selectors:
-                price_element = soup.select_one(selector)
-                if price_element:
-                    price_text = price_element.get_text(strip=True).replace(',', '').replace('원', '')
-                    price_match = re.search(r'(\d+)', price_text)
-                    if price_match:
-                        price = int(price_match.group(1))
-                        break
-
-            rating = self.calculate_rating(soup)
-            options = self.extract_product_options(soup)
-            material_info = self.extract_material_info(soup)
+            fields = self.load_product_fields(product_url, detail=True, driver=driver)
             
             product_data = {
                 'url': product_url,
-                'title': title,
-                'price': price,
-                'rating': rating,
-                'options': options,
-                'material_info': material_info,
+                'title': fields['title'],
+                'price': fields['price'],
+                'rating': fields['rating'],
+                'options': fields['options'],
+                'material_info': fields['material_info'],
                 'crawled_at': time.strftime('%Y-%m-%d %H:%M:%S')
             }
             
             if include_images:
                 print("이미지 정보 추출 중...")
-                product_images = self.extract_product_images(soup)
-                product_data['product_images'] = [{'original_url': img_url} for img_url in product_images]
+                product_data['product_images'] = [{'original_url': img_url} for img_url in fields['product_images']]
             else:
                 product_data['product_images'] = []
                 
@@ -215,6 +221,177 @@ class SSADAGUCrawler:
             print(f"상품 크롤링 오류 ({product_url}): {e}")
             return None
 
+    def load_product_fields(self, product_url, detail=False, driver=None):
+        """
+        상품 페이지 필드 (parse_product_fields 와 같은 형태)
+
+        Selenium + in_browser 면 페이지 안에서 스크립트로 바로 추출하고 결과를 페이지 캐시에 보관합니다.
+        그 외에는 HTML 을 받아 (또는 캐시에서 꺼내) 파싱합니다.
+        """
+        if self.use_selenium and self.in_browser:
+            fields = self.page_cache.get_parsed(product_url, 'browser_fields')
+            if fields is None:
+                driver = driver or self.driver
+                with self.limiters.slot(product_url) as slot:
+                    open_page(driver, product_url, 'product', slot)
+                fields = extract_fields_in_browser(driver, self.base_url, self.selectors, kakaotitle_only=True)
+                self.page_cache.remember(product_url, 'browser_fields', fields)
+            return fields
+
+        markup = self.load_product_page(product_url, driver)
+        return self.parse_product_fields(markup, detail=detail, product_url=product_url)
+
+    def load_product_page(self, product_url, driver=None):
+        """상품 페이지 HTML (같은 상품을 다시 요청하면 페이지 캐시에서 바로 반환)"""
+        markup = self.page_cache.get(product_url)
+        if markup is not None:
+            return markup
+
+        if self.use_selenium:
+            driver = driver or self.driver
+            with self.limiters.slot(product_url) as slot:
+                open_page(driver, product_url, 'product', slot)
+            markup = driver.page_source
+        else:
+            with self.limiters.slot(product_url):
+                markup = self.http_cache.fetch(product_url)
+        self.page_cache.put(product_url, markup)
+        return markup
+
+    def parse_product_fields(self, markup, detail=False, product_url=None):
+        """
+        상품 페이지 HTML에서 제목/가격/별점 (detail이면 옵션/재료 정보/이미지까지) 추출
+
+        single_pass 가 켜져 있으면 문서를 한 번만 순회하는 product_extractor 를 사용합니다.
+        제목은 h1#kakaotitle 만 보고 없으면 "제목 없음" 입니다.
+        product_url 을 주면 파싱 결과를 페이지 캐시에 붙여 두고 다시 파싱하지 않습니다.
+        """
+        def parsed(kind, build):
+            return self.page_cache.parsed(product_url, kind, build) if product_url else build()
+
+        if self.single_pass:
+            return parsed('fields', lambda: extract_product_fields(
+                markup, self.base_url, self.selectors, kakaotitle_only=True))
+
+        soup = parsed('soup', lambda: self.make_soup(markup))
+        title_element = soup.find('h1', {'id': 'kakaotitle'})
+        title = title_element.get_text(strip=True) if title_element else "제목 없음"
+
+        price = self.selectors.resolve(
+            'price', PRICE_SELECTORS, lambda selector: element_price(soup.select_one(selector))
+        ) or 0
+
+        rating = self.calculate_rating(soup)
+
+        fields = {'title': title, 'price': price, 'rating': rating}
+        if detail:
+            fields['options'] = self.extract_product_options(soup)
+            fields['material_info'] = self.extract_material_info(soup)
+            fields['product_images'] = self.extract_product_images(soup)
+        return fields
+
+    def crawl_products_basic(self, product_urls):
+        """
+        여러 상품의 기본 정보를 병렬로 크롤링 (입력 순서 유지, 실패한 상품은 None)
+
+        frontier 가 있으면 이미 끝난 URL 은 저장된 결과를 쓰고 나머지만 크롤링합니다.
+        """
+        def crawl(product_url, driver):
+            # 최근에 크롤링해 저장해 둔 상품은 브라우저로 열지 않음
+            stored = self.stored_product(product_url)
+            if stored is not None:
+                return {key: stored[key] for key in ('url', 'title', 'price', 'rating')}
+            return self.crawl_product_basic(product_url, driver)
+
+        if self.frontier is not None:
+            return self.frontier.crawl(product_urls, crawl, stage='basic', runner=self.crawl_in_parallel)
+        return self.crawl_in_parallel(crawl, product_urls)
+
+    def crawl_in_parallel(self, func, product_urls):
+        """
+        func(product_url, driver) 를 WebDriver 풀(또는 requests 스레드)로 나눠 실행
+
+        Returns:
+            list: 입력 순서대로의 func 결과.
+        """
+        pool = self.driver_pool if self.use_selenium else None
+        # 풀 없이 Selenium 을 쓰면 (실행 중인 Chrome 에 붙은 경우) 메인 드라이버 하나로 순서대로 실행
+        max_workers = 1 if self.use_selenium and pool is None else self.pool_size
+        return map_with_drivers(func, product_urls, pool, max_workers=max_workers)
+
+    def search_products_ajax(self, keyword, max_pages=1):
+        """ajax.infinity_shop_list.php 로 WebDriver 없이 상품 검색 (정규화한 view.php URL 리스트)"""
+        try:
+            product_links = search_product_urls(keyword, max_pages=max_pages, base_url=self.base_url)
+            print(f"AJAX 검색으로 발견한 상품 링크: {len(product_links)}개")
+            return product_links
+        except Exception as e:
+            print(f"AJAX 검색 오류: {e}")
+            return []
+
+    def search_products_network(self, keyword, max_pages=5):
+        """
+        검색 페이지가 스스로 요청한 AJAX 응답을 네트워크 로그에서 읽어 상품 검색 (DOM 스크래핑 없음)
+
+        스크롤로 불러오는 다음 페이지 응답까지 max_pages 페이지를 모읍니다.
+        """
+        encoded_keyword = urllib.parse.quote(keyword)
+        search_url = f"{self.base_url}/shop/search.php?ss_tx={encoded_keyword}"
+        try:
+            products = capture_search_products(self.driver, search_url, max_pages=max_pages)
+        except Exception as e:
+            print(f"네트워크 캡처 검색 오류: {e}")
+            return []
+
+        product_links = []
+        for product in products:
+            url = product_view_url(product, self.base_url)
+            if url is not None and url not in product_links:
+                product_links.append(url)
+        print(f"네트워크 캡처로 발견한 상품 링크: {len(product_links)}개")
+        return product_links
+
+    def stored_product(self, product_url, keyword=None):
+        """
+        최근에 (다른 키워드로라도) 크롤링해 상품 저장소에 둔 상품 (없거나 오래됐으면 None)
+
+        있으면 브라우저로 다시 열지 않고 저장된 상품을 결과로 씁니다. keyword 를 주면
+        저장소에서 이 검색어로도 찾을 수 있게 기록합니다.
+        """
+        if self.seen is None or self.product_store is None or not self.seen.is_fresh(product_url):
+            return None
+        key = product_key(product_url)
+        product = self.product_store.get(key[1], key[0])
+        if product is not None and keyword:
+            self.product_store.add_keyword(key, keyword)
+        return product
+
+    def mark_seen(self, product_url):
+        """product_url 상품을 크롤링했다고 기록"""
+        if self.seen is not None:
+            self.seen.mark(product_url)
+
+    def save_product(self, product_data, keyword=None):
+        """상품을 상품 저장소에 upsert 하고 result_sink 에 한 줄 기록 (keyword 는 이 상품을 찾은 검색어)"""
+        if self.product_store is not None:
+            self.product_store.upsert(product_data, keyword)
+        if self.result_sink is not None:
+            self.result_sink.write(dict(product_data, keyword=keyword) if keyword else product_data)
+
+    def search_products(self, keyword):
+        """search_mode 에 따라 상품 검색 ('ajax'/'network' 결과가 없으면 브라우저/HTML 검색으로 대체, 같은 상품은 한 번만)"""
+        if self.search_mode == 'ajax':
+            product_links = self.search_products_ajax(keyword)
+            if product_links:
+                return dedupe_product_urls(product_links)
+        if self.search_mode == 'network' and self.use_selenium:
+            product_links = self.search_products_network(keyword)
+            if product_links:
+                return dedupe_product_urls(product_links)
+        if self.use_selenium:
+            return dedupe_product_urls(self.search_products_selenium(keyword))
+        return dedupe_product_urls(self.search_products_requests(keyword))
+
     def calculate_rating(self, soup):
         rating = 0.0
         star_containers = [
@@ -355,6 +532,16 @@ class SSADAGUCrawler:
                 self.driver.quit()
             except:
                 pass
+        if getattr(self, 'driver_pool', None) is not None:
+            self.driver_pool.close()
+        if getattr(self, 'seen', None) is not None:
+            self.seen.close()
+        if getattr(self, 'product_store', None) is not None:
+            self.product_store.close()
+        if getattr(self, 'result_sink', None) is not None:
+            self.result_sink.close()
+        if getattr(self, 'frontier', None) is not None:
+            self.frontier.close()
 
 # 텍스트 유사도 분석기
 class SimilarityAnalyzer:
@@ -423,32 +610,9 @@ TOP_LEVEL_CATEGORIES = {
 }
 
 def search_naver_rank(category_id):
-    url = "https://datalab.naver.com/shoppingInsight/getCategoryKeywordRank.naver"
-    headers = {
-        "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
-        "Referer": "https://datalab.naver.com/shoppingInsight/sCategory.naver",
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36"
-    }
-    keywords = []
-    payload = {
-        "cid": category_id,
-        "timeUnit": "date",
-        "startDate": "2025-08-28",
-        "endDate": "2025-08-29",
-        "age": "",
-        "gender": "",
-        "device": "",
-        "page": 1,
-    }
-    try:
-        response = requests.post(url, headers=headers, data=payload)
-        response.raise_for_status()
-        data = response.json()
-        for item in data.get('ranks', []):
-            keywords.append(item.get('keyword'))
-    except (requests.exceptions.RequestException, json.JSONDecodeError) as e:
-        print(f"네이버 데이터랩에서 데이터를 가져오는 데 실패했습니다: {e}")
-    return keywords
+    # 디스크 캐시(naver_datalab.RankCache)에 있으면 네트워크 요청 없이 재사용
+    ranks = fetch_rank_page(category_id, page=1)
+    return [keyword for _, keyword in ranks or []]
 
 # 메인 함수 (원래대로 단순하게)
 def main_simplified():
@@ -457,6 +621,8 @@ def main_simplified():
     print("\n=== SSADAGU 크롤러 (KoNLPy 오류 수정) ===")
 
     crawler = SSADAGUCrawler(use_selenium=True)
+    # 이번 실행에서 선택한 상품을 실행마다 새 파일에 한 줄씩 기록
+    crawler.result_sink = JsonlSink(f"fixed_crawler_result_{int(time.time())}.jsonl.gz", cls=NumpyEncoder)
     analyzer = SimilarityAnalyzer()
 
     TEXT_SIMILARITY_THRESHOLD = 0.6
@@ -465,20 +631,19 @@ def main_simplified():
     best_match_product = None
     best_match_url = None
 
+    # 전체 카테고리의 인기 검색어를 병렬로 한 번에 수집 (재시도마다 요청하지 않음)
+    category_ranks = harvest_keyword_ranks(TOP_LEVEL_CATEGORIES)
+
     for attempt in range(MAX_RETRY):
         category_name = random.choice(list(TOP_LEVEL_CATEGORIES.keys()))
         category_id = TOP_LEVEL_CATEGORIES[category_name]
-        trending_keywords = search_naver_rank(category_id)
+        trending_keywords = [kw for _, kw in category_ranks.get(category_id, [])]
 
         keyword = random.choice(trending_keywords) if trending_keywords else "악세사리"
         print(f"\n[{attempt+1}/{MAX_RETRY}] 선택된 카테고리: {category_name}, 키워드: {keyword}")
 
         # 검색
-        search_results_urls = (
-            crawler.search_products_selenium(keyword)
-            if crawler.use_selenium
-            else crawler.search_products_requests(keyword)
-        )
+        search_results_urls = crawler.search_products(keyword)
 
         if not search_results_urls:
             print("검색 결과 없음 → 다음 키워드로 재시도")
@@ -491,8 +656,8 @@ def main_simplified():
             all_products = []
             keyword_included_products = []
             
-            for i, url in enumerate(search_results_urls[:20]):
-                basic_data = crawler.crawl_product_basic(url)
+            basic_results = crawler.crawl_products_basic(search_results_urls[:20])
+            for i, basic_data in enumerate(basic_results):
                 if not basic_data or basic_data['title'] == "제목 없음":
                     continue
                 
@@ -559,11 +724,16 @@ def main_simplified():
                 print(f"\n🎯 최종 선택: {selected_product['title']}")
                 print(f"선택 이유: {selection_reason}")
                 
-                # 상세 정보 크롤링
-                best_match_product = crawler.crawl_product_detail(selected_product['url'], include_images=True)
+                # 상세 정보 크롤링 (최근에 크롤링해 저장해 둔 상품이면 그대로 사용)
+                best_match_product = crawler.stored_product(selected_product['url'])
+                if best_match_product is None:
+                    best_match_product = crawler.crawl_product_detail(selected_product['url'], include_images=True)
+                    if best_match_product:
+                        crawler.mark_seen(selected_product['url'])
                 if best_match_product:
                     best_match_product['selection_reason'] = selection_reason
                     best_match_url = selected_product['url']
+                    crawler.save_product(best_match_product, keyword)
                     break
                 else:
                     print("상세 크롤링 실패 → 다음 키워드로 재시도")
@@ -573,6 +743,14 @@ def main_simplified():
             print(f"분석 과정 오류: {e}")
             continue
 
+    crawler.result_sink.close()
+
+    # 셀렉터 적중률 통계
+    crawler.selectors.report()
+    crawler.limiters.report()
+    if not crawler.use_selenium:
+        crawler.http_cache.report()
+
     # 최종 결과 처리
     if best_match_product:
         print(f"\n🎉 크롤링 완료!")
@@ -581,10 +759,9 @@ def main_simplified():
         print(f"별점: {best_match_product['rating']}")
         print(f"선택 이유: {best_match_product['selection_reason']}")
 
-        output_filename = f"fixed_crawler_result_{int(time.time())}.json"
-        with open(output_filename, 'w', encoding='utf-8') as f:
-            json.dump(best_match_product, f, ensure_ascii=False, indent=2, cls=NumpyEncoder)
-        print(f"결과 저장 완료: {output_filename}")
+        if crawler.product_store is not None:
+            print(f"결과 저장 완료: 상품 저장소 '{crawler.product_store.path}'")
+        print(f"이번 실행 결과 파일: {crawler.result_sink.path}")
         
         return best_match_product
     else:
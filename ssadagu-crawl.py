@@ -1,18 +1,34 @@
+import copy
 import requests
 import urllib.parse
-from bs4 import BeautifulSoup
 import re
-import json
 import time
 import random
-from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import subprocess
 import sys
-import csv
+
+from naver_datalab import fetch_rank_page
+from browser_scripts import extract_fields_in_browser, harvest_links
+from chrome_profile import apply_lite_options, attach_options, create_chrome_driver, warm_chrome_address
+from crawl_frontier import CrawlFrontier
+from driver_pool import WebDriverPool, map_with_drivers
+from http_cache import HttpCache
+from network_capture import capture_search_products, enable_performance_logging
+from page_cache import PageCache
+from page_ready import open_page, wait_until_ready
+from product_extractor import (
+    NO_TITLE, PRICE_SELECTORS, TITLE_SELECTORS, element_price, element_title, extract_product_fields,
+    find_title_element
+)
+from product_identity import SeenProducts, dedupe_product_urls, product_key
+from product_parser import best_backend, make_soup
+from product_store import ProductStore
+from rate_limit import get_host_limiters
+from result_sink import JsonlSink
+from selector_planner import SelectorRegistry
+from ssadagu_search import product_view_url, search_product_urls
 
 # --- 이미지 번역 기능에 대한 주석 추가 ---
 def ocr_and_translate_image(image_url):
@@ -33,9 +49,46 @@ def ocr_and_translate_image(image_url):
 
 # --- SSADAGUCrawler 클래스 (crawler.py에서 가져옴) ---
 class SSADAGUCrawler:
-    def __init__(self, use_selenium=True):
+    def __init__(self, use_selenium=True, parser_backend=None, single_pass=None, search_mode='ajax', pool_size=4, lite=True, in_browser=True,
+                 debugger_address=None, user_data_dir=None, frontier_path='crawl_frontier.db',
+                 seen_path='seen_products.db', store_path='products.db'):
         self.base_url = "https://ssadagu.kr"
         self.use_selenium = use_selenium
+        # HTML 파서 백엔드 ('html.parser', 'lxml', 'selectolax') - 기본값은 설치된 것 중 가장 빠른 것
+        self.parser_backend = parser_backend or best_backend()
+        # True면 상품 페이지를 한 번만 순회하는 product_extractor 로 필드 추출 (html.parser 기반이라
+        # lxml/selectolax 보다 느림) - None이면 더 빠른 백엔드가 없을 때(html.parser)만 사용
+        self.single_pass = self.parser_backend == 'html.parser' if single_pass is None else single_pass
+        # 'ajax' 면 AJAX 검색 API로 검색 (WebDriver 불필요), 'browser' 면 검색 페이지를 직접 열어서 검색,
+        # 'network' 면 검색 페이지를 열고 페이지가 받아온 AJAX 응답을 네트워크 로그에서 읽어 검색
+        self.search_mode = search_mode
+        # 상품 페이지를 병렬로 크롤링할 때 쓸 WebDriver 수 (풀의 드라이버는 필요할 때 생성)
+        self.pool_size = pool_size
+        self.driver_pool = None
+        # True면 이미지/미디어/폰트/추적 스크립트를 받지 않는 가벼운 Chrome 으로 크롤링
+        self.lite = lite
+        # True면 Selenium 으로 연 상품 페이지에서 스크립트로 필드를 바로 추출 (page_source 직렬화/재파싱 생략)
+        self.in_browser = in_browser
+        # 설정하면 (또는 SSADAGU_CHROME_DEBUGGER / SSADAGU_CHROME_PROFILE 환경 변수) 매번 Chrome 을 새로 띄우지 않고
+        # 캐시/쿠키가 유지되는 오래 떠 있는 Chrome 에 원격 디버깅 주소로 붙음
+        self.debugger_address = debugger_address
+        self.user_data_dir = user_data_dir
+        # 제목/가격/검색 링크 대체 셀렉터 적중 통계 (시도 순서는 고정, 기본 셀렉터가 자주 빠지면 경고 - stats/report 로 확인)
+        self.selectors = SelectorRegistry()
+        # 이미 받은 상품 페이지를 다시 요청하지 않도록 보관 (정규화한 URL 기준 LRU + TTL)
+        self.page_cache = PageCache()
+        # requests 로 받는 상품 페이지의 디스크 캐시 (ETag/Last-Modified 조건부 요청, 304 면 저장본 사용)
+        self.http_cache = HttpCache()
+        # 호스트별 동시 요청 수를 응답 상태/지연에 맞춰 조절 (고정 대기 대신)
+        self.limiters = get_host_limiters()
+        # 상품마다 결과를 바로 커밋하는 SQLite 작업 목록 (중간에 죽어도 다시 실행하면 남은 URL 만 크롤링, None이면 사용 안 함)
+        self.frontier = CrawlFrontier(frontier_path) if frontier_path else None
+        # 여러 실행/키워드에 걸쳐 최근에 크롤링한 상품 (platform, num_iid) 기록 (None이면 사용 안 함)
+        self.seen = SeenProducts(seen_path) if seen_path else None
+        # 크롤링한 상품을 상품 번호 기준으로 upsert 하는 SQLite 상품 저장소 (None이면 사용 안 함)
+        self.product_store = ProductStore(store_path) if store_path else None
+        # 설정하면 save_product 한 상품을 JSONL 로 한 줄씩 바로 기록 (JsonlSink)
+        self.result_sink = None
         if use_selenium:
             self.setup_selenium()
         else:
@@ -44,6 +97,10 @@ class SSADAGUCrawler:
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
             })
 
+    def make_soup(self, markup):
+        """설정된 파서 백엔드로 HTML 파싱"""
+        return make_soup(markup, self.parser_backend)
+
     def setup_selenium(self):
         """Selenium WebDriver 설정"""
         chrome_options = Options()
@@ -53,9 +110,24 @@ class SSADAGUCrawler:
         chrome_options.add_argument('--disable-gpu')
         chrome_options.add_argument('--window-size=1920,1080')
         chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+        if self.lite:
+            apply_lite_options(chrome_options)
         try:
-            self.driver = webdriver.Chrome(options=chrome_options)
+            debugger_address = warm_chrome_address(self.debugger_address, self.user_data_dir, chrome_options.arguments,
+                                                   chrome_options.experimental_options.get('prefs'))
+            main_options = attach_options(debugger_address) if debugger_address else chrome_options
+            if self.search_mode == 'network':
+                # 검색용 메인 드라이버만 네트워크 로그 사용 (새로 만드는 풀 드라이버에는 로그가 쌓이지 않게)
+                main_options = enable_performance_logging(copy.deepcopy(main_options))
+            self.driver = create_chrome_driver(main_options, self.lite)
             self.wait = WebDriverWait(self.driver, 10)
+            if debugger_address:
+                # 한 브라우저를 여러 세션이 나눠 쓰지 않도록 상품 페이지도 메인 드라이버로 순서대로 크롤링
+                print(f"실행 중인 Chrome 에 연결했습니다: {debugger_address}")
+            else:
+                # 메인 드라이버도 풀의 한 자리로 써서 Chrome 은 최대 pool_size 개만 뜸
+                self.driver_pool = WebDriverPool(lambda: create_chrome_driver(chrome_options, self.lite),
+                                                 size=self.pool_size, drivers=[self.driver])
             print("Selenium WebDriver 초기화 완료")
         except Exception as e:
             print(f"Selenium 초기화 실패: {e}")
@@ -69,14 +141,9 @@ class SSADAGUCrawler:
         search_url = f"{self.base_url}/shop/search.php?ss_tx={encoded_keyword}"
         try:
             self.driver.get(search_url)
-            time.sleep(5)
-            product_links = []
-            link_elements = self.driver.find_elements(By.TAG_NAME, "a")
-            for element in link_elements:
-                href = element.get_attribute('href')
-                if href and 'view.php' in href and ('platform=1688' in href or 'num_iid' in href):
-                    product_links.append(href)
-            product_links = list(set(product_links))
+            wait_until_ready(self.driver, 'search')
+            # 상품 링크를 페이지 안에서 걸러 한 번의 왕복으로 수집
+            product_links = harvest_links(self.driver) or []
             print(f"Selenium으로 발견한 상품 링크: {len(product_links)}개")
             return product_links
         except Exception as e:
@@ -90,7 +157,7 @@ class SSADAGUCrawler:
         try:
             response = self.session.get(search_url)
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = self.make_soup(response.content)
             product_links = []
             all_links = soup.find_all('a', href=True)
             for link in all_links:
@@ -104,6 +171,100 @@ class SSADAGUCrawler:
             print(f"requests 검색 오류: {e}")
             return []
 
+    def crawl_in_parallel(self, func, product_urls):
+        """
+        func(product_url, driver) 를 WebDriver 풀(또는 requests 스레드)로 나눠 실행
+
+        Returns:
+            list: 입력 순서대로의 func 결과.
+        """
+        pool = self.driver_pool if self.use_selenium else None
+        # 풀 없이 Selenium 을 쓰면 (실행 중인 Chrome 에 붙은 경우) 메인 드라이버 하나로 순서대로 실행
+        max_workers = 1 if self.use_selenium and pool is None else self.pool_size
+        return map_with_drivers(func, product_urls, pool, max_workers=max_workers)
+
+    def search_products_ajax(self, keyword, max_pages=1):
+        """ajax.infinity_shop_list.php 로 WebDriver 없이 상품 검색 (정규화한 view.php URL 리스트)"""
+        try:
+            product_links = search_product_urls(keyword, max_pages=max_pages, base_url=self.base_url)
+            print(f"AJAX 검색으로 발견한 상품 링크: {len(product_links)}개")
+            return product_links
+        except Exception as e:
+            print(f"AJAX 검색 오류: {e}")
+            return []
+
+    def search_products_network(self, keyword, max_pages=5):
+        """
+        검색 페이지가 스스로 요청한 AJAX 응답을 네트워크 로그에서 읽어 상품 검색 (DOM 스크래핑 없음)
+
+        스크롤로 불러오는 다음 페이지 응답까지 max_pages 페이지를 모읍니다.
+        """
+        encoded_keyword = urllib.parse.quote(keyword)
+        search_url = f"{self.base_url}/shop/search.php?ss_tx={encoded_keyword}"
+        try:
+            products = capture_search_products(self.driver, search_url, max_pages=max_pages)
+        except Exception as e:
+            print(f"네트워크 캡처 검색 오류: {e}")
+            return []
+
+        product_links = []
+        for product in products:
+            url = product_view_url(product, self.base_url)
+            if url is not None and url not in product_links:
+                product_links.append(url)
+        print(f"네트워크 캡처로 발견한 상품 링크: {len(product_links)}개")
+        return product_links
+
+    def load_product(self, product_url):
+        """상품 저장소에 저장된 상품 (없으면 None, 신선도와 상관없이)"""
+        key = product_key(product_url)
+        return self.product_store.get(key[1], key[0])
+
+    def stored_product(self, product_url, keyword=None):
+        """
+        최근에 (다른 키워드로라도) 크롤링해 상품 저장소에 둔 상품 (없거나 오래됐으면 None)
+
+        있으면 브라우저로 다시 열지 않고 저장된 상품을 결과로 씁니다. keyword 를 주면
+        저장소에서 이 검색어로도 찾을 수 있게 기록합니다.
+        """
+        if self.seen is None or self.product_store is None or not self.seen.is_fresh(product_url):
+            return None
+        key = product_key(product_url)
+        product = self.product_store.get(key[1], key[0])
+        if product is not None and keyword:
+            self.product_store.add_keyword(key, keyword)
+        return product
+
+    def mark_seen(self, product_url):
+        """product_url 상품을 크롤링했다고 기록"""
+        if self.seen is not None:
+            self.seen.mark(product_url)
+
+    def save_product(self, product_data, keyword=None):
+        """상품을 상품 저장소에 upsert 하고 result_sink 에 한 줄 기록 (keyword 는 이 상품을 찾은 검색어)"""
+        if self.product_store is not None:
+            self.product_store.upsert(product_data, keyword)
+        self.record_result(product_data, keyword)
+
+    def record_result(self, product_data, keyword=None):
+        """result_sink 에 상품 한 줄 기록 (새로 크롤링하지 않고 저장된 결과를 쓴 상품도 기록)"""
+        if self.result_sink is not None:
+            self.result_sink.write(dict(product_data, keyword=keyword) if keyword else product_data)
+
+    def search_products(self, keyword):
+        """search_mode 에 따라 상품 검색 ('ajax'/'network' 결과가 없으면 브라우저/HTML 검색으로 대체, 같은 상품은 한 번만)"""
+        if self.search_mode == 'ajax':
+            product_links = self.search_products_ajax(keyword)
+            if product_links:
+                return dedupe_product_urls(product_links)
+        if self.search_mode == 'network' and self.use_selenium:
+            product_links = self.search_products_network(keyword)
+            if product_links:
+                return dedupe_product_urls(product_links)
+        if self.use_selenium:
+            return dedupe_product_urls(self.search_products_selenium(keyword))
+        return dedupe_product_urls(self.search_products_requests(keyword))
+
     def calculate_rating(self, soup):
         """별점 계산 (별=1, 반별=0.5, 빈별=0)"""
         rating = 0.0
@@ -182,66 +343,73 @@ class SSADAGUCrawler:
                 material_info[title] = info
         return material_info
 
-    def crawl_product_detail(self, product_url):
-        """개별 상품 상세 정보 크롤링"""
+    def crawl_product_detail(self, product_url, driver=None):
+        """개별 상품 상세 정보 크롤링 (driver 를 주면 그 WebDriver 로 페이지를 엶)"""
         try:
+            markup = self.page_cache.get(product_url)
+            if markup is not None:
+                return self.parse_product_page(markup, product_url)
             if self.use_selenium:
-                return self.crawl_with_selenium(product_url)
+                return self.crawl_with_selenium(product_url, driver)
             else:
                 return self.crawl_with_requests(product_url)
         except Exception as e:
             print(f"상품 크롤링 오류 ({product_url}): {e}")
             return None
 
-    def crawl_with_selenium(self, product_url):
+    def crawl_with_selenium(self, product_url, driver=None):
         """Selenium으로 상품 정보 크롤링"""
-        self.driver.get(product_url)
-        time.sleep(3)
-        soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-        return self.extract_product_data(soup, product_url)
+        driver = driver or self.driver
+        with self.limiters.slot(product_url) as slot:
+            open_page(driver, product_url, 'product', slot)
+        if self.in_browser:
+            # page_source 를 받아 다시 파싱하지 않고 페이지 안에서 바로 추출
+            fields = extract_fields_in_browser(driver, self.base_url, self.selectors)
+            return self.product_data_from_fields(product_url, fields)
+        return self.parse_product_page(self.cache_page(product_url, driver.page_source), product_url)
 
     def crawl_with_requests(self, product_url):
         """requests로 상품 정보 크롤링"""
-        response = self.session.get(product_url)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
-        return self.extract_product_data(soup, product_url)
+        with self.limiters.slot(product_url):
+            markup = self.http_cache.fetch(product_url, self.session)
+        return self.parse_product_page(self.cache_page(product_url, markup), product_url)
+
+    def cache_page(self, product_url, markup):
+        """받아온 상품 페이지 HTML을 페이지 캐시에 저장하고 그대로 반환"""
+        self.page_cache.put(product_url, markup)
+        return markup
 
     def extract_product_data(self, soup, product_url):
         """soup 객체에서 상품 데이터 추출"""
-        title_element = soup.find('h1', {'id': 'kakaotitle'})
-        title = title_element.get_text(strip=True) if title_element else "제목 없음"
-        if title == "제목 없음" or not title:
-            alt_titles = [
-                soup.find('h1'),
-                soup.find('title'),
-                soup.find('div', class_=re.compile(r'title|name'))
-            ]
-            for alt_title in alt_titles:
-                if alt_title:
-                    title = alt_title.get_text(strip=True)
-                    if title and title != "제목 없음":
-                        break
-        price = 0
-        price_selectors = [
-            'span.price.gsItemPriceKWR',
-            '.pdt_price span.price',
-            'span.price',
-            '.price'
-        ]
-        for selector in price_selectors:
-            price_element = soup.select_one(selector)
-            if price_element:
-                price_text = price_element.get_text(strip=True).replace(',', '').replace('원', '')
-                price_match = re.search(r'(\d+)', price_text)
-                if price_match:
-                    price = int(price_match.group(1))
-                    break
+        title = self.selectors.resolve(
+            'title', TITLE_SELECTORS, lambda selector: element_title(find_title_element(soup, selector))
+        ) or NO_TITLE
+        price = self.selectors.resolve(
+            'price', PRICE_SELECTORS, lambda selector: element_price(soup.select_one(selector))
+        ) or 0
         rating = self.calculate_rating(soup)
         options = self.extract_product_options(soup)
         material_info = self.extract_material_info(soup)
         product_images = self.extract_product_images(soup)
+        return self.build_product_data(product_url, title, price, rating, options, material_info, product_images)
+
+    def parse_product_page(self, markup, product_url):
+        """상품 페이지 HTML에서 상품 데이터 추출"""
+        if self.single_pass:
+            # 문서를 한 번만 순회하며 모든 필드 수집 (extract_product_data 와 같은 결과)
+            fields = extract_product_fields(markup, self.base_url, self.selectors)
+            return self.product_data_from_fields(product_url, fields)
+        return self.extract_product_data(self.make_soup(markup), product_url)
 
+    def product_data_from_fields(self, product_url, fields):
+        """extract_product_fields 형태의 필드 dict 로 상품 데이터 구성"""
+        return self.build_product_data(
+            product_url, fields['title'], fields['price'], fields['rating'],
+            fields['options'], fields['material_info'], fields['product_images']
+        )
+
+    def build_product_data(self, product_url, title, price, rating, options, material_info, product_images):
+        """추출한 필드로 상품 데이터 dict 구성 (이미지 번역 포함)"""
         translated_images = []
         for img_url in product_images:
             translated_text = ocr_and_translate_image(img_url)
@@ -265,26 +433,53 @@ class SSADAGUCrawler:
     def crawl_search_results(self, keyword, max_products=5):
         """검색 결과에서 상품들 크롤링"""
         print(f"'{keyword}' 검색 시작...")
-        if self.use_selenium:
-            product_links = self.search_products_selenium(keyword)
-        else:
-            product_links = self.search_products_requests(keyword)
+        product_links = self.search_products(keyword)
         
         if not product_links:
             print("검색 결과를 찾을 수 없습니다.")
             return []
         
         print(f"{len(product_links)}개의 상품 링크를 처리합니다.")
+        links = product_links[:max_products]
+
+        # crawl 이 결과를 기록한 URL (frontier 가 저장된 결과를 돌려준 URL 은 아래에서 기록)
+        recorded = set()
+
+        def crawl(link, driver):
+            recorded.add(link)
+            # 최근에 (다른 키워드로라도) 크롤링한 상품은 브라우저로 열지 않고 저장된 상품 사용
+            stored = self.stored_product(link, keyword)
+            if stored is not None:
+                self.record_result(stored, keyword)
+                return stored
+            product_data = self.crawl_product_detail(link, driver)
+            if product_data:
+                self.mark_seen(link)
+                self.save_product(product_data, keyword)
+            return product_data
+
+        # 호스트 제어기가 응답 상태/지연에 따라 동시 요청 수를 정하므로 고정 대기 없음
+        if self.frontier is not None:
+            # 이전 실행에서 이 키워드로 넣고 못 끝낸 URL 도 이어서 크롤링 (끝난 URL 은 저장된 결과 사용)
+            links = self.frontier.with_unfinished(product_links, keyword, stage='detail_ocr', limit=max_products)
+            # 상품 저장소가 있으면 결과는 저장소에만 두고 frontier 에는 상태만 기록
+            load = self.load_product if self.product_store is not None else None
+            results = self.frontier.crawl(links, crawl, keyword, stage='detail_ocr',
+                                          runner=self.crawl_in_parallel, load=load)
+            for link, product_data in zip(links, results):
+                if product_data and link not in recorded:
+                    self.record_result(product_data, keyword)
+        else:
+            results = self.crawl_in_parallel(crawl, links)
+
         crawled_products = []
-        for i, link in enumerate(product_links[:max_products]):
-            print(f"\n상품 {i+1}/{min(len(product_links), max_products)} 크롤링 중...")
-            product_data = self.crawl_product_detail(link)
+        for i, product_data in enumerate(results):
+            print(f"\n상품 {i+1}/{len(links)} 크롤링 결과")
             if product_data:
                 crawled_products.append(product_data)
                 print(f"✓ 크롤링 성공: {product_data['title'][:50]}...")
             else:
                 print("✗ 크롤링 실패")
-            time.sleep(random.uniform(2, 4))
         return crawled_products
 
     def __del__(self):
@@ -294,6 +489,16 @@ class SSADAGUCrawler:
                 self.driver.quit()
             except:
                 pass
+        if getattr(self, 'driver_pool', None) is not None:
+            self.driver_pool.close()
+        if getattr(self, 'seen', None) is not None:
+            self.seen.close()
+        if getattr(self, 'product_store', None) is not None:
+            self.product_store.close()
+        if getattr(self, 'result_sink', None) is not None:
+            self.result_sink.close()
+        if getattr(self, 'frontier', None) is not None:
+            self.frontier.close()
 
 def install_packages():
     """필요한 라이브러리를 설치합니다."""
@@ -314,35 +519,9 @@ TOP_LEVEL_CATEGORIES = {
 }
 
 def search_naver_rank(category_id):
-    """네이버 데이터랩에서 카테고리별 인기 검색어 순위를 가져옵니다."""
-    url = "https://datalab.naver.com/shoppingInsight/getCategoryKeywordRank.naver"
-    headers = {
-        "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
-        "Referer": "https://datalab.naver.com/shoppingInsight/sCategory.naver",
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36"
-    }
-    keywords = []
-    payload = {
-        "cid": category_id,
-        "timeUnit": "date",
-        "startDate": "2025-08-28",
-        "endDate": "2025-08-29",
-        "age": "",
-        "gender": "",
-        "device": "",
-        "page": 1,
-    }
-    response = requests.post(url, headers=headers, data=payload)
-    if response.status_code == 200:
-        try:
-            data = response.json()
-            for item in data.get('ranks', []):
-                keywords.append(item.get('keyword'))
-        except json.JSONDecodeError:
-            print("JSON 데이터를 파싱하는 데 실패했습니다.")
-    else:
-        print(f"네이버 데이터랩에서 데이터를 가져오는 데 실패했습니다. 상태 코드: {response.status_code}")
-    return keywords
+    """네이버 데이터랩에서 카테고리별 인기 검색어 순위를 가져옵니다. (디스크 캐시 사용)"""
+    ranks = fetch_rank_page(category_id, page=1)
+    return [keyword for _, keyword in ranks or []]
 
 # --- 수정된 메인 로직 ---
 def main_merged():
@@ -363,8 +542,12 @@ def main_merged():
     print(f"🔍 선택된 검색 키워드: '{keyword}'")
     
     crawler = SSADAGUCrawler(use_selenium=True)
+    # 이번 실행에서 크롤링한 상품을 나오는 대로 한 줄씩 기록 (실행마다 새 파일, read_jsonl 로 읽기)
+    crawler.result_sink = JsonlSink(f"ssadagu_products_{int(time.time())}.jsonl.gz")
     products = crawler.crawl_search_results(keyword, max_products=1)
 
+    crawler.result_sink.close()
+
     print(f"\n=== 크롤링 결과: {len(products)}개 상품 ===")
     for i, product in enumerate(products, 1):
         if product:
@@ -380,11 +563,9 @@ def main_merged():
                 print(f"     번역 텍스트: {img_info['translated_text']}")
     
     if products:
-        filename_keyword = keyword
-        output_filename = f"ssadagu_products_{filename_keyword}_{int(time.time())}.json"
-        with open(output_filename, 'w', encoding='utf-8') as f:
-            json.dump(products, f, ensure_ascii=False, indent=2)
-        print(f"\n결과가 '{output_filename}' 파일로 저장되었습니다.")
+        if crawler.product_store is not None:
+            print(f"\n결과가 상품 저장소 '{crawler.product_store.path}' 에 저장되었습니다. (전체 {len(crawler.product_store)}개 상품)")
+        print(f"이번 실행 결과가 '{crawler.result_sink.path}' 파일로 저장되었습니다.")
         total_options = sum(len(p['options']) for p in products)
         total_images = sum(len(p['product_images']) for p in products)
         avg_rating = sum(p['rating'] for p in products) / len(products) if products else 0
@@ -395,6 +576,10 @@ def main_merged():
         print(f"평균 별점: {avg_rating:.2f}/5.0")
     else:
         print("\n크롤링된 상품이 없습니다.")
+    crawler.selectors.report()
+    crawler.limiters.report()
+    if not crawler.use_selenium:
+        crawler.http_cache.report()
 
 if __name__ == "__main__":
     main_merged()
\ No newline at end of file
@@ -0,0 +1,285 @@
+import json
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from bs4 import BeautifulSoup
+
+# lxml이 있으면 여러 HTML 조각을 한 번에 파싱하는 빠른 경로 사용
+try:
+    import lxml.html
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    lxml = None
+    etree = None
+    LXML_AVAILABLE = False
+
+# 싸다구 검색 결과 무한 스크롤 AJAX API
+BASE_URL = "https://ssadagu.kr"
+SEARCH_URL = f"{BASE_URL}/shop/ajax.infinity_shop_list.php"
+# request_search_page 가 hi_platform 으로 요청하는 플랫폼
+DEFAULT_PLATFORM = '1688'
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+
+def request_search_page(search_term, page=1, filters=None, sort_by="default", price_min="", price_max="",
+                        session=None):
+    """
+    ajax.infinity_shop_list.php 한 페이지를 요청하는 함수
+
+    Args:
+        search_term (str): 검색할 상품 키워드.
+        page (int, optional): 조회할 페이지 번호. Defaults to 1.
+        filters (list, optional): 적용할 필터 리스트. Defaults to ['activeType'].
+        sort_by (str, optional): 정렬 방식. Defaults to "default".
+        price_min (str, optional): 최소 가격. Defaults to "".
+        price_max (str, optional): 최대 가격. Defaults to "".
+        session (requests.Session, optional): 재사용할 세션.
+
+    Returns:
+        dict: 서버로부터 받은 응답 데이터 (JSON) 또는 에러 발생 시 None.
+    """
+    if filters is None:
+        filters = ['activeType']
+
+    payload = {
+        'page_div_id': 'infinity_item_list',
+        'page_type': 'pc',
+        'ss_tx': search_term,
+        'search_option_array': filters,
+        'hi_platform': DEFAULT_PLATFORM,
+        'price_min': price_min,
+        'price_max': price_max,
+        'sort_item': sort_by,
+        'page': page
+    }
+    encoded_q = urllib.parse.quote(search_term, safe="")
+    headers = {
+        'User-Agent': USER_AGENT,
+        'X-Requested-With': 'XMLHttpRequest',
+        'Referer': f'https://ssadagu.kr/shop/search.php?ss_tx={encoded_q}'
+    }
+
+    try:
+        response = (session or requests).post(SEARCH_URL, data=payload, headers=headers, timeout=15)
+        response.raise_for_status()
+        return response.json()
+    except requests.exceptions.RequestException as e:
+        print(f"HTTP 요청 중 에러가 발생했습니다 (page={page}): {e}")
+        return None
+    except json.JSONDecodeError:
+        print(f"JSON 데이터를 파싱하는 데 실패했습니다 (page={page}).")
+        return None
+
+
+def parse_product_html(product_html):
+    """
+    검색 결과 HTML 조각 하나에서 상품 정보를 추출
+
+    Returns:
+        dict: {'gs_id', 'title', 'price', 'url', 'image_url'} 또는 <li>가 없으면 None.
+    """
+    soup = BeautifulSoup(product_html, 'html.parser')
+
+    # <li> 태그에서 데이터 속성 추출
+    li_tag = soup.find('li')
+    if not li_tag:
+        return None
+
+    # 가격과 링크는 내부 태그에서 추출
+    price_tag = soup.select_one('.product_price')
+    link_tag = soup.select_one('.product_image a')
+
+    return {
+        'gs_id': li_tag.get('data-gs-id', 'N/A'),
+        'title': li_tag.get('data-title', 'N/A'),
+        'price': price_tag.text.replace('원', '').strip() if price_tag else 'N/A',
+        'url': link_tag['href'] if link_tag and link_tag.has_attr('href') else 'N/A',
+        'image_url': li_tag.get('data-img-url', 'N/A'),
+    }
+
+
+def _class_xpath(class_name):
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')"
+
+
+if LXML_AVAILABLE:
+    # parse_product_html 의 find('li') / select_one 과 같은 의미의 XPath (문서 순서상 첫 번째)
+    _FIRST_LI = etree.XPath('(.//li)[1]')
+    _PRICE = etree.XPath(f"(.//*[{_class_xpath('product_price')}])[1]")
+    _LINK = etree.XPath(f"(.//*[{_class_xpath('product_image')}]//a)[1]")
+
+_FRAGMENT_TAG = 'ssadagu-fragment'
+
+
+def _parse_product_list_lxml(product_html_list):
+    """
+    모든 HTML 조각을 하나의 문서로 합쳐 lxml로 한 번만 파싱
+
+    조각마다 감싼 래퍼 요소 수가 조각 수와 다르면 (닫히지 않은 태그 등으로
+    구조가 깨진 경우) None을 반환해 느린 경로로 넘깁니다.
+    """
+    document = ''.join(
+        f'<{_FRAGMENT_TAG}>{product_html}</{_FRAGMENT_TAG}>' for product_html in product_html_list
+    )
+    root = lxml.html.fromstring(f'<html><body>{document}</body></html>')
+    body = root.find('body')
+    wrappers = [child for child in body if child.tag == _FRAGMENT_TAG] if body is not None else []
+    if len(wrappers) != len(product_html_list):
+        return None
+
+    products = []
+    for wrapper in wrappers:
+        li_nodes = _FIRST_LI(wrapper)
+        if not li_nodes:
+            continue
+        li_tag = li_nodes[0]
+
+        price_nodes = _PRICE(wrapper)
+        link_nodes = _LINK(wrapper)
+        link_tag = link_nodes[0] if link_nodes else None
+
+        products.append({
+            'gs_id': li_tag.get('data-gs-id', 'N/A'),
+            'title': li_tag.get('data-title', 'N/A'),
+            'price': price_nodes[0].text_content().replace('원', '').strip() if price_nodes else 'N/A',
+            'url': link_tag.get('href') if link_tag is not None and link_tag.get('href') is not None else 'N/A',
+            'image_url': li_tag.get('data-img-url', 'N/A'),
+        })
+    return products
+
+
+def parse_product_list(product_html_list, fast=True):
+    """
+    HTML 조각 리스트를 상품 dict 리스트로 변환 (<li>가 없는 조각은 건너뜀)
+
+    lxml이 설치되어 있으면 전체 조각을 한 번에 파싱하고,
+    실패하거나 lxml이 없으면 조각마다 BeautifulSoup으로 파싱합니다.
+    """
+    if fast and LXML_AVAILABLE and product_html_list:
+        try:
+            products = _parse_product_list_lxml(product_html_list)
+        except (etree.ParserError, ValueError) as e:
+            print(f"빠른 파서 실패, BeautifulSoup으로 대체합니다: {e}")
+            products = None
+        if products is not None:
+            return products
+
+    products = []
+    for product_html in product_html_list:
+        product = parse_product_html(product_html)
+        if product:
+            products.append(product)
+    return products
+
+
+def iter_search_products(search_term, max_pages=None, start_page=1, prefetch=True, **search_options):
+    """
+    검색 결과를 여러 페이지에 걸쳐 상품 단위로 흘려주는 제너레이터
+
+    현재 페이지를 소비하는 동안 다음 페이지를 백그라운드에서 미리 요청합니다.
+    응답이 실패했거나 success가 false이거나 상품이 없는 페이지에서 멈춥니다.
+
+    Args:
+        search_term (str): 검색할 상품 키워드.
+        max_pages (int, optional): 최대 페이지 수 (None이면 결과가 끝날 때까지).
+        start_page (int, optional): 시작 페이지 번호. Defaults to 1.
+        prefetch (bool, optional): 다음 페이지 미리 요청 여부. Defaults to True.
+        **search_options: request_search_page 에 전달할 검색 옵션 (filters, sort_by 등).
+
+    Yields:
+        dict: parse_product_html 결과에 'page' 키를 더한 상품 정보.
+    """
+    last_page = start_page + max_pages - 1 if max_pages else None
+    session = requests.Session()
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+
+    def fetch(page):
+        if executor is None:
+            return _Done(request_search_page(search_term, page, session=session, **search_options))
+        return executor.submit(request_search_page, search_term, page, session=session, **search_options)
+
+    try:
+        page = start_page
+        pending = fetch(page)
+        while pending is not None:
+            result_data = pending.result()
+            if not result_data or not result_data.get('success'):
+                break
+            product_html_list = result_data.get('data') or []
+            if not product_html_list:
+                break
+
+            # 현재 페이지를 넘겨주기 전에 다음 페이지 요청을 먼저 걸어둠
+            next_page = page + 1
+            pending = fetch(next_page) if last_page is None or next_page <= last_page else None
+
+            for product in parse_product_list(product_html_list):
+                product['page'] = page
+                yield product
+
+            page = next_page
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+class _Done:
+    """prefetch를 끄면 Future 대신 사용하는 이미 끝난 결과"""
+
+    def __init__(self, value):
+        self.value = value
+
+    def result(self):
+        return self.value
+
+
+def product_view_url(product, base_url=BASE_URL):
+    """
+    검색 결과 상품의 정규화한 상세 페이지 URL
+
+    조각의 링크에서 platform/num_iid 를 읽고, 없으면 data-gs-id 와 검색 플랫폼을 사용합니다.
+
+    Returns:
+        str: '{base_url}/shop/view.php?platform=...&num_iid=...' 또는 상품 번호를 모르면 None.
+    """
+    query = {}
+    url = product.get('url', 'N/A')
+    if url != 'N/A':
+        query = dict(urllib.parse.parse_qsl(urllib.parse.urlsplit(url).query))
+
+    num_iid = query.get('num_iid') or product.get('gs_id', 'N/A')
+    if not num_iid or num_iid == 'N/A':
+        return None
+    platform = query.get('platform') or DEFAULT_PLATFORM
+    return f"{base_url}/shop/view.php?" + urllib.parse.urlencode({'platform': platform, 'num_iid': num_iid})
+
+
+def search_product_urls(search_term, max_pages=1, max_products=None, base_url=BASE_URL, **search_options):
+    """
+    AJAX 검색 결과를 정규화한 상품 상세 페이지 URL 리스트로 반환 (WebDriver 불필요)
+
+    Args:
+        search_term (str): 검색할 상품 키워드.
+        max_pages (int, optional): 최대 페이지 수. Defaults to 1.
+        max_products (int, optional): 최대 URL 수 (None이면 제한 없음).
+        base_url (str, optional): 상세 페이지 URL에 쓸 사이트 주소.
+        **search_options: request_search_page 에 전달할 검색 옵션 (filters, sort_by 등).
+
+    Returns:
+        list: 중복을 제거한 view.php URL 리스트 (검색 순서 유지).
+    """
+    urls = []
+    seen = set()
+    products = iter_search_products(search_term, max_pages=max_pages, prefetch=max_pages != 1, **search_options)
+    for product in products:
+        url = product_view_url(product, base_url)
+        if url is None or url in seen:
+            continue
+        seen.add(url)
+        urls.append(url)
+        if max_products is not None and len(urls) >= max_products:
+            break
+    products.close()
+    return urls
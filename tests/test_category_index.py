@@ -0,0 +1,50 @@
+import pytest
+
+from category_index import CategoryIndex
+
+CATEGORIES = [
+    {'name': '패션의류', 'cid': 50000000, 'depth': 1},
+    {'name': '여성의류', 'cid': 50000167, 'depth': 2},
+    {'name': '원피스', 'cid': 50000807, 'depth': 3},
+    {'name': '니트', 'cid': 50000805, 'depth': 3},
+    {'name': '남성의류', 'cid': 50000169, 'depth': 2},
+    {'name': '니트', 'cid': 50000831, 'depth': 3},
+    {'name': '패션잡화', 'cid': 50000001, 'depth': 1},
+]
+
+
+@pytest.fixture
+def index():
+    return CategoryIndex.from_categories(CATEGORIES)
+
+
+def check_queries(index):
+    assert len(index) == len(CATEGORIES)
+    assert '50000807' in index
+    assert index.get(50000807) == {'name': '원피스', 'cid': '50000807', 'depth': 3, 'parent_cid': '50000167'}
+    assert index.path_names('50000807') == '패션의류 > 여성의류 > 원피스'
+    assert index.children('50000000') == ['50000167', '50000169']
+    assert index.subtree('50000167') == ['50000167', '50000807', '50000805']
+    assert index.leaves('50000000') == ['50000807', '50000805', '50000831']
+    assert index.leaves() == ['50000807', '50000805', '50000831', '50000001']
+    assert index.find_by_name('니트') == ['50000805', '50000831']
+    assert index.search_prefix('패션') == ['50000000', '50000001']
+    assert index.search_prefix('여', limit=1) == ['50000167']
+    assert index.get('1') is None
+
+
+def test_queries(index):
+    check_queries(index)
+
+
+def test_save_load_round_trip(index, tmp_path):
+    path = str(tmp_path / 'categories.idx')
+    index.save(path)
+    check_queries(CategoryIndex.load(path))
+
+
+def test_load_rejects_other_files(tmp_path):
+    path = tmp_path / 'categories.json'
+    path.write_bytes(b'{"not": "an index"}')
+    with pytest.raises(ValueError):
+        CategoryIndex.load(str(path))
@@ -0,0 +1,102 @@
+import pytest
+
+from crawl_frontier import DONE, FAILED, QUEUED, CrawlFrontier
+
+BASE = "https://ssadagu.kr/shop/view.php?platform=taobao&num_iid="
+URLS = [BASE + str(n) for n in range(1, 5)]
+
+
+class Crash(BaseException):
+    """프로세스가 죽은 것처럼 crawl 밖으로 바로 빠져나가는 예외"""
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / 'frontier.db')
+
+
+def test_resume_after_crash_crawls_only_unfinished(db_path):
+    frontier = CrawlFrontier(db_path)
+    crawled = []
+
+    def crash_on_third(url, driver):
+        if url == URLS[2]:
+            raise Crash()
+        crawled.append(url)
+        return {'url': url}
+
+    with pytest.raises(Crash):
+        frontier.crawl(URLS, crash_on_third, keyword='반지')
+    frontier.close()
+
+    # 다시 열면 in_flight 로 남은 URL 도 대기열로 돌아감
+    frontier = CrawlFrontier(db_path)
+    assert frontier.unfinished('반지') == URLS[2:]
+
+    recrawled = []
+
+    def crawl(url, driver):
+        recrawled.append(url)
+        return {'url': url}
+
+    results = frontier.crawl(URLS, crawl, keyword='반지')
+    assert recrawled == URLS[2:]
+    assert results == [{'url': url} for url in URLS]
+    assert frontier.stats() == {DONE: len(URLS)}
+    frontier.close()
+
+
+def test_with_unfinished_puts_previous_urls_first_and_limits(db_path):
+    frontier = CrawlFrontier(db_path)
+    frontier.enqueue(URLS[:2], keyword='반지')
+    frontier.enqueue(URLS[3:], keyword='목걸이')
+
+    links = frontier.with_unfinished([URLS[2], URLS[0]], keyword='반지')
+    assert links == [URLS[0], URLS[1], URLS[2]]
+    assert frontier.with_unfinished([URLS[2]], keyword='반지', limit=2) == URLS[:2]
+    assert frontier.with_unfinished([], keyword='목걸이') == URLS[3:]
+    frontier.close()
+
+
+def test_keyword_results_follow_each_keyword(db_path):
+    frontier = CrawlFrontier(db_path)
+    frontier.crawl(URLS[:2], lambda url, driver: {'url': url}, keyword='반지')
+    frontier.crawl(URLS[1:3], lambda url, driver: {'url': url}, keyword='목걸이')
+    assert frontier.results('반지') == [{'url': URLS[0]}, {'url': URLS[1]}]
+    assert frontier.results('목걸이') == [{'url': URLS[1]}, {'url': URLS[2]}]
+    frontier.close()
+
+
+def test_failed_urls_retry_until_max_attempts(db_path):
+    frontier = CrawlFrontier(db_path, max_attempts=2)
+    assert frontier.crawl(URLS[:1], lambda url, driver: None) == [None]
+    assert frontier.unfinished() == URLS[:1]
+    frontier.crawl(URLS[:1], lambda url, driver: None)
+    assert frontier.stats() == {FAILED: 1}
+    frontier.close()
+
+
+def test_load_keeps_only_status_in_frontier(db_path):
+    frontier = CrawlFrontier(db_path)
+    store = {}
+
+    def crawl(url, driver):
+        store[url] = {'url': url, 'title': '상품'}
+        return store[url]
+
+    frontier.crawl(URLS[:2], crawl, load=store.get)
+    assert frontier.result(URLS[0]) is None
+    assert frontier.results() == []
+
+    store[URLS[0]]['title'] = '바뀐 상품'
+    results = frontier.crawl(URLS[:2], lambda url, driver: pytest.fail("끝난 URL 을 다시 크롤링함"), load=store.get)
+    assert results[0]['title'] == '바뀐 상품'
+    frontier.close()
+
+
+def test_canonical_url_merges_same_product(db_path):
+    frontier = CrawlFrontier(db_path)
+    assert frontier.enqueue([URLS[0], "https://SSADAGU.kr/shop/view.php?num_iid=1&platform=taobao&ss_tx=x"]) == 1
+    assert frontier.stats(stage='detail') == {QUEUED: 1}
+    frontier.close()
+    frontier.close()
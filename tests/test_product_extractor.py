@@ -0,0 +1,95 @@
+import pytest
+
+from product_extractor import (
+    NO_TITLE, PRICE_SELECTORS, TITLE_SELECTORS, element_price, element_title, extract_product_fields,
+    find_title_element,
+)
+from product_parser import available_backends, make_soup
+from selector_planner import first_hit
+
+BASE_URL = "https://ssadagu.kr"
+
+PRODUCT_PAGE = """<!DOCTYPE html>
+<html><head><title>싸다구 - 은 반지</title><script>var x = "<h1>가짜</h1>";</script></head>
+<body>
+<h1 id="kakaotitle">  은 반지 &amp; 케이스 </h1>
+<div class="pdt_price"><span class="price gsItemPriceKWR">12,900원</span></div>
+<a class="start" href="#"><img src="/img/icon_star.svg"><img src="/img/icon_star.svg"><img src="/img/icon_star_half.svg"><img src="/img/icon_star_empty.svg"></a>
+<ul id="skubox">
+  <li class="imgWrapper on"><a title=" 실버 " href="#"><img class="colorSpec_hashPic" src="https://img/silver.jpg"></a><span>재고 : 12</span></li>
+  <li class="imgWrapper"><a title="골드" href="#">골드</a><span>품절</span></li>
+  <li class="imgWrapper"><a href="#">제목 없는 옵션</a></li>
+  <li class="other"><a title="무시" href="#"></a></li>
+</ul>
+<div class="pro-info-item"><div class="pro-info-title">소재</div><div class="pro-info-info"> 은 925 </div></div>
+<div class="pro-info-item"><div class="pro-info-title">원산지</div></div>
+<img id="img_translate_0" src="//cdn/a.jpg">
+<img id="img_translate_1" src="/data/b.jpg">
+<img id="img_translate_2" src="https://cdn/c.jpg">
+<img id="img_translate_3" src="data:image/png;base64,AAAA">
+<img id="img_translate_x" src="https://cdn/skip.jpg">
+</body></html>
+"""
+
+FALLBACK_PAGE = """<html><head><title>대체 제목</title></head><body>
+<div class="item-name">상품명</div><span class="price">3,000원</span></body></html>"""
+
+
+def soup_title_and_price(soup):
+    title = first_hit(TITLE_SELECTORS, lambda selector: element_title(find_title_element(soup, selector))) or NO_TITLE
+    price = first_hit(PRICE_SELECTORS, lambda selector: element_price(soup.select_one(selector))) or 0
+    return title, price
+
+
+def test_single_pass_fields():
+    fields = extract_product_fields(PRODUCT_PAGE, BASE_URL)
+    assert fields == {
+        'kakaotitle': '은 반지 & 케이스',
+        'title': '은 반지 & 케이스',
+        'price': 12900,
+        'rating': 2.5,
+        'options': [
+            {'name': '실버', 'stock': 12, 'image_url': 'https://img/silver.jpg'},
+            {'name': '골드', 'stock': 0, 'image_url': ''},
+        ],
+        'material_info': {'소재': '은 925'},
+        'product_images': ['https://cdn/a.jpg', 'https://ssadagu.kr/data/b.jpg', 'https://cdn/c.jpg'],
+    }
+
+
+def test_kakaotitle_only_skips_fallback_titles():
+    assert extract_product_fields(FALLBACK_PAGE, BASE_URL)['title'] == '대체 제목'
+    fields = extract_product_fields(FALLBACK_PAGE, BASE_URL, kakaotitle_only=True)
+    assert fields['kakaotitle'] is None
+    assert fields['title'] == NO_TITLE
+    assert fields['price'] == 3000
+
+
+def test_bytes_markup_is_decoded():
+    assert extract_product_fields(PRODUCT_PAGE.encode('utf-8'), BASE_URL) == extract_product_fields(PRODUCT_PAGE, BASE_URL)
+
+
+@pytest.mark.parametrize('backend', available_backends())
+@pytest.mark.parametrize('page', [PRODUCT_PAGE, FALLBACK_PAGE])
+def test_title_and_price_match_soup_selectors(backend, page):
+    fields = extract_product_fields(page, BASE_URL)
+    assert (fields['title'], fields['price']) == soup_title_and_price(make_soup(page, backend))
+
+
+@pytest.mark.parametrize('page', [PRODUCT_PAGE, FALLBACK_PAGE])
+def test_single_pass_matches_crawler_soup_extraction(page):
+    pytest.importorskip('selenium')
+    from crawler import SSADAGUCrawler
+    from selector_planner import SelectorRegistry
+
+    # 브라우저 없이 BeautifulSoup 추출 메서드만 쓰도록 __init__ 을 건너뜀
+    crawler = SSADAGUCrawler.__new__(SSADAGUCrawler)
+    crawler.base_url = BASE_URL
+    crawler.selectors = SelectorRegistry()
+    url = BASE_URL + "/shop/view.php?platform=taobao&num_iid=1"
+
+    expected = crawler.extract_product_data(make_soup(page), url)
+    fields = extract_product_fields(page, BASE_URL)
+    actual = crawler.product_data_from_fields(url, fields)
+    actual['crawled_at'] = expected['crawled_at']
+    assert actual == expected
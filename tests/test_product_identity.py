@@ -0,0 +1,73 @@
+import time
+
+from product_identity import BloomFilter, SeenProducts, dedupe_product_urls, product_key, product_url
+from ssadagu_search import DEFAULT_PLATFORM
+
+
+def test_product_key_ignores_tracking_params_and_host():
+    assert product_key("https://ssadagu.kr/shop/view.php?platform=taobao&num_iid=123&ss_tx=반지") == ('taobao', '123')
+    assert product_key("http://WWW.ssadagu.kr/shop/view.php?num_iid=123&platform=taobao") == ('taobao', '123')
+
+
+def test_product_key_defaults_platform_and_requires_num_iid():
+    assert product_key("https://ssadagu.kr/shop/view.php?num_iid=7") == (DEFAULT_PLATFORM, '7')
+    assert product_key("https://ssadagu.kr/shop/search.php?ss_tx=반지") is None
+
+
+def test_product_url_round_trip():
+    key = ('1688', '42')
+    assert product_key(product_url(key)) == key
+
+
+def test_dedupe_product_urls_keeps_first():
+    urls = [
+        "https://ssadagu.kr/shop/view.php?platform=taobao&num_iid=1",
+        "https://ssadagu.kr/shop/view.php?num_iid=1&platform=taobao&ss_tx=x",
+        "https://ssadagu.kr/shop/view.php?platform=taobao&num_iid=2",
+    ]
+    assert dedupe_product_urls(urls) == [urls[0], urls[2]]
+
+
+def test_bloom_filter_save_load_round_trip(tmp_path):
+    path = str(tmp_path / 'seen.bloom')
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    items = [f"taobao:{n}" for n in range(100)]
+    for item in items:
+        bloom.add(item)
+    bloom.save(path, tag=100)
+
+    loaded = BloomFilter.load(path, tag=100)
+    assert loaded is not None
+    assert loaded.count == 100
+    assert loaded.bits == bloom.bits
+    assert all(item in loaded for item in items)
+
+
+def test_bloom_filter_load_rejects_other_tag_and_missing_file(tmp_path):
+    path = str(tmp_path / 'seen.bloom')
+    BloomFilter(capacity=1000).save(path, tag=1)
+    assert BloomFilter.load(path, tag=2) is None
+    assert BloomFilter.load(str(tmp_path / 'missing.bloom')) is None
+
+
+def test_seen_products_persist_across_runs(tmp_path):
+    path = str(tmp_path / 'seen.db')
+    url = "https://ssadagu.kr/shop/view.php?platform=taobao&num_iid=5"
+    seen = SeenProducts(path, capacity=1000)
+    assert not seen.is_fresh(url)
+    seen.mark(url)
+    seen.close()
+
+    seen = SeenProducts(path, capacity=1000)
+    assert seen.is_fresh(url + "&ss_tx=반지")
+    assert seen.unseen([url, url.replace('5', '6')]) == [url.replace('5', '6')]
+    seen.close()
+
+
+def test_seen_products_expire_after_max_age(tmp_path):
+    seen = SeenProducts(str(tmp_path / 'seen.db'), max_age=60, capacity=1000)
+    url = "https://ssadagu.kr/shop/view.php?platform=taobao&num_iid=5"
+    seen.mark(url, crawled_at=time.time() - 120)
+    assert seen.last_crawled(url) is not None
+    assert not seen.is_fresh(url)
+    seen.close()
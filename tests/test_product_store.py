@@ -0,0 +1,74 @@
+import pytest
+
+from product_store import ProductStore
+
+URL = "https://ssadagu.kr/shop/view.php?platform=taobao&num_iid=100"
+
+
+def make_product(url=URL, title="은 반지", price=12000, crawled_at="2026-10-01 12:00:00", **fields):
+    product = {
+        'url': url,
+        'title': title,
+        'price': price,
+        'rating': 4.5,
+        'options': [{'name': '실버', 'stock': 3, 'image_url': None}],
+        'material_info': {'소재': '은'},
+        'product_images': [],
+        'crawled_at': crawled_at,
+    }
+    product.update(fields)
+    return product
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ProductStore(str(tmp_path / 'products.db'))
+    yield store
+    store.close()
+
+
+def test_upsert_get_round_trip(store):
+    product = make_product(seller='가게')
+    assert store.upsert(product, keyword='반지') == ('taobao', '100')
+    assert store.get('100', 'taobao') == product
+    assert store.get(100, 'taobao') == product
+    assert store.get('101', 'taobao') is None
+
+
+def test_upsert_keeps_both_image_shapes(store):
+    images = [
+        {'original_url': 'https://img/1.jpg', 'translated_text': '번역'},
+        'https://img/2.jpg',
+    ]
+    store.upsert(make_product(product_images=images))
+    assert store.get('100', 'taobao')['product_images'] == images
+
+
+def test_upsert_overwrites_and_replaces_children(store):
+    store.upsert(make_product())
+    store.upsert(make_product(title="금 반지", options=[]))
+    product = store.get('100', 'taobao')
+    assert product['title'] == "금 반지"
+    assert product['options'] == []
+    assert len(store) == 1
+
+
+def test_upsert_without_num_iid_is_skipped(store):
+    assert store.upsert({'url': "https://ssadagu.kr/shop/search.php?ss_tx=x"}) is None
+    assert len(store) == 0
+
+
+def test_find_by_keyword_price_and_time(store):
+    store.upsert_many([
+        make_product(),
+        make_product(url=URL.replace('100', '200'), price=30000, crawled_at="2026-10-02 09:00:00"),
+    ], keyword='반지')
+    store.upsert(make_product(url=URL.replace('100', '300'), price=5000, crawled_at="2026-10-01 08:00:00"),
+                 keyword='목걸이')
+    store.add_keyword(('taobao', '300'), '반지')
+
+    assert [p['price'] for p in store.find(keyword='반지')] == [30000, 12000, 5000]
+    assert [p['price'] for p in store.find(keyword='목걸이')] == [5000]
+    assert [p['price'] for p in store.find(min_price=10000, max_price=20000)] == [12000]
+    assert [p['price'] for p in store.find(since="2026-10-02")] == [30000]
+    assert len(store.find(limit=2)) == 2
@@ -0,0 +1,92 @@
+import pytest
+import requests
+
+from rate_limit import AdaptiveLimiter, HostLimiters, TokenBucket
+
+
+class FakeResponse:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+def test_token_bucket_try_acquire_empties_capacity():
+    bucket = TokenBucket(rate=1, capacity=2)
+    assert bucket.try_acquire()
+    assert bucket.try_acquire()
+    assert not bucket.try_acquire()
+
+
+def test_token_bucket_rejects_non_positive_rate():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+
+
+def test_successes_raise_limit_when_saturated():
+    limiter = AdaptiveLimiter('host', initial=1, max_limit=4)
+    for _ in range(3):
+        with limiter.slot() as slot:
+            slot.status = 200
+    assert limiter.limit > 1
+    assert limiter.overloads == 0
+
+
+def test_overload_status_halves_limit():
+    limiter = AdaptiveLimiter('host', initial=8)
+    with limiter.slot() as slot:
+        slot.status = 429
+    assert limiter.limit == 4
+    assert limiter.overloads == 1
+
+
+def test_retry_after_pauses_limiter():
+    limiter = AdaptiveLimiter('host', initial=1, max_backoff=5)
+    with limiter.slot() as slot:
+        slot.response = FakeResponse(503, {'Retry-After': '2'})
+    assert limiter.overloads == 1
+    assert limiter._paused_until - limiter._last_decrease == pytest.approx(2)
+
+
+class PageStatus(Exception):
+    """page_ready.PageStatusError 처럼 상태 코드를 적은 뒤 던지는 예외"""
+
+
+@pytest.mark.parametrize('status, limit, overloads', [
+    (404, 8, 0),   # 4xx 페이지는 과부하가 아님
+    (429, 4, 1),
+    (503, 4, 1),
+    (None, 4, 1),  # 상태 코드 없이 실패 (Selenium 타임아웃 등)
+])
+def test_exception_in_slot_uses_recorded_status(status, limit, overloads):
+    limiter = AdaptiveLimiter('host', initial=8)
+    with pytest.raises(PageStatus):
+        with limiter.slot() as slot:
+            slot.status = status
+            raise PageStatus()
+    assert limiter.limit == limit
+    assert limiter.overloads == overloads
+
+
+def test_requests_error_without_response_is_overload():
+    limiter = AdaptiveLimiter('host', initial=8)
+    with pytest.raises(requests.exceptions.ConnectionError):
+        with limiter.slot():
+            raise requests.exceptions.ConnectionError()
+    assert limiter.overloads == 1
+
+
+def test_requests_http_error_uses_response_status():
+    limiter = AdaptiveLimiter('host', initial=8)
+    with pytest.raises(requests.exceptions.HTTPError):
+        with limiter.slot():
+            raise requests.exceptions.HTTPError(response=FakeResponse(404))
+    assert limiter.limit == 8
+    assert limiter.overloads == 0
+
+
+def test_host_limiters_share_limiter_per_host():
+    limiters = HostLimiters(initial=3)
+    first = limiters.limiter('https://Example.com/a')
+    assert limiters.limiter('https://example.com/b') is first
+    assert limiters.limiter('https://other.com/') is not first
+    assert first.stats()['limit'] == 3
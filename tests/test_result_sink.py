@@ -0,0 +1,66 @@
+import gzip
+import os
+
+import pytest
+
+from result_sink import JsonlSink, read_jsonl
+
+RECORDS = [{'title': f"상품 {n}", 'price': n * 1000, 'options': [{'name': '기본', 'stock': n}]} for n in range(5)]
+
+
+@pytest.mark.parametrize('name', ['results.jsonl', 'results.jsonl.gz'])
+def test_round_trip(tmp_path, name):
+    path = str(tmp_path / name)
+    with JsonlSink(path, batch_size=2) as sink:
+        for record in RECORDS:
+            sink.write(record)
+    assert sink.written == len(RECORDS)
+    assert list(read_jsonl(path)) == RECORDS
+
+
+def test_gzip_output_is_plain_gzip(tmp_path):
+    path = str(tmp_path / 'results.jsonl.gz')
+    with JsonlSink(path) as sink:
+        sink.write(RECORDS[0])
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        assert f.read().count('\n') == 1
+
+
+def test_unclosed_gzip_file_keeps_flushed_lines(tmp_path):
+    path = str(tmp_path / 'results.jsonl.gz')
+    sink = JsonlSink(path, batch_size=1)
+    for record in RECORDS:
+        sink.write(record)
+    # close() 전에 죽은 것처럼 gzip 끝(trailer) 없이 읽기
+    assert list(read_jsonl(path)) == RECORDS
+    sink.close()
+
+
+def test_truncated_gzip_file_stops_at_last_complete_line(tmp_path, capsys):
+    path = str(tmp_path / 'results.jsonl.gz')
+    with JsonlSink(path, batch_size=1) as sink:
+        for record in RECORDS:
+            sink.write(record)
+    size = os.path.getsize(path)
+    with open(path, 'r+b') as f:
+        f.truncate(size - 30)
+
+    records = list(read_jsonl(path))
+    assert 0 < len(records) < len(RECORDS)
+    assert records == RECORDS[:len(records)]
+    assert '잘려' in capsys.readouterr().out
+
+
+def test_partial_last_line_is_skipped(tmp_path, capsys):
+    path = str(tmp_path / 'results.jsonl')
+    with JsonlSink(path) as sink:
+        sink.write(RECORDS[0])
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write('{"title": "잘린')
+    assert list(read_jsonl(path)) == RECORDS[:1]
+    assert '건너뜁니다' in capsys.readouterr().out
+
+
+def test_unknown_compression_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        JsonlSink(str(tmp_path / 'results.jsonl'), compression='bz2')
@@ -0,0 +1,79 @@
+import pytest
+
+import ssadagu_search
+from ssadagu_search import parse_product_html, parse_product_list, product_view_url
+
+
+def fragment(gs_id, title, price='12,000원', href=None, extra_class=''):
+    href = href or f"/shop/view.php?platform=taobao&num_iid={gs_id}"
+    price_html = f'<span class="product_price {extra_class}">{price}</span>' if price is not None else ''
+    return (
+        f'<li data-gs-id="{gs_id}" data-title="{title}" data-img-url="https://img/{gs_id}.jpg">'
+        f'<div class="product_image"><a href="{href}"><img src="https://img/{gs_id}.jpg"></a></div>'
+        f'<div class="info">{price_html}</div></li>'
+    )
+
+
+FRAGMENTS = [
+    fragment(1, '은 반지'),
+    fragment(2, '목걸이 &amp; 귀걸이', price=' 3,500 원', extra_class='sale'),
+    fragment(3, '가격 없음', price=None),
+    '<div class="empty">상품 없음</div>',
+    '<li data-title="링크 없음"><span class="product_price">100원</span></li>',
+]
+
+
+def test_lxml_and_beautifulsoup_parsers_match():
+    pytest.importorskip('lxml')
+    fast = parse_product_list(FRAGMENTS, fast=True)
+    slow = parse_product_list(FRAGMENTS, fast=False)
+    assert fast == slow
+    assert [product['gs_id'] for product in fast] == ['1', '2', '3', 'N/A']
+
+
+def test_parse_product_html_fields():
+    product = parse_product_html(FRAGMENTS[1])
+    assert product == {
+        'gs_id': '2',
+        'title': '목걸이 & 귀걸이',
+        'price': '3,500',
+        'url': '/shop/view.php?platform=taobao&num_iid=2',
+        'image_url': 'https://img/2.jpg',
+    }
+    assert parse_product_html(FRAGMENTS[3]) is None
+
+
+def test_broken_fragment_falls_back_to_beautifulsoup():
+    pytest.importorskip('lxml')
+    fragments = [fragment(1, '반지'), '<li data-gs-id="2" data-title="닫히지 않음"><div class="product_image">']
+    assert parse_product_list(fragments) == parse_product_list(fragments, fast=False)
+
+
+def test_product_view_url_uses_link_then_gs_id():
+    assert product_view_url({'url': '/shop/view.php?platform=taobao&num_iid=7&ss_tx=x'}) == \
+        "https://ssadagu.kr/shop/view.php?platform=taobao&num_iid=7"
+    assert product_view_url({'url': 'N/A', 'gs_id': '8'}) == \
+        f"https://ssadagu.kr/shop/view.php?platform={ssadagu_search.DEFAULT_PLATFORM}&num_iid=8"
+    assert product_view_url({'url': 'N/A', 'gs_id': 'N/A'}) is None
+
+
+def test_iter_search_products_stops_at_empty_page(monkeypatch):
+    pages = {1: [FRAGMENTS[0], FRAGMENTS[1]], 2: [fragment(1, '은 반지')], 3: []}
+    requested = []
+
+    def fake_request(search_term, page=1, session=None, **options):
+        requested.append(page)
+        return {'success': True, 'data': pages[page]}
+
+    monkeypatch.setattr(ssadagu_search, 'request_search_page', fake_request)
+    products = list(ssadagu_search.iter_search_products('반지', prefetch=False))
+    assert [(product['gs_id'], product['page']) for product in products] == [('1', 1), ('2', 1), ('1', 2)]
+    assert requested == [1, 2, 3]
+
+    requested.clear()
+    urls = ssadagu_search.search_product_urls('반지', max_pages=2)
+    assert urls == [
+        "https://ssadagu.kr/shop/view.php?platform=taobao&num_iid=1",
+        "https://ssadagu.kr/shop/view.php?platform=taobao&num_iid=2",
+    ]
+    assert requested == [1, 2]